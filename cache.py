@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# CreateDate: 2025-10-30
+"""
+排盘结果的缓存，都记录命中、未命中、淘汰次数：
+
+LRUCache     进程内，按条目数和估算的内存占用两个上限淘汰最久未用的条目。
+             线程安全，可在 Streamlit 等多线程环境共用一个实例。
+SQLiteCache  SQLite 文件（WAL 模式），多个进程同时读写，重启、重新部署后仍然有效。
+"""
+
+import collections
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+
+def approx_size(obj):
+    """对象大致占用的字节数：递归累加 str/bytes/tuple/list/dict/set 及其元素。"""
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (tuple, list, set, frozenset)):
+            stack.extend(item)
+        elif hasattr(item, '__slots__'):
+            stack.extend(getattr(item, name) for name in item.__slots__ if hasattr(item, name))
+    return total
+
+
+class LRUCache:
+    """maxsize 为最多条目数，max_bytes 为内存上限（按 sizeof 估算，默认 approx_size）；
+    为 None 时不限。"""
+
+    def __init__(self, maxsize=1024, max_bytes=None, sizeof=approx_size):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+        self._items = collections.OrderedDict()    # 键 -> (值, 字节数)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def peek(self, key, default=None):
+        """取值但不计数、不调整顺序。"""
+        item = self._items.get(key)
+        return default if item is None else item[0]
+
+    def put(self, key, value):
+        """存入或更新条目（重新估算大小）；单个条目超过内存上限时不缓存。"""
+        size = self.sizeof(value)
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            self._items[key] = (value, size)
+            self.bytes += size
+            while self._items and ((self.maxsize is not None and len(self._items) > self.maxsize)
+                                   or (self.max_bytes is not None and self.bytes > self.max_bytes)):
+                key, (value, size) = self._items.popitem(last=False)
+                self.bytes -= size
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.bytes = 0
+
+    def as_dict(self):
+        return {
+            "entries": len(self._items),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class SQLiteCache:
+    """SQLite 文件里的 键 -> bytes 缓存，可供多个进程、多次启动共用。
+
+    使用 WAL 模式，读写互不阻塞；每个线程各用一个连接。每条记录带 version，
+    与当前 version 不同的记录视为不存在并优先淘汰，因此规则或数据改动后自动失效。
+    max_bytes 为数据库已用页（不含空闲页）的大小上限，超出时先删旧版本的记录，再按最近使用时间淘汰，
+    删到上限的 90%；已用页数取自 PRAGMA，不必逐条累加，也包含其他进程写入的记录。
+    最近使用时间至多每 touch 秒更新一次。
+    数据库出错时（如磁盘已满、文件损坏）读取视为未命中，写入忽略。
+    """
+
+    def __init__(self, path, version, max_bytes=256 * 2**20, touch=60):
+        self.path = path
+        self.version = version
+        self.max_bytes = max_bytes
+        self.touch = touch
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.errors = 0
+        self._local = threading.local()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+    def _connect(self):
+        db = getattr(self._local, 'db', None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=10)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('PRAGMA synchronous=NORMAL')
+            db.execute('CREATE TABLE IF NOT EXISTS cache ('
+                       'key TEXT PRIMARY KEY, version TEXT NOT NULL, value BLOB NOT NULL, '
+                       'size INTEGER NOT NULL, used REAL NOT NULL)')
+            db.execute('CREATE INDEX IF NOT EXISTS cache_used ON cache (used)')
+            self._local.db = db
+        return db
+
+    def get(self, key, default=None):
+        try:
+            db = self._connect()
+            row = db.execute('SELECT value, used FROM cache WHERE key = ? AND version = ?',
+                             (key, self.version)).fetchone()
+            if row is None:
+                self.misses += 1
+                return default
+            now = time.time()
+            if row[1] < now - self.touch:
+                with db:
+                    db.execute('UPDATE cache SET used = ? WHERE key = ?', (now, key))
+        except sqlite3.Error:
+            self.errors += 1
+            return default
+        self.hits += 1
+        return row[0]
+
+    def put(self, key, value):
+        try:
+            db = self._connect()
+            with db:
+                db.execute('INSERT OR REPLACE INTO cache (key, version, value, size, used) VALUES (?, ?, ?, ?, ?)',
+                           (key, self.version, value, len(value), time.time()))
+            self._evict(db)
+        except sqlite3.Error:
+            self.errors += 1
+
+    @staticmethod
+    def _used_bytes(db):
+        """数据库已用页的字节数（总页数减空闲页数）。"""
+        page_size, pages, free = (db.execute('PRAGMA ' + name).fetchone()[0]
+                                  for name in ('page_size', 'page_count', 'freelist_count'))
+        return (pages - free) * page_size
+
+    def _evict(self, db):
+        excess = self._used_bytes(db) - self.max_bytes
+        if excess <= 0:
+            return
+        # 多删一成，免得此后每次写入都要淘汰；旧版本的记录排在最前，其余按最近使用时间
+        excess += self.max_bytes // 10
+        with db:
+            doomed = []
+            for key, size in db.execute('SELECT key, size FROM cache ORDER BY version = ?, used', (self.version,)):
+                if excess <= 0:
+                    break
+                doomed.append((key,))
+                excess -= size
+            db.executemany('DELETE FROM cache WHERE key = ?', doomed)
+        self.evictions += len(doomed)
+
+    def clear(self):
+        try:
+            with self._connect() as db:
+                db.execute('DELETE FROM cache')
+        except sqlite3.Error:
+            self.errors += 1
+
+    def as_dict(self):
+        return {
+            "path": self.path,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "errors": self.errors,
+        }
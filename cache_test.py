@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+核对 SQLiteCache：版本（bazi.data_version）变化后旧记录失效，超过上限时淘汰最久未用的记录，
+多个进程同时读写同一文件时不出错、不读到别的键的值。
+
+python cache_test.py 或 python -m pytest -q cache_test.py
+"""
+
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+sys.path.append('.')
+
+import bazi
+from cache import SQLiteCache
+
+
+def test_version_invalidates():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'cache.db')
+        SQLiteCache(path, 'v1').put('key', b'value')
+        assert SQLiteCache(path, 'v1').get('key') == b'value'
+        newer = SQLiteCache(path, 'v2')
+        assert newer.get('key') is None and newer.misses == 1
+        newer.put('key', b'other')
+        assert SQLiteCache(path, 'v2').get('key') == b'other'
+        assert SQLiteCache(path, 'v1').get('key') is None
+
+
+def test_data_version_invalidates_charts():
+    """规则、数据文件改动后 data_version 随之变化，ChartCache 不再用 store 中按旧版本存的命盘。"""
+    saved = bazi._VERSION_FILES, bazi._data_version
+    with tempfile.TemporaryDirectory() as tmp:
+        rules = os.path.join(tmp, 'rules.py')
+        path = os.path.join(tmp, 'cache.db')
+        chart = bazi.Chart.from_date(1990, 6, 7, 12, gregorian=True)
+        try:
+            # os.path.join 遇到绝对路径时取该路径，data_version 改为只读这个文件
+            bazi._VERSION_FILES = (rules,)
+            with open(rules, 'w') as f:
+                f.write('RULES = 1\n')
+            bazi._data_version = None
+            old = bazi.data_version()
+            bazi.BaziEngine(cache=bazi.ChartCache(store=SQLiteCache(path, old))).report(chart)
+
+            store = SQLiteCache(path, old)
+            bazi.ChartCache(store=store).entry(chart)
+            assert store.hits == 1
+
+            with open(rules, 'w') as f:
+                f.write('RULES = 2\n')
+            bazi._data_version = None
+            new = bazi.data_version()
+            assert new != old
+            store = SQLiteCache(path, new)
+            assert bazi.ChartCache(store=store).entry(chart).result is None
+            assert (store.hits, store.misses) == (0, 1)
+        finally:
+            bazi._VERSION_FILES, bazi._data_version = saved
+
+
+def test_cache_db_per_call():
+    """--cache-db 只在这一次排盘中作为持久缓存，共用的 CHART_CACHE.store 不变。"""
+    saved = bazi.CHART_CACHE.store
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'cache.db')
+        first, second = ['1931', '5', '17', '9', '-g'], ['1931', '5', '18', '9', '-g']
+        bazi.run(first + ['--cache-db', path])
+        assert bazi.CHART_CACHE.store is saved
+        # 之后不带 --cache-db 的排盘不写入该文件
+        bazi.run(second)
+        store = bazi.open_cache_db(path)
+        assert store.get(bazi.chart_from_options(bazi.parse_options(first)).key) is not None
+        assert store.get(bazi.chart_from_options(bazi.parse_options(second)).key) is None
+
+
+def test_evict():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'cache.db')
+        store = SQLiteCache(path, 'v1', max_bytes=256 * 1024, touch=0)
+        SQLiteCache(path, 'v0').put('old', os.urandom(16 * 1024))
+        for index in range(200):
+            store.put('key{}'.format(index), os.urandom(8 * 1024))
+        assert store.evictions > 0 and store.errors == 0
+        assert store._used_bytes(store._connect()) <= store.max_bytes
+        # 旧版本的记录先删，最近写入的都还在
+        assert SQLiteCache(path, 'v0').get('old') is None
+        assert all(store.get('key{}'.format(index)) is not None for index in range(190, 200))
+
+
+def _worker(args):
+    path, seed = args
+    store = SQLiteCache(path, 'v1', max_bytes=512 * 1024, touch=0)
+    rng = random.Random(seed)
+    wrong = 0
+    for _ in range(300):
+        key = 'key{}'.format(rng.randrange(100))
+        if rng.random() < 0.5:
+            store.put(key, key.encode() * rng.randint(1, 400))
+        else:
+            value = store.get(key)
+            if value is not None and value != key.encode() * (len(value) // len(key)):
+                wrong += 1
+    return wrong, store.errors
+
+
+def test_processes():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'cache.db')
+        with multiprocessing.get_context('spawn').Pool(4) as pool:
+            results = pool.map(_worker, [(path, seed) for seed in range(4)])
+        assert results == [(0, 0)] * 4, results
+        store = SQLiteCache(path, 'v1')
+        assert store._used_bytes(store._connect()) <= 512 * 1024 + 64 * 1024
+
+
+if __name__ == '__main__':
+    test_version_invalidates()
+    test_data_version_invalidates_charts()
+    test_cache_db_per_call()
+    test_evict()
+    test_processes()
+    print("OK")
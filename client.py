@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# CreateDate: 2025-10-30
+"""
+排盘常驻进程（见 server）的客户端，参数与 bazi.py 相同，另加 --socket PATH：
+
+    python client.py [--socket PATH] 1990 6 7 12 -g
+    python client.py -b 庚午 壬午 癸卯 壬子 --format json
+    python client.py --batch FILE
+
+不 import bazi，启动只需解释器本身；连不上常驻进程时退回在本进程内排盘（同 python bazi.py ...）。
+--batch 时逐行发送，按 bazi.py --batch 的格式输出 ndjson。
+其他脚本可直接调用 request(args)，得到与 bazi.run(args) 相同的文本。
+"""
+
+import json
+import os
+import shlex
+import socket
+import sys
+import tempfile
+
+SOCKET_ENV = 'BAZI_SOCKET'
+
+
+class ServerError(Exception):
+    """常驻进程返回的错误，如参数有误。"""
+
+
+def socket_path():
+    return os.environ.get(SOCKET_ENV) or os.path.join(tempfile.gettempdir(), 'bazi.sock')
+
+
+class Connection:
+    """到常驻进程的一个连接，可连续发多个请求；连不上时抛出 OSError。"""
+
+    def __init__(self, path=None, timeout=None):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        try:
+            self.sock.connect(socket_path() if path is None else path)
+        except OSError:
+            self.sock.close()
+            raise
+        self.rfile = self.sock.makefile('rb')
+        self.count = 0
+
+    def request(self, args):
+        """发一个请求（bazi.py 的命令行参数列表），返回输出文本。"""
+        self.count += 1
+        line = json.dumps({"id": self.count, "args": list(args)}, ensure_ascii=False)
+        self.sock.sendall(line.encode('utf-8') + b'\n')
+        reply = self.rfile.readline()
+        if not reply:
+            raise ConnectionError("server closed the connection")
+        reply = json.loads(reply)
+        if "error" in reply:
+            raise ServerError(reply["error"])
+        return reply["output"]
+
+    def close(self):
+        self.rfile.close()
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def request(args, path=None, timeout=None):
+    """单个请求：连接、发送、返回输出文本。"""
+    with Connection(path, timeout) as conn:
+        return conn.request(args)
+
+
+def _split(argv):
+    """从参数中取出 --socket PATH（或 --socket=PATH），其余原样交给 bazi.py。"""
+    path = None
+    rest = []
+    items = iter(argv)
+    for item in items:
+        if item == '--socket':
+            path = next(items, None)
+        elif item.startswith('--socket='):
+            path = item.split('=', 1)[1]
+        else:
+            rest.append(item)
+    return path, rest
+
+
+def _batch(conn, name):
+    lines = sys.stdin if name == '-' else open(name, encoding='utf-8')
+    with lines:
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            args = shlex.split(line)
+            try:
+                sys.stdout.write(conn.request(args + ['--format', 'ndjson']))
+            except ServerError as e:
+                sys.stdout.write(json.dumps({"args": args, "error": str(e)}, ensure_ascii=False) + '\n')
+            sys.stdout.flush()
+
+
+def main(argv=None):
+    path, args = _split(sys.argv[1:] if argv is None else argv)
+    try:
+        conn = Connection(path)
+    except OSError:
+        # 常驻进程没有启动：在本进程内排盘
+        import bazi
+        return bazi.main(args)
+    with conn:
+        if '--batch' in args[:-1]:
+            return _batch(conn, args[args.index('--batch') + 1])
+        try:
+            sys.stdout.write(conn.request(args))
+        except ServerError as e:
+            sys.stderr.write("bazi: error: {}\n".format(e))
+            return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -11,7 +11,6 @@ from bidict import bidict
 
 from datas import *
 from ganzhi import *
-from sizi import summarys
 
 def check_gan(gan, gans):
     result = ''
@@ -22,19 +21,19 @@ def check_gan(gan, gans):
     return result
 
 def yinyang(item):
-    if item in Gan:
-        return '＋' if Gan.index(item)%2 == 0 else '－'
+    if item in gan_ids:
+        return '＋' if gan_ids[item]%2 == 0 else '－'
     else:
-        return '＋' if Zhi.index(item)%2 == 0 else '－'
+        return '＋' if zhi_ids[item]%2 == 0 else '－'
     
-def yinyangs(zhis):
+def yinyangs(zhis, out=print):
     result = []
     for item in zhis:
         result.append(yinyang(item))
     if set(result) == set('＋'):
-        print("四柱全阳")
+        out("四柱全阳")
     if set(result) == set('－'):
-        print("四柱全阴")
+        out("四柱全阴")
     
     
     
@@ -59,4 +58,22 @@ def check_gong(zhis, n1, n2, me, hes, desc='三合拱'):
         if gong not in zhis:
             result += "\t{}：{}{}-{}[{}]".format(
                 desc, zhis[n1], zhis[n2], gong, get_zhi_detail(gong, me))
-    return result
\ No newline at end of file
+    return result
+
+def jin_jiao(first, second):
+    return True if zhi_ids[second] - zhi_ids[first] == 1 else False
+
+def is_ku(zhi):
+    return True if zhi in "辰戌丑未" else False  
+
+def zhi_ku(zhi, items):
+    return True if is_ku(zhi) and min(zhi5[zhi], key=zhi5[zhi].get) in items else False
+
+def is_yang(me):
+    return True if gan_ids[me] % 2 == 0 else False
+
+def not_yang(me):
+    return False if gan_ids[me] % 2 == 0 else True
+
+def gan_ke(gan1, gan2):
+    return True if ten_deities[gan1]['克'] == ten_deities[gan2]['本'] or ten_deities[gan2]['克'] == ten_deities[gan1]['本'] else False
@@ -3,7 +3,8 @@
 # CreateDate: 2025-10-30
 
 import argparse
-import subprocess
+
+import client
 
 description = '''
 '''
@@ -21,4 +22,9 @@ for item in zip(options.gans, options.zhis):
 
 #subprocess.call("cls", shell=True)
 print(result)
-print(subprocess.check_output("python bazi.py -b " + result, shell=True).decode('gbk'))
+# 有常驻进程（python bazi.py serve）时经 socket 排盘，否则在本进程内排盘
+try:
+    print(client.request(['-b'] + result.split()))
+except OSError:
+    import bazi
+    bazi.main(['-b'] + result.split())
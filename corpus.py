@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# CreateDate: 2025-10-30
+"""
+断语文本库（三命通会、穷通宝鉴、日柱详解、六十日口诀、时辰吉凶、日主、命宫、干支特点等）按键懒加载。
+
+文本仍以 dict 字面量写在各自的 .py 文件里，便于编辑，但排盘时不 import 这些文件：
+第一次访问时只扫描一遍源码，记下每个键的值在文件中的字节区间；取某个键时
+才读出这一段源码求值，结果缓存。一张命盘每个文库只取一两条，其余条目既不解析
+也不常驻内存。值里引用的模块级名字（如 yue.py 的 f-string 引用 jia12）按需同样求值。
+
+部署时可先打包：python corpus.py [--output FILE]，把全部文库写成一个二进制文件
+（默认本目录的 corpus.pack，可用环境变量 BAZI_CORPUS 指定）：
+    b'BZCORPUS' | 版本 u32 | 索引长度 u32 | zlib 压缩的 JSON 索引 | 各条目的 zlib 块
+索引记录各源文件的 sha1 和每个键的 (偏移, 长度, 是否为字面量)。文件以 mmap 只读打开，取值只解压
+对应的一块（偏移从索引之后算起），多个进程共享同一份页缓存。源文件改动后 sha1 不符，对应文库自动退回读源码。
+"""
+
+import collections.abc
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+import zlib
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+# 文库名 -> 源文件
+CORPORA = {
+    'summarys': 'sizi.py',                  # 三命通会
+    'months': 'yue.py',                     # 穷通宝鉴
+    'day_pillar_detail': 'rizhu.py',        # 日柱详解
+    'days60': 'koujue.py',                  # 六十日用法口诀
+    'chens': 'koujue.py',                   # 十二时辰出生吉凶
+    'rizhus': 'duanyu.py',                  # 日主坐支
+    'minggongs': 'duanyu.py',               # 命宫
+    'gan_desc': 'duanyu.py',                # 天干特点
+    'zhi_desc': 'duanyu.py',                # 地支特点
+    'gan_health': 'duanyu.py',              # 五行养生
+}
+
+STORE_ENV = 'BAZI_CORPUS'
+_MAGIC = b'BZCORPUS'
+_VERSION = 1
+_HEADER = struct.Struct('<8sII')
+
+# 源码扫描只需区分：字符串字面量（含三引号、前缀）、注释、括号、逗号冒号、换行
+_TOKEN_RE = re.compile(rb"""
+    (?P<str>[rRbBuUfF]{0,2}(?:'''[^'\\]*(?:(?:\\[\s\S]|'(?!''))[^'\\]*)*'''
+                             |\"\"\"[^"\\]*(?:(?:\\[\s\S]|"(?!""))[^"\\]*)*\"\"\"
+                             |'(?:\\.|[^'\\\n])*'|"(?:\\.|[^"\\\n])*"))
+  | (?P<comment>\#[^\n]*)
+  | (?P<open>[\[{(])
+  | (?P<close>[\]})])
+  | (?P<punct>[,:])
+  | (?P<nl>\n)
+""", re.VERBOSE)
+
+
+def _assignment(data, name):
+    """模块级 `name = ...` 右侧表达式的起始字节位置。"""
+    m = re.search(rb'^' + re.escape(name.encode()) + rb'\s*=\s*', data, re.M)
+    if m is None:
+        raise KeyError(name)
+    return m.end()
+
+
+def _statement_end(data, pos):
+    """从 pos 开始的表达式在第 0 层换行处结束。"""
+    depth = 0
+    for m in _TOKEN_RE.finditer(data, pos):
+        kind = m.lastgroup
+        if kind == 'open':
+            depth += 1
+        elif kind == 'close':
+            depth -= 1
+        elif kind == 'nl' and depth == 0:
+            return m.start()
+    return len(data)
+
+
+def _dict_entries(data, pos):
+    """扫描从 pos 处 '{' 开始的 dict 字面量，返回 {键: (值起点, 值终点)}。"""
+    entries = {}
+    depth = 0
+    key = start = None
+    last = None
+    for m in _TOKEN_RE.finditer(data, pos):
+        kind = m.lastgroup
+        if kind in ('comment', 'nl'):
+            continue
+        if kind == 'open':
+            depth += 1
+        elif kind == 'close':
+            depth -= 1
+            if depth == 0:
+                if key is not None:
+                    entries[key] = (start, m.start())
+                return entries
+        elif depth == 1 and kind == 'punct':
+            if m.group() == b':' and key is None and last is not None and last.lastgroup == 'str':
+                key = eval(last.group().decode('utf-8'), {'__builtins__': {}})
+                start = m.end()
+            elif m.group() == b',' and key is not None:
+                entries[key] = (start, m.start())
+                key = None
+        last = m
+    raise ValueError("unterminated dict literal")
+
+
+class _Names(dict):
+    """求值用的名字空间：缺的模块级名字从源码里按需求值。"""
+
+    def __init__(self, corpus):
+        super().__init__()
+        self.corpus = corpus
+
+    def __missing__(self, name):
+        value = self[name] = self.corpus._eval_name(name)
+        return value
+
+
+def _literal(text):
+    import ast      # 只有极少数条目需要，不在 import 时加载
+    return ast.literal_eval(text)
+
+
+def _sha1(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+class CorpusStore:
+    """打包文件的只读视图：按 (偏移, 长度) 解压单个条目。"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, size = _HEADER.unpack_from(self._map)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("not a corpus store: {}".format(path))
+        index = json.loads(zlib.decompress(self._map[_HEADER.size:_HEADER.size + size]))
+        self._base = _HEADER.size + size     # 偏移从索引之后算起
+        self.sources = index['sources']
+        self.corpora = index['corpora']
+        self._fresh = {}
+
+    def entries(self, filename, name):
+        """{键: (偏移, 长度, 是否为字面量)}；没有该文库或源文件已改动时返回 None。"""
+        if name not in self.corpora or filename not in self.sources:
+            return None
+        fresh = self._fresh.get(filename)
+        if fresh is None:
+            fresh = self._fresh[filename] = self.sources[filename] == _sha1(os.path.join(_HERE, filename))
+        if not fresh:
+            return None
+        return {key: tuple(entry) for key, *entry in self.corpora[name]}
+
+    def read(self, offset, length, literal=0):
+        start = self._base + offset
+        text = zlib.decompress(self._map[start:start + length]).decode('utf-8')
+        return _literal(text) if literal else text
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def store_path():
+    return os.environ.get(STORE_ENV) or os.path.join(_HERE, 'corpus.pack')
+
+
+def open_store():
+    """进程内共用的 CorpusStore；没有打包文件或文件无效时为 None。"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                try:
+                    _store = CorpusStore(store_path())
+                except (OSError, ValueError, struct.error, zlib.error):
+                    _store = False
+    return _store or None
+
+
+def build_store(path=None, corpora=CORPORA):
+    """读各源文件，把全部文库写成打包文件，返回文件名。"""
+    path = store_path() if path is None else path
+    blocks = []
+    offset = 0
+    index = {'sources': {}, 'corpora': {}}
+    for name, filename in corpora.items():
+        index['sources'][filename] = _sha1(os.path.join(_HERE, filename))
+        rows = index['corpora'][name] = []
+        source = LazyCorpus(filename, name, packed=False)
+        for key in source:
+            value = source[key]
+            # 个别条目不是 str（如 yue.py 里误带逗号的 tuple），存其 repr，读取时还原
+            literal = not isinstance(value, str)
+            text = repr(value) if literal else value
+            if literal and _literal(text) != value:
+                raise TypeError("{}[{!r}] cannot be packed".format(name, key))
+            block = zlib.compress(text.encode('utf-8'), 9)
+            rows.append((key, offset, len(block), int(literal)))
+            blocks.append(block)
+            offset += len(block)
+    head = zlib.compress(json.dumps(index, ensure_ascii=False).encode('utf-8'), 9)
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, len(head)))
+        f.write(head)
+        for block in blocks:
+            f.write(block)
+    os.replace(tmp, path)
+    return path
+
+
+class LazyCorpus(collections.abc.Mapping):
+    """filename（相对本目录）中模块级 dict `name` 的只读懒加载视图。
+
+    有最新的打包文件时从中取值，否则读源码；packed=False 时只读源码。
+    """
+
+    def __init__(self, filename, name, packed=True):
+        self.filename = filename
+        self.path = os.path.join(_HERE, filename)
+        self.name = name
+        self.packed = packed
+        self._store = None
+        self._index = None
+        self._values = {}
+        self._names = _Names(self)
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return 'LazyCorpus({!r}, {!r})'.format(os.path.basename(self.path), self.name)
+
+    def _read(self):
+        with open(self.path, 'rb') as f:
+            return f.read()
+
+    @property
+    def index(self):
+        """{键: (起点, 终点)}，值的源码在文件中的字节区间；从打包文件读取时为 CorpusStore.entries。"""
+        if self._index is None:
+            store = open_store() if self.packed else None
+            entries = store.entries(self.filename, self.name) if store is not None else None
+            if entries is not None:
+                self._store = store
+            else:
+                data = self._read()
+                entries = _dict_entries(data, _assignment(data, self.name))
+            self._index = entries
+        return self._index
+
+    def _eval(self, source):
+        return eval(compile(source.strip(), self.path, 'eval'), {'__builtins__': {}}, self._names)
+
+    def _eval_name(self, name):
+        data = self._read()
+        start = _assignment(data, name)
+        return self._eval(data[start:_statement_end(data, start)].decode('utf-8'))
+
+    def __getitem__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        entry = self.index[key]
+        if self._store is not None:
+            value = self._store.read(*entry)
+        else:
+            start, end = entry
+            with open(self.path, 'rb') as f:
+                f.seek(start)
+                source = f.read(end - start).decode('utf-8')
+            value = self._eval(source)
+        with self._lock:
+            self._values[key] = value
+        return value
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def __len__(self):
+        return len(self.index)
+
+
+_corpora = {}
+
+
+def load(name):
+    """CORPORA 中的文库，进程内每个只建一个 LazyCorpus。"""
+    corpus = _corpora.get(name)
+    if corpus is None:
+        corpus = _corpora.setdefault(name, LazyCorpus(CORPORA[name], name))
+    return corpus
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description=u'把断语文本库打包成一个压缩文件，供排盘按键读取')
+    parser.add_argument('--output', metavar='FILE', default=None,
+                        help=u'输出文件，默认 %s 或本目录的 corpus.pack' % STORE_ENV)
+    options = parser.parse_args(argv)
+    path = build_store(options.output)
+    print(path, os.path.getsize(path))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# CreateDate: 2025-10-30
+# 按键懒加载的文本库，见 corpus.LazyCorpus；排盘时不 import 本文件。
+
+# 命宫
+minggongs = {
+    "子": "天贵星、志气不凡、富裕清吉。",
+    "丑": "天厄星、先难后吉、离祖劳心、晚年吉。",
+    "寅": "天权星、聪明大器、中年有权柄。",
+    "卯": "天赦星、慷慨疏财、得权时须谦逊。",
+    "辰": "天如星、事多翻覆、机谋多能。",
+    "巳": "天文星、文章振发、女命有好夫。",
+    "午": "天福星、荣华吉命。",
+    "未": "天驿星、一生劳碌、离祖始安。",
+    "申": "天孤星、不宜早婚、女命妨夫。",
+    "酉": "天秘星、性情刚直、时有是非。",
+    "戌": "天艺星、心性平和、艺道有名。",
+    "亥": "天寿星、心慈明悟、克己助人。",
+
+}
+
+# 日主坐支
+rizhus = {
+	"甲子": "虽坐沐浴，若四往有禄，看印，冬生不作妻败", 
+	"乙丑": "身坐财官，有乙庚合最吉", 
+	"丙寅": "金绝水死，财官俱背，但丙火长生食神独旺，主有寿，己亥、辛卯、癸巳时贵", 
+	"丁卯": "财官俱背，须合气、禄、火扶", 
+	"戊辰": "壬庚入墓，乙木自坐财官", 
+	"己巳": "水绝木病，丙寅时贵", 
+	"庚午": "庚金坐死但午上自坐官、印，虽败不困", 
+	"辛未": "身旺，丙申时贵", 
+	"壬申": "水辰生位，聪明秀丽", 
+	"癸酉": "财官无气，要用旺者吉", 
+	"甲戌": "身坐旺官，临火库，心怀慈善，丙寅时贵", 
+	"乙亥": "日坐木局，丙壬、壬午、甲申时贵", 
+	"丙子": "身坐财啊．癸巳时", 
+	"丁丑": "金库荣丰，见辛亥时贵", 
+	"戊寅": "甲木当局，官杀者吉", 
+	"己卯": "身坐杀地，须身杀力停者吉",
+	"庚辰": "魁罡，忌于刑冲", 
+	"辛巳": "金局坐死不妨，戊子时贵", 
+	"壬午": "财官双美，伶俐有谋，壬寅时贵", 
+	"癸未": "身坐杀位须身力二停", 
+	"甲申": "坐绝，四柱俱绝者吉", 
+	"乙酉": "坐杀四乙酉或有化杀则吉，辛巳时，为化气金局贵", 
+	"丙戌": "夏生则财官无气", 
+	"丁亥": "日贵，壬寅时，乙巳时皆贵", 
+	"戊子": "自坐财，乙卯时，丁巳时贵", 
+	"己丑": "有财无官，丙寅时贵", 
+	"庚寅": "坐绝反主吉昌", 
+	"辛卯": "财衰无妨，见戊子时贵", 
+	"壬辰": "魁罡、不喜冲刑，遇建禄反卑", 
+	"癸巳": "财官双美最吉祥，丁已时贵", 
+	"甲午": "夏生大吉", 
+	"乙未": "逢财伤官格", 
+	"丙申": "身坐财，庚寅时贵，癸巳时亦吉", 
+	"丁酉": "临财学精，壬寅时贵", 
+	"戊戌": "魁罡，忌冲刑", 
+	"己亥": "自坐财官得高名，丙寅时贵", 
+	"庚子": "有丁火则吉", 
+	"辛丑": "食神荣昌，主寿", 
+	"壬寅": "水火既济，见壬寅时大吉", 
+	"癸卯": "日贵，衰神旺吉", 
+	"甲辰": "身坐财库水气，性善良，丙寅时吉", 
+	"乙巳": "男女妨家室，有壬者轻", 
+	"丙午": "日刃喜刑冲，男、女妨家室，见乙、癸者轻", 
+	"丁未": "坐印小吉", 
+	"戊申": "甲绝有财无官", 
+	"己酉": "财禄一背，皆须生扶", 
+	"庚戌": "魁罡，忌火旺地支之运及冲刑", 
+	"辛亥": "财生，官绝", 
+	"壬子": "日刃喜刑冲", 
+	"癸丑": "喜冲不作灾论", 
+	"甲寅": "财官二背，见辛未时贵", 
+	"乙卯": "财官无气，见庚辰时贵", 
+	"丙辰": "冬生不吉，庚寅时贵", 
+	"丁巳": "男、女妨家室．有戊者重，甲、寅者轻", 
+	"戊午": "日刃喜刑冲，四、五月在刑地亦吉", 
+	"己未": "丙寅时贵（无水大吉）", 
+	"庚申": "日德、日禄、寿", 
+	"辛酉": "日禄、戊子、丙申时贵", 
+	"壬戌": "元武当权．等作财官双美", 
+	"癸亥": "得癸亥时夫贵", 
+}
+
+# 天干特点
+gan_desc = {
+    "甲":'''雷龙 梁栋 禄寅;斧斤斫削成其器。木不南奔;喜春运不喜西方,春生,处世安然,必寿。''', 
+    "乙":'''风 树 禄卯 水泛木浮  秋令大吉''', 
+    "丙":"电 冶 禄巳 火无西向", 
+    "丁":"星 灯 禄午 火明则灭 喜遇秋. 丁巳日,多克父兄妻子,财忌比劫,兄屈弟下,巳有戊土,伤",
+    "戊":"雾霞 山 禄巳 土虚则崩 四柱带水则为上格,霞水相辉而成文彩也;年月干见癸雨后霞现", 
+    "己":"元气云 真土 禄午 火燥土裂  天降时雨,山川出云 贵坐酉,贵春生,贵见印,坐亥者不可见乙木,云升天,遇风则狼籍", 
+    "庚":"月 铁 禄申 畏癸水 巳成钟鼎 水土沉埋则无声 金实无声 金沉水底 四柱有乙巳,月白风清, 秋上,冬次,春夏无取。",
+    "辛":"霜 金 禄酉 土重金埋 辛人坐卯,未透乙, 大富,坐亥透丙则贵。爱冬生。", 
+    "壬":"秋露云 泽 禄亥 死水横流", 
+    "癸":"雨 泉脉 春霖 禄子 水不西流 癸卯日透己, 有云行雨有经济才也。春夏吉,秋冬不吉"}
+
+# 地支（年份）特点
+zhi_desc = {
+    "子":"墨池 正北 时喜见癸亥，谓之水归大海，又谓之双鱼游墨，必为文章士矣。",
+    "丑":"柳岸 丑人时见己未，乃月照柳梢，极为上格",
+    "寅":"广谷 寅生人而时戊辰者，谓之虎啸而谷风生 威震万里",
+    "卯":"琼林 乙木 正东 仲春 卯年遇巳未时者，是为兔入月宫之象，主大贵。",
+    "辰":"草泽 东方之次 辰逢壬戍、癸亥即龙归大海格",
+    "巳":"大驿 巳生喜得辰时，蛇化轻龙，于格为千里龙驹",
+    "午": "烽堠 南 属火、土，其色赤黄 时利见辰，真龙出则凡马空矣，谓之马化龙驹。",
+    "未": "花园 卯乃木旺,自 成林麓;未乃木库,如人筑墙垣以护百花也,以百花言未中有 杂气耳;未年人双飞格,最妙,如辛未见戊戍,两干不杂是也。 ",
+    "申":"名都 帝王所居；申宫壬水生 亥时，乃地天交泰",
+    "酉":"寺钟 正西 见寅吉，谓之钟鸣谷应。",
+    "戌": "烧原 戌与辰地皆贵人所不临也 戌生逢卯 春入烧痕",
+    "亥":"悬河 即天门 日时见寅、辰二字，是乃水拱雷门",    
+}
+
+# 五行养生
+gan_health = {
+    "金":'''
+    秋天较走运
+    申月、酉月、猴年和鸡年运气较好
+    下午三点至下午七点是吉时
+    
+    西方是吉方
+    住朝西的房子较吉利
+    睡房在房子的西方较好
+    睡房的西方有窗字较顺利
+    金属床有利健康
+    办公桌朝西有助工作效率
+    吉祥颜色是白色
+    室内装璜用白色系统
+    穿衣用白色系列
+    开白色车子较平安易发财
+    勿伤心，注意呼吸系统、肺、肠, 筋
+    武术、击搏、兵器运动、健身房运动也很好
+    和金有关的工作较容易''',
+                                     
+    "木":'''
+    春天或清风徐来的天气较走运
+    卯月、寅月、兔年和虎年运气较好
+    上午三点至上午七点是吉时
+    东方是吉方
+    住朝东的房子较吉利
+    睡房在房子的东方较好
+    睡房的东方有窗字较顺利
+    木床有利健康
+    办公桌朝东有助工作效率
+    吉祥颜色是绿色
+    室内装璜用绿色系统
+    穿衣用绿色系列
+    开绿色车子较平安易发财
+    多喝点酸性饮料，忌生气，注意神精系统、肝、胆、头肩、肝胆
+    多打高尔夫球、公园散步、徒步树林等户外运动
+    和木有关的工作较容易。''',
+                                        
+    "水":'''
+    身体需要注意: 胫足、膀胱肾(比如结石) 多喝水
+    冬天或冷天气较走运
+    亥月、子月、猪年和鼠年运气较好
+    晚上九点至上午一点是吉时
+    北方较冷是吉方
+    住朝北的房子较吉利
+    睡房在房子的北方较好
+    睡房的北方有窗字较顺利
+    金属床或水床有利健康
+    办公桌朝北有助工作效率
+    吉祥颜色是黑色
+    室内装璜用黑色系统
+    穿衣用黑色系列，带珠宝也不错
+    开黑色车子较平安易发财
+    多喝水，注意肾脏系统
+    多做游泳、潜水、滑雪、钓鱼、溜冰等户外运动
+    和水有关的工作较容易。''',    
+                                        
+    "火":'''
+    夏天或热天气较走运
+    午月、巳月、马年和蛇年运气较好
+    上午九点至下午一点是吉时
+    南方较热是吉方
+    住朝南的房子较吉利
+    睡房在房子的南方较好
+    睡房的南方有窗字较顺利
+    木床有利健康
+    办公桌朝南有助工作效率
+    吉祥颜色是红色
+    室内装璜用红色系统
+    穿衣用红色系列
+    开红色车子较平安易发财
+    要常笑，注意心脏系统、血液循环、眼睛、额齿
+    多做打篮球、网球、排球、骑单车等户外运动
+    和火有关的工作较容易''',
+    
+    "土":'''
+    春、夏、秋、冬四季交接之时段较走运
+    丑、辰、未、戌月和牛、龙、羊、狗年运气较好
+    上午二点、八点左右和下午二点、八点左右都是吉时
+    起居环境和气候不要太乾或太湿
+    睡房在房子的中间较好
+    办公桌靠房子的中间，有助工作效率
+    吉祥颜色是棕黄色
+    室内装璜用棕黄色系统
+    穿衣用棕黄色系列，带古玉很不错
+    开棕黄色车子较平安易发财
+    勿常担心事情，太多虑 
+    少吃些甜点，注意消化系统、脾、肌肉
+    多做园艺、露营、走路等户外运动。下棋、宗教场所都好
+    和土有关的工作较容易''',      
+}
@@ -304,33 +304,6 @@ guans = {
     "壬":('己',"午",'未','丑'), "癸":('戊',"寅","辰",'巳','申','戌'),}
 
 
-gan_desc = {
-    "甲":'''雷龙 梁栋 禄寅;斧斤斫削成其器。木不南奔;喜春运不喜西方,春生,处世安然,必寿。''', 
-    "乙":'''风 树 禄卯 水泛木浮  秋令大吉''', 
-    "丙":"电 冶 禄巳 火无西向", 
-    "丁":"星 灯 禄午 火明则灭 喜遇秋. 丁巳日,多克父兄妻子,财忌比劫,兄屈弟下,巳有戊土,伤",
-    "戊":"雾霞 山 禄巳 土虚则崩 四柱带水则为上格,霞水相辉而成文彩也;年月干见癸雨后霞现", 
-    "己":"元气云 真土 禄午 火燥土裂  天降时雨,山川出云 贵坐酉,贵春生,贵见印,坐亥者不可见乙木,云升天,遇风则狼籍", 
-    "庚":"月 铁 禄申 畏癸水 巳成钟鼎 水土沉埋则无声 金实无声 金沉水底 四柱有乙巳,月白风清, 秋上,冬次,春夏无取。",
-    "辛":"霜 金 禄酉 土重金埋 辛人坐卯,未透乙, 大富,坐亥透丙则贵。爱冬生。", 
-    "壬":"秋露云 泽 禄亥 死水横流", 
-    "癸":"雨 泉脉 春霖 禄子 水不西流 癸卯日透己, 有云行雨有经济才也。春夏吉,秋冬不吉"}
-
-zhi_desc = {
-    "子":"墨池 正北 时喜见癸亥，谓之水归大海，又谓之双鱼游墨，必为文章士矣。",
-    "丑":"柳岸 丑人时见己未，乃月照柳梢，极为上格",
-    "寅":"广谷 寅生人而时戊辰者，谓之虎啸而谷风生 威震万里",
-    "卯":"琼林 乙木 正东 仲春 卯年遇巳未时者，是为兔入月宫之象，主大贵。",
-    "辰":"草泽 东方之次 辰逢壬戍、癸亥即龙归大海格",
-    "巳":"大驿 巳生喜得辰时，蛇化轻龙，于格为千里龙驹",
-    "午": "烽堠 南 属火、土，其色赤黄 时利见辰，真龙出则凡马空矣，谓之马化龙驹。",
-    "未": "花园 卯乃木旺,自 成林麓;未乃木库,如人筑墙垣以护百花也,以百花言未中有 杂气耳;未年人双飞格,最妙,如辛未见戊戍,两干不杂是也。 ",
-    "申":"名都 帝王所居；申宫壬水生 亥时，乃地天交泰",
-    "酉":"寺钟 正西 见寅吉，谓之钟鸣谷应。",
-    "戌": "烧原 戌与辰地皆贵人所不临也 戌生逢卯 春入烧痕",
-    "亥":"悬河 即天门 日时见寅、辰二字，是乃水拱雷门",    
-}
-
 gan3 = {
     "甲":'天上贵，孤独守空房', 
     "乙":'多阴私，又要败祖业', 
@@ -388,8 +361,8 @@ def getGZ(gzStr):
 
 def get_jizhu(gan, zhi):
     
-    gan_index = Gan.index(gan)
-    zhi_index = Zhi.index(zhi) 
+    gan_index = gan_ids[gan]
+    zhi_index = zhi_ids[zhi] 
     result = {}
     alls = []
     for i in range(6):
@@ -415,99 +388,97 @@ def get_current_year():
     current_date = datetime.date.today()
     return current_date.year
 
-gan_health = {
-    "金":'''
-    秋天较走运
-    申月、酉月、猴年和鸡年运气较好
-    下午三点至下午七点是吉时
-    
-    西方是吉方
-    住朝西的房子较吉利
-    睡房在房子的西方较好
-    睡房的西方有窗字较顺利
-    金属床有利健康
-    办公桌朝西有助工作效率
-    吉祥颜色是白色
-    室内装璜用白色系统
-    穿衣用白色系列
-    开白色车子较平安易发财
-    勿伤心，注意呼吸系统、肺、肠, 筋
-    武术、击搏、兵器运动、健身房运动也很好
-    和金有关的工作较容易''',
-                                     
-    "木":'''
-    春天或清风徐来的天气较走运
-    卯月、寅月、兔年和虎年运气较好
-    上午三点至上午七点是吉时
-    东方是吉方
-    住朝东的房子较吉利
-    睡房在房子的东方较好
-    睡房的东方有窗字较顺利
-    木床有利健康
-    办公桌朝东有助工作效率
-    吉祥颜色是绿色
-    室内装璜用绿色系统
-    穿衣用绿色系列
-    开绿色车子较平安易发财
-    多喝点酸性饮料，忌生气，注意神精系统、肝、胆、头肩、肝胆
-    多打高尔夫球、公园散步、徒步树林等户外运动
-    和木有关的工作较容易。''',
-                                        
-    "水":'''
-    身体需要注意: 胫足、膀胱肾(比如结石) 多喝水
-    冬天或冷天气较走运
-    亥月、子月、猪年和鼠年运气较好
-    晚上九点至上午一点是吉时
-    北方较冷是吉方
-    住朝北的房子较吉利
-    睡房在房子的北方较好
-    睡房的北方有窗字较顺利
-    金属床或水床有利健康
-    办公桌朝北有助工作效率
-    吉祥颜色是黑色
-    室内装璜用黑色系统
-    穿衣用黑色系列，带珠宝也不错
-    开黑色车子较平安易发财
-    多喝水，注意肾脏系统
-    多做游泳、潜水、滑雪、钓鱼、溜冰等户外运动
-    和水有关的工作较容易。''',    
-                                        
-    "火":'''
-    夏天或热天气较走运
-    午月、巳月、马年和蛇年运气较好
-    上午九点至下午一点是吉时
-    南方较热是吉方
-    住朝南的房子较吉利
-    睡房在房子的南方较好
-    睡房的南方有窗字较顺利
-    木床有利健康
-    办公桌朝南有助工作效率
-    吉祥颜色是红色
-    室内装璜用红色系统
-    穿衣用红色系列
-    开红色车子较平安易发财
-    要常笑，注意心脏系统、血液循环、眼睛、额齿
-    多做打篮球、网球、排球、骑单车等户外运动
-    和火有关的工作较容易''',
-    
-    "土":'''
-    春、夏、秋、冬四季交接之时段较走运
-    丑、辰、未、戌月和牛、龙、羊、狗年运气较好
-    上午二点、八点左右和下午二点、八点左右都是吉时
-    起居环境和气候不要太乾或太湿
-    睡房在房子的中间较好
-    办公桌靠房子的中间，有助工作效率
-    吉祥颜色是棕黄色
-    室内装璜用棕黄色系统
-    穿衣用棕黄色系列，带古玉很不错
-    开棕黄色车子较平安易发财
-    勿常担心事情，太多虑 
-    少吃些甜点，注意消化系统、脾、肌肉
-    多做园艺、露营、走路等户外运动。下棋、宗教场所都好
-    和土有关的工作较容易''',      
-}
 
 # 岁煞为三合对冲方的三会中的库，劫煞为三合对冲方的三会中的生
 mu_years = { '灾煞': '酉', '坐煞': '庚辛','向煞': '甲乙','岁煞': '戌', '劫煞': '申',
     
-}
\ No newline at end of file
+}
+
+# 整数编码：天干 0-9、地支 0-11、六十甲子 0-59（甲子为 0）。
+# 下列表在导入时一次生成，热循环里用下标取值，代替 list.index 与 bidict 反查。
+gan_ids = {item: seq for seq, item in enumerate(Gan)}
+zhi_ids = {item: seq for seq, item in enumerate(Zhi)}
+jiazis = tuple(Gan[seq % 10] + Zhi[seq % 12] for seq in range(60))
+jiazi_ids = {item: seq for seq, item in enumerate(jiazis)}
+
+def jiazi_id(gan, zhi):
+    """天干、地支编号 -> 六十甲子编号；阴阳不配（如甲丑）时返回 None。"""
+    if gan % 2 != zhi % 2:
+        return None
+    return (6*gan - 5*zhi) % 60
+
+shen_names = ('比', '劫', '食', '伤', '才', '财', '杀', '官', '枭', '印')
+stage_names = ('长', '沐', '冠', '建', '帝', '衰', '病', '死', '墓', '绝', '胎', '养')
+shen_ids = {item: seq for seq, item in enumerate(shen_names)}
+stage_ids = {item: seq for seq, item in enumerate(stage_names)}
+
+# ten_god_table[日主][天干] -> shen_names 编号
+ten_god_table = tuple(bytes(shen_ids[ten_deities[me][gan]] for gan in Gan) for me in Gan)
+# stage_table[日主][地支] -> stage_names 编号（十二长生）
+stage_table = tuple(bytes(stage_ids[ten_deities[me][zhi]] for zhi in Zhi) for me in Gan)
+# 反查：god_gan_table[日主][十神] -> 天干编号；stage_zhi_table[日主][长生状态] -> 地支编号
+god_gan_table = tuple(bytes(gan_ids[ten_deities[me].inverse[item]] for item in shen_names) for me in Gan)
+stage_zhi_table = tuple(bytes(zhi_ids[ten_deities[me].inverse[item]] for item in stage_names) for me in Gan)
+# hidden_table[地支] -> ((天干编号, 分数), ...)，顺序同 zhi5（本气在前）
+hidden_table = tuple(tuple((gan_ids[gan], score) for gan, score in zhi5[zhi].items()) for zhi in Zhi)
+
+# 地支关系位掩码。zhi_relation_table[a][b] 的第 n 位表示 b 对 a 成立 zhi_relation_names[n]，
+# 前九种与 zhi_atts[a] 的键同序同义，另加半合、半会的拱（gong_he / gong_hui）。
+zhi_relation_names = ('冲', '刑', '被刑', '合', '会', '害', '破', '六', '暗', '拱合', '拱会')
+zhi_relation_bits = {name: 1 << seq for seq, name in enumerate(zhi_relation_names)}
+
+def _zhi_relation_mask(a, b):
+    mask = 0
+    for type_, value in zhi_atts[a].items():
+        if b in value:
+            mask |= zhi_relation_bits[type_]
+    if a + b in gong_he:
+        mask |= zhi_relation_bits['拱合']
+    if a + b in gong_hui:
+        mask |= zhi_relation_bits['拱会']
+    return mask
+
+zhi_relation_table = tuple(tuple(_zhi_relation_mask(a, b) for b in Zhi) for a in Zhi)
+
+def zhi_relation_mask(zhi, others):
+    """地支编号 zhi 与 others 中任一地支成立的关系位（按位或）。"""
+    row = zhi_relation_table[zhi]
+    mask = 0
+    for other in others:
+        mask |= row[other]
+    return mask
+
+def zhi_relations(zhi, others, skip=0):
+    """地支编号 zhi 与 others 的关系，如 ['冲:午', '害:未']；顺序同逐个遍历 zhi_atts，skip 为忽略的关系位。"""
+    row = zhi_relation_table[zhi]
+    result = []
+    for other in others:
+        mask = row[other] & ~skip
+        if not mask:
+            continue
+        for seq in range(9):
+            if mask >> seq & 1:
+                result.append(zhi_relation_names[seq] + ":" + Zhi[other])
+    return result
+
+# 天干关系位掩码。gan_relation_table[a][b]：合、冲，以及 a 克 b、b 克 a、a 生 b、b 生 a
+gan_relation_names = ('合', '冲', '克', '被克', '生', '被生')
+gan_relation_bits = {name: 1 << seq for seq, name in enumerate(gan_relation_names)}
+
+def _gan_relation_mask(a, b):
+    mask = 0
+    if ten_deities[a]['合'] == b:
+        mask |= gan_relation_bits['合']
+    if ten_deities[a]['冲'] == b:
+        mask |= gan_relation_bits['冲']
+    if ten_deities[a]['克'] == ten_deities[b]['本']:
+        mask |= gan_relation_bits['克']
+    if ten_deities[b]['克'] == ten_deities[a]['本']:
+        mask |= gan_relation_bits['被克']
+    if ten_deities[a]['生'] == ten_deities[b]['本']:
+        mask |= gan_relation_bits['生']
+    if ten_deities[b]['生'] == ten_deities[a]['本']:
+        mask |= gan_relation_bits['被生']
+    return mask
+
+gan_relation_table = tuple(tuple(_gan_relation_mask(a, b) for b in Gan) for a in Gan)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# CreateDate: 2025-10-30
+# 按键懒加载的文本库，见 corpus.LazyCorpus；排盘时不 import 本文件。
+
+# 六十日用法口诀
+days60 = {
+    "甲子": "天德贵人日。坐子、沐浴，逢官临桃花。\n白玉仙子捧印来，一举成名天门开。\n贵人不向西方去，烽火空负旷世才。\n辛为正官，庚为偏官，戊己为财，见甲乙为破财，丙丁伤名利艰难，生在子月，无丑合，离祖自立，亥卯辰月主贵，巳月平常之命，午月甲死子神冲，他乡立业。申月，子嗣难有。辰月，移根换叶。亥月，文章显达。",
+    "甲寅": "天禄贵人日。坐比肩，食神，临官禄。\n禄到人间最为奇，千秋功业酬白帝。\n田园风光好福气，春江月夜柳丝垂。\n双木并排，见寅月，孤克，二三妻，见申酉月大贵，卯月，身太旺破财，巳月，犯刑，亥月，早步帝阙，子月拱丑，贵。午月，会东方火局，才华超群，辰月，广置阡陌。",
+    "甲辰": "龙守财库日。坐偏财库，临衰。\n身坐财库一世荣，慷慨风流人多情。\n财团公司善交际，官星透显管万民。\n子月，水多木飘，主移根换叶。申月、贵，酉月，富贵双显。午戌月，主富，卯月，羊刃主败财。丑月富厚有财，亥月透官，最贵。寅月，龙虎拱月，叫龙吟虎啸。",
+    "甲午": "龙马奔驰日。坐死、伤官、财地、进贵日。\n龙马交弛好福气，娇妻美女喜北地。\n八月桂花香千里，春风丽日相依依。\n子月，冲午，鸳鸯难合。亥卯未月，贵显。午月，自刑，见亥子，主富。丑月，身弱，见火贫。寅月，得申酉吉，火月劳碌贫夭；卯月，财不聚；申酉月，武职得权。",
+    "甲申": "龙虎夺魁日。坐绝，临杀化印。\n跃马横戈驰天涯，秦山楚国帅府家。\n儿女手足喜相逢，斩将夺关壮士夸。\n生于子月，印化煞，贵。亥卯未月，都贵，申月申时，死，夭命。丑月，带疾，辰月，孤独或僧道。巳月，清贫，敦厚聪明，且有刑。午月，艺业成名，酉月，先贵有疾，一成一败，亥月，文章显达。",
+    "甲戌": "青龙献艺日。坐养，临偏财，伤官。\n一世荣华走他乡，千般艺技样样强。\n官星印星来捧上，风流多情歌舞场。\n子月，书海成名。丑未月，冲刑灾，多病。寅月贵，工作好，对妻不利，丑月，大富，巳月名利两全。午月，富而贵。辰月，僧道清高。亥月，艺人，功名不遂。戌月，背禄逐马，鸡鸭同鸣。甲临戌，财库，富贵双全日。",
+    "乙丑": "玉女佩珠日（丁为玉女，丑为珠）。临衰，坐枭与偏财，将星。\n身坐金库财福秀，衣禄荣华样样有。\n金水相涵好文章，东方西方对面谈。\n生于子月，丑合，贵，丑月，带疾；寅月，寅中丙火克庚金官星，不禄。申酉月，无火，寿长。寅卯月败财。辰戌月，富贵。亥子月，诗文扬。巳午月，福寿。戌月，清秀厚道，财富丰盈。",
+    "乙卯": "风云相会日。坐禄，临比肩，爵位，天乙贵人。\n身坐爵位人称羡，功名显达列朝班。\n苍海珠玉会雨露，青山白云流水远。\n子月，偏印，文笔命，喜食伤生财，土月富，亥月，辛官，武职勋业。寅卯月，财绝，僧道有缘。巳午月，破财，申酉月显赫。戌月福而寿。未月财富丰盈。",
+    "乙巳": "木火生辉日。交贵，驿马，正财，成名。\n刚愎自用又聪明，财官同见公候命。\n文才武略怕青龙，兴旺成败一刻中。\n子月，文才出众，一生劳碌。申月，官得生，近臣。丑月，武职建奇。亥卯月，通根见官杀贵。未月，有福，营商发财。巳午月，妻病或离别。申酉月，带疾，肝胆病。亥月，文章出奇。戌月，入墓，富而寿短。",
+    "乙未": "财福日。临财，坐养。也叫福贵目。\n天元坐福人聪颖，得官逢比赛富翁。\n丝绸路上愁石榴，春色秋花雨蒙蒙。\n子月，平常命。未月，孤刑，申酉月，肾病，阳痿，女姓有妇科病，亥月，大贵。辰戌丑月，福商巨贾。午月，声名天下，夏月生，平常，冬生，寿长。巳月，功名难遂，艺业生涯。",
+    "乙酉": "龙凤呈祥日。（生于酉月为贵为蒙难日）坐绝，将星。\n春花江水落凤霞，南北扬名匡天下。\n南方一去坐金殿，玉石翡翠泪花花。\n子月，生身，逢财星，吉。寅卯月，显贵。午月，艺名生涯。申月，贫命，劳碌。酉月，自刑，伤禄破命目疾，主灾，行印运时吉。亥月，喜财星，田园丰盛，巳月败散祖业，乙酉，多伤残。",
+    "乙亥": "名利双成日。坐死，临正印，劫财，文星贵人。\n玉兔月桂喜官星，亲姻朋辈重友情。\n青竹流水郁葱葱，太阳投江重复行。\n子月，主有富，喜官杀显贵。亥月，自刑。午月，贵命，千荷夏日鲜。寅卯月，财星透，富寿。申月，得官。巳月，天涯风尘。戌月，艺道成名，干戈阵前之命。酉月，伤官，贵，死于非命。",
+    "丙子": "漓江照彩日。临胎，正官，喻文曲星，天官贵人。\n彩照山川凤呈祥，年少成名坐华堂。\n日落江河人堪伤，东彩西虹任君想。\n子月，逢印，贵。土月，企业财团。寅卯月，学业有成。午月，贫，自立家业，兄弟难依。申酉月，经济有方。亥月，有疾，夭。子月，不禄，心脏疾患。丑月，透财贵。巳月，刑灾，大肠患疾。辰月，官星暗藏，超群出众。",
+    "丙寅": "红日东升日，坐长生，枭印，食神。\n山川秀丽柳丝青，人生最喜烟霞景。\n莫向离情虎山行，西南一去幽幽命。\n酉月，正财，透财贵显。寅月，贵而不长久。卯，见财星福，官星显贵。申月，财官双显。未月，主福。戌月，衣禄平常。亥子月，六品之贵，巳午月，肠胃或肺疾。",
+    "丙辰": "火照龙潭日。临官，食神旺，正印。\n日坐福神受皇恩，高官厚禄子孙兴。\n平生享尽人间福，女命穿金又戴银。\n戌月，冲，财门开，富命。辰月，僧道或孤。寅卯月，贵。丑未月，富厚。亥子月，贵格。申酉月，行火运，官至二三品。午月，两三妻，福禄两全。",
+    "丙午": "天河落彩日。坐劫地，伤官，羊刃。\n人逢帝座爵士身，功名仕途显达人。\n苍龙水火多有厄，细雨蒙蒙入燕门。\n巳午月，平常命。亥子月，武官，功名挫蹬。午月，贫，倒冲子贵。寅月，三合局，文上显赫。卯月，喜行财星，贵而富。戌月合伙，商人。辰月，实业主。申酉月，财富商贾。",
+    "丙申": "火照金城日。病地，偏财，临杀。\n身临财官显声名，且防比刃杀伤临。\n马逢帝旺临官处，堆金积玉立大功。\n子丑月，血疾，申月，文章有名。酉月，妻妾有情。子辰月，带疾，亥月，喜财。午月，一生吉庆无病，长寿。寅卯月，官荣身。未月，虽富肠胃有病。丙申日，遇岁运刑冲，必生灾祸。",
+    "丙戌": "天厨贵人日，坐墓，福神财地。\n玉堂厚禄寒门出，金银珠宝西方路。\n日落深潭闯鬼门，金榜题名显双亲。\n生于子月，福寿延，有名有利，地支巳午戌月，富贵双全。申酉月，大富，财团。辰月冲，少年名显。亥月，武职，六品。丑月，一般经济人。辰月，身旺得职，身弱貧賤。",
+    "丁丑": "玉女守库日，坐墓，临财。\n一轮满月彩画鲜，金银满库禄高迁。\n丽人不行东南地，洁肤玉身受熬煎。\n丑月，财透干，富。寅卯月，印，学士命。巳午月，妻迟，二婚，破财，一生辛劳。申酉月，金银满贯，戌月刑灾，财去财散两空空。亥月，喜行南方火运，名利有望。子月见火，戎马空忽。",
+    "丁卯": "月照蟾宫日。临偏印，坐病。（虚名虚利）\n日坐偏印身自强，西风不吹日惆怅。\n驿马交驰到财乡，山斗文章盖一方。\n寅卯月，印绶，喜行官运，寒门将相。辰戌丑未月、孤星，妻不顺，财不聚。巳午月，夫妻缘份薄，艰苦。午月多婚，贫，夭，申酉月，名利双贵。子月，武职。亥月，文职显耀。",
+    "丁巳": "朱雀跃辉日。坐帝旺，劫财，伤官，正财。\n谢女才高满词馆，等闲平步出少年。\n旌旗蔽日入凤阕，火焰马疲怨高山。\n午月，长生，文章显奇。巳月，禄贵。寅卯月，透官星，一品大贵。辰月，商海有名。未月，贵格，申酉月富命。戌月，无福，见癸水，伤目近视。亥月，常常外出。",
+    "丁未": "人立画桥日，坐冠带，食神，比肩，偏印。\n食神生旺胜财官，天河画桥拜金殿。\n巽风相伴云雨水，太阳夺辉苦贫寒。\n子月，沙场立功。丑月，外出经商，妻多离别。寅卯月，金堂玉马。巳午月，破祖业，自立家门。申月，财官双美，酉月，大富。辰月，杂气官旺。亥月，将相。丁未，性强，人贵，凶险多。",
+    "丁酉": "玉女乘凤日。坐长生，临偏财。\n朱雀乘凤显英豪，金车玉凤福寿高。\n贵人龙马东方起，太阳升时漫徒劳。\n亥月，贵人捧印，酉戌月，犯刑，骨肉无情，因财分张。子月，杀旺，喜行土运，午月，干强，财旺，未月，衣禄平常，申月，财多身弱，富室贫人，戌月，技术生涯。",
+    "丁亥": "月照天门日。坐胎，临正印，正官。\n词馆文章早荣身，驿马七杀风尘人。\n最喜荷花并蒂开，金水文章佐朝君。\n亥月，贵且富。子月，行木运，金戈铁马。戌月，冲，技艺精湛。寅卯月，贵而显耀。巳午月，自刑，小商。申酉月，利路绵绵。子月，带疾。辰月，专业技术成名。",
+    "戊子": "山环水抱日，临胎，坐正财。\n水绕山环明月光，烟花影中福高享。\n勿贪关城槐山梦，江海浮云一空束。\n子月，喜行火运，福。丑月，聪明，主富贵。寅卯月，弱，病或夭亡，喜火土。巳午月，巳禄，印，午刃，喜行食伤富贵。申月，食旺，贵。酉月，伤名望。土月得才，富贵。亥月，虚秀，财帛不聚。",
+    "戊寅": "虎啸山谷日，临长生，坐杀，偏印。\n将星入命立武功，猛虎纵风显英雄。\n印绶财官悬天门，南征北战旅马行。\n卯月，寅月，鬼旺，多疾或夭。巳、午月，印，诗文会海，兵权万里。申酉月，不禄，伤功名，土月，富。亥月，子月，商贾大富。",
+    "戊辰": "苍龙出海日。临冠带，正才，比肩，正官。\n月洒高山江山秀，平生最喜东南游。\n一生辛勤贵不显，为人热心福气厚。\n子月，财旺，目盲，无火，虚而不实。丑月，财少，人聪明。寅卯月，官星，身荣。辰月，财不聚，孤克。巳午月，学业二次成名。申酉月，艺名四方。戌月，冲，少年出众。亥月，多疾，子月，无根，漂荡，技艺超群。",
+    "戊午": "马奔午门日。临羊刃，正印。\n日月分秀福气隆，杀官相见主武功。\n平川一去前程远，戎马西洲比陶公。\n子月，名利双收，丑月，财旺。寅卯月透干，朝野重臣。午未月印，锦绣文字，透官显贵。申酉月，企业财团董事。戌月财少，平常，孤克。子月，外乡立实。祖业无*，六亲冷落，亥月，大富，刃旺，性强，人虽贵，凶险多。",
+    "戊申": "霞落花簇日。临病，食神，偏财。\n日坐福星声名显，万卷诗书朝天关。\n骑驴走马炉中火，风云雷雨步金殿。\n寅月，冲禄，财旺。子月，财旺，印旺，贵，丑月福，爱酒色，固执。卯月，合食，名利双显。辰戌未月，土气专旺，不聚财，肾病。巳午月，事业沉浮不定多变动。申酉月，专业致富。亥子月，大富。",
+    "戊戌": "溪绕画亭日，坐墓，临正印，比劫。\n热情憨厚心似海，白帝玉女捧印来。\n溪绕画亭芳香名，田园平川云天外。\n子月，显贵聚财。丑未戌月，刑灾，有破。寅卯月合印，诗文成章。申酉月，堆金积玉。亥月，冲，心神不定，异地创业。",
+    "己丑": "金牛拜金殿。临墓，坐比肩，食神，偏财。\n一柱佛香拜金殿，艮山流水芳名显。\n金匙开得丑戈库，富贵荣华醉管弦。\n亥月，伤官尽，贵，有权威。寅月，贵显。卯月，兵权显赫。申月，庚为背禄。甲绝未月，冲，发迹，肾病。午月，冲，妻有厄。巳月合金，商贾巨富。辰月，孤身。子月，仓库充盈。",
+    "己卯": "武跨将坛日，临衰，坐七杀将星。\n将士佩弓跨战马，暮雨风月渡年华。\n文星福禄若有情，北国回首似到家。\n酉月：卯酉冲，一生多迁移，妻离。申月，早发迹。亥月，贵。未月，合，五谷丰登。午月：诗满乾坤。巳月，文秀。辰月，能建功立业。子月，无礼，凶暴。",
+    "己巳": "马跃平川日，临帝旺，坐偏印，比劫。\n南朝天子绶玉印，千里长江醉游人。\n雪山草地马难行，春风得意座上宾。\n巳为印，旺，巳月，金神，忌财，喜食伤。午月，显贵。土月，候伯命。申酉月，喜印运，伤尽为武职。亥月，一品贵，有兵权。子月，食伤运大富，辰月，先贫后发。己巳日，人贵。",
+    "己未": "丹桂漂香日，临冠带，坐比肩，枭印。\n月中桂子秋飘香，江河日月交相映，\n莫道高山芳气散，二月春风论短长。\n亥月，文章夸跃，清高，酉月，大贵。辰月，小职，近卫。申月，财福充盈，未月，财金散失，午月，合，清贫儒雅。巳月，喜官显贵。辰月，寒门将士。",
+    "己酉": "凤飞绿洲日。临长生，坐支食神。\n一轮满月出苍海，金凤展翅飞天外，\n秦山昆仑雪皑皑，龙凤呈祥玉珠来。\n亥月，身弱，贫，寅卯月，有火，武职，酉月，高贵之命，酉多游方术士。申月，无官显贵。未月，大富。巳月，富贵陶朱。子月，食破，贫寒。",
+    "己亥": "平川流水日。临胎，坐支正财，正官。\n禄马同乡拜玉堂，天堑通途文星扬。\n沉影不随流水去，杀星冲动马无疆。\n亥月，财显，官旺，贵。酉月，食神，财旺，申月，干透印，大贵。未月合武职。已月，冲，外迹发愤。子月，多病，血疾。寅卯月，支中鬼旺，一生难成大事。印透大贵。",
+    "庚子": "金玉出海日，临死，坐支，伤官。\n能歌善舞笔和墨，犹如白虎戏江水。\n冲在禄马登科甲，斑竹细雨伤情泪。\n子月，衰，伤官，无土运，鬼旺，风烛夭*。丑月，虚名，轻财。寅月，偏财，不禄。卯月，合财，金玉满目。辰月，利路经商。巳月，武职显跃。午月，文官近卫。四季月，印旺富而有名，亥月，漂蓬，僧侣。",
+    "庚寅": "白虎镇山日，临绝，坐支偏财，七杀，偏印。\n平川猛虎归山林，秋风落叶时不宁。\n最喜大雪封山时，三夏浓荫卧孔明。\n子月，食旺，身衰，比劫扶吉。寅月，清秀，命高。卯月，富不长久。辰月，富而贵。巳月，鬼暗藏，有印，职荣。申酉月，钱财聚散浮沉，戌亥月，董事财团。",
+    "庚辰": "福德贵人日，临养，坐支偏印，食神。\n命带魁罡性刚强，不信鬼神在身旁。\n玉佩娇阳入命来，执戈跨马佐高皇。\n丑月，富而有名。子丑，文才出众。寅卯月，财福寿促，午月，发迹有疾患。巳月，一生艰辛，未申月，财运发迹。酉月合，透官星，荣显。亥子月，食神旺发迹难寿。庚辰，贵而风流，名重利轻。",
+    "庚午": "火铸金印日，临沐浴，支坐正官印。\n铁笔一只水为墨，淡彩浓云笔下绘。\n学苑将士两般命，山野朱雀衔玉翠。\n丑月有名声，辰月，自刑，富而有刑。寅月，火旺，带残疾，肺有疾患。卯月，财旺，大富之人。子月冲，天涯艺海。申酉月，日贵，垂手青云。",
+    "庚申": "双虎奔驰日。临官禄，坐支比肩，食神，偏印，又叫虎恋玉女日。\n白虎交驰向南行，雀跃江河早成名。\n禄到长生官得地，九重露雨沐朱衣。\n庚月，透火，大贵之命。亥子月，诗词清畅流韵。申酉月，无官星。贫而*。寅卯月，财满三峡。已午月，官至侍郎，七杀，金戈铁马。",
+    "庚戌": "禄马贵人日，临衰，坐支正官，偏印。\n将军百战不论功，高山流水又出征。\n西去阳关知音少，前禄后福两三重。\n辰月，冲，平常之命。卯月，合，因妻发福。寅月，候王之命。丑月，财旺官升。巳月，火官，武职操权，有惊险。午月文职。难善终。申酉月，财来财散，散聚两依依。亥子月，文笔超群。",
+    "辛丑": "白玉生辉日，临养，支坐偏印，食神，比肩。\n白玉生辉金门客，高山得贵子为墨。\n身入平川多愁叹，干弋影里勋业垂。\n子月，食神，荣华。丑月，伏吟，鸳鸯难合。寅卯月，财聚官旺。巳月，早遂名香，辰月显达，有名利。午月，凶。申酉月，逢官星，贵，少年坎坷。土月，平常。亥月伤官，一文鸣天下。",
+    "辛卯": "凤阙早步日，临绝，支坐财，伤官，驿马，冲禄。\n高山起程水流长，边塞迢迢雪满霜。\n佛山玉女岂有情，雪山日照花海棠。\n辰月，伤官伤尽，自立自成，技艺，卜相，医生。寅卯月，合，财丰。巳月，冲，文星出众。午月，自刑，先荣后刑。未月，富。申月，贫，人生不定。酉月，多争论。子月，食旺，福旺。亥月，伤官。技业成名。辛卯，偏财，为福贵双全日。",
+    "辛巳": "金马登殿日，临死，坐支正官，正印，劫财，驿马。\n金马临官号嘶风，玉堂拜相翰苑名。\n最喜高山水环绕，娇阳日出漫消魂。\n子月，食旺，名显。丑月，合，妻少缘，财淡。寅月，因财有刑。卯月，横财。巳月，金长生，化水名显。午月，暗鬼有疾。申酉月，贵中有失。亥月，冲，双贵。",
+    "辛未": "冰河解冻日，临衰，支坐枭印，偏官，多情忘义。\n身入西国佛香地，漫歌轻舞管弦醉。\n玉女传送风流人，高山日出彩画新。\n申月，在贵人门下得富。酉月，又贵又富。辰月，库印，冲，清雅儒士。巳月，文月，武操重权，子月，富门贵显。丑月，经济商，云游。亥月，双贵。",
+    "辛酉": "凤卧金山日，临禄，支坐比肩，天乙贵人。\n禄马贵人世少有，凤卧金山将帅候。\n日出朝阳横天行，月圆金门寻石榴。\n申月，劫财，一生财不聚。酉月，比肩，财逢劫。子月，福寿名高，巳月，损妻。寅卯月，财气通门户。巳月，合，名扬四海。午月干弋剑影，未戌月，清贫，亥月，富而有刑。",
+    "辛亥": "虎行天门日。临沐浴，支坐伤官，正财，驿马。\n一去天门遥遥远，长亭驿路关山寒。\n倒骑毛驴东行去，高山丽日花团团。\n申月，发福。带疾。酉月。破禄，多磨。寅月，富商。卯月财团。巳月，冲，天涯游客。午月，武功建奇。土月，有官职。亥月，误入商海。",
+    "壬子": "马奔天河日，临帝旺。支坐劫财。\n壬水浩浩漫天下，行入东方福到家。\n江南平川鱼米乡，云雨湖海镜中花。\n子月，平常人。丑月，官星，人清秀。寅月，大富贵。卯月，刑，妻离。辰月，官库，无冲不发。巳月，午月，利路经商。申酉月，文章璀灿。戌月，权重。亥月，贫。",
+    "壬寅": "福禄日，临病，支坐食神，偏财偏官。\n虎跃天河威名扬，犹如箕豹出山岗。\n禄到长生官得地，九重雨露沐朱衣。\n卯月，破财，有成有败。土月，吉。午月，正官，荣华显贵。申月，冲身弧，奔波人。酉月，风流才子。戌月，财旺。亥月，财有根富命。子月，因财有破。壬见寅为食神，号富贵双全日。",
+    "壬辰": "山流水长日，临墓，，支坐偏官，劫财，库地，虚名虚利。\n江水流芳美如画，杜鹃啼血巫山峡。\n月下骑马走平川，一日尝尽牡丹花。\n子月，成中有败，多凶。丑月辰戌未月，俱贵。寅月，食旺，人骑龙背，名流，财旺。卯月，清雅人。巳、午月，广置庄园。申月，奔劳，走乡串野。酉月，合，文上有名，才子。亥月，主掌权。",
+    "壬午": "花红柳绿日，临胎，支坐财，正官，驿马。\n禄马相邀入帝乡，花红柳绿掩高堂。\n出阕最喜函玉关，千里迢迢雁北上。\n子月，月日冲，外乡立家，难团园。丑月，禄旺，贵。寅月，贵而多疾。卯月，富贵双显，巳月，财旺，喜印地，午月自刑，夭疾，比劫扶，吉。未月，大富。申、酉月，状元及第。土旺四季，主权。亥月，身旺，财旺。",
+    "壬申": "白虎渡江日。临长生。支坐偏印，偏官，劫财，驿马。\n命似白虎渡长江，最怕风雨江水涨。\n丽日跨入平川地，金枝玉叶陪身旁。\n子月，劫财，合水，一生奔波，贫。酉月，偏旺，带疾，弧身。亥月，刑，破财，见官星，大富。丑月，官星，行财运，清秀，禄贵。寅、卯月，食旺，富贵双全。巳、午月，身坐学堂，名利驰驱。申、酉月财帛进退。土月，贵。",
+    "壬戌": "龙出苍海日，临冠带，支坐正财，偏官，正印，火库。\n身坐火库水得福，西行东邀人间苦。\n壮士难酬青云志，醉看少女漫歌舞。\n子月，有疾。丑月，人贵显。申月，枭印，劫财，亲姻难全。酉月，印绶，文印齐来。寅月，合，滋生荣茂；卯月，伤名，异路乘凤。巳月，英豪透发，午月，贵显双亲。辰月，青龙飞跃。亥月，兰蕙不禄。",
+    "癸丑": "桑柳成荫日，临冠带，支坐偏官，印，比肩。\n池塘桑柳满园色，二月春风柳絮飞。\n莫怨高山运来迟，干戈影里是翡翠。\n午月，冲，财旺，福。未月，主贵。子月，合，功名显达。丑月异常出仕。寅卯月，伤食旺，艺海生涯。巳午月利路经商。四季土月，平平，残疾。申酉月，科场功名，亥子月，决战千里。",
+    "癸卯": "天姿文秀日，临长生，支坐食神。\n学堂词馆贵人命，天姿文秀人多情。\n最喜三星相拱照，诗琴歌乐官弦声。\n子月，刑，无礼德，对妻不利，但平步青云。丑月，贵，奇显。寅月，艰难人生。卯月，人生富庶。辰月，财帛富月，父母难*。巳月富而有残，午月，一生财丰。申月，书香早遂，酉月刀笔成名，冲，鸳鸯离合。土月主贵，亥月，名利双全。",
+    "癸巳": "彩霞佩玉日。临胎，支坐正财正官，驿马，文星。\n贵人玉堂来拜相，墨池泉涌好文章。\n武士跨马走天下，王公皇候似平常。\n巳月，财官双美，诗书琴画。午月，中年大富。申酉月，终生劳累，透官。丑月，秀气。辰月，山明水秀，红粉生涯。",
+    "癸未": "贵人佩玉日。临墓，支坐偏官，偏财。\n日临官库将相命，男子英勇女贵荣。\n西方一去福禄地，花园翠亭马不行。\n子月，青云得路，贵。丑月，暗鬼冲伤。婚有变。寅月，秀贵，一生顺利。卯月，武职平常。辰月，富而秀贵，巳月，富而且有肺疾。未月，男女无子女，阳痿。申酉月，文字生发。亥月，财发。",
+    "癸酉": "天福日，临病，支坐偏印。\n潇洒功名起一方，一冲一合异寻常。\n江湖花洒安享福。南去高山势莫档。\n亥月，生涯遂心，风流。戌月，平常，善智谋。酉月，得祖业，破财。申月，印旺，文上出仕。寅月，艺技生涯。卯月，冲，印破，大富。巳月，富商。午月，生意人。申酉月，金水相涵，文秀。子月，印破，不禄，平常命。",
+    "癸亥": "天门悬彩日，临帝旺。支坐伤官。劫财，驿马。\n九华山上天门开，日行东方花似海。\n若去西方昆仑地，边塞将士恋故国。\n未月，合木，贵。在外终。子月，妻离异，财分张；亥月，劫财，一生无正业，散业。四季土月，有作为，决战沙场。寅卯月，财团经营，或艺名天涯。巳午月，大富。癸亥，命薄，多贫。"
+}
+
+# 十二时辰（初中末）出生吉凶
+chens = {
+    "子": "子时初\n值此运如何，作事进退多，初年财未至，末限足财宝。\n子时初先克母，为人性急，首妻难招，长子有克，六亲冷淡，兄弟不和，作事进退，初年不济，末限好，宜手艺吉。\n\n子时中\n衣禄自然兴，一生近贵人，为官作宰相，富贵大家声。\n子时中父母在，为人一生快乐清闲，衣禄不亏，兄弟有分，子息可招，六亲大旺，不能登祖业，出外主有大财。\n\n子时末\n生逢子时末，初年运未通，六亲无倚靠，兄弟两西东。\n子时末先克父，为人性宽，六亲兄弟无力，子息两硬，初年辛苦，作事有头无尾，主离祖过房，重拜爹娘。",
+    "丑": "丑时初\n生逢初丑时，衣禄积有余，为人官职分，田产福安居。\n丑时初父母双全，二十前无刑克，二十后进田庄，文武皆通，为人近贵，有头目分，六亲得力，兄弟有权，好子息。\n\n丑时中\n生来发达迟，为人最辛苦，财禄随时进，逢喜又逢吉。\n丑时中先克父，衣禄平平，为人心行公道，早年辛苦，末运好，三十八九后发财，兄弟难为，六亲冷淡，离祖可白手兴家。\n\n丑时末\n先克母，为人辛苦，一生大事成，六亲兄弟无力，子息得力，衣禄中平，初年辛苦，四十后发财，末限胜前。\n为人丑时末，一生好风光，财来无克破，学术手艺成。",
+    "寅": "寅时初\n生来遇大耗，二女皆刑吊，床头十文钱，床尾鬼来叫。\n寅时初先克父，为人近贵，凶事成吉，早年劳苦，三十年奔波，三十七岁后好，六亲冷淡，兄弟清疏，子息大用，有子送老。\n\n寅时中\n宅舍好风光，生来大吉祥，一生常快乐，把笔作文章。\n寅时中父母具全，为人作事有权柄，衣禄不亏，六亲有分，兄弟施为，子息二三，为人有志诚不苟。\n\n寅时末\n寅时末事多，身安心又劳，一生多疾厄，小船水上漂。\n寅时末先克母，六亲无力，头子难招，兄弟不和，初年辛苦，三十六岁过发财，末限胜前，衣禄平平，作事进退。",
+    "卯": "卯时初\n卯时初刻生，为人最苦辛，衣食随时度，悲喜送相生。\n卯时初先克母，为人作事有始无终，兄弟少力，六亲难为，宜离祖过房，初年奔波，刑克子息，不真不假送老。\n\n卯时中\n住居大高堂，兄弟有主张，一生享富贵，文武近君王。\n卯时中父母双全，三十年父母在，男人居官，女人有福，一生近贵，女人益夫，六亲兄弟有力，子息不亏，衣禄有余。\n\n卯时末\n时末走途程，辛苦又劳神，晚年时运至，财禄积门庭。\n卯时末先克父，作事本分，初年不遂劳碌奔波，离祖过房，兄弟无靠，自整门风，六亲冷淡，骨肉情疏，末限胜前。",
+    "辰": "辰时初\n衣禄自然来，兄弟六亲林，父母难刑克，晚景更无忧。\n辰时初父母在，为人性急，六亲有力，长子难招，兄弟不和，心慈善，宜手艺营生，初限平平，四十二岁后渐好。\n\n辰时中\n衣禄得人抬，先忧后吉来，六亲虽冷淡，末限足钱财。\n辰时中先克父，为人心行公道，性急直燥，出入有贵人扶持，离祖成家，六亲兄弟情疏，初年不济，末限胜前。\n\n辰时末\n衣禄自然有，朱紫作朝郎，一朝命发达，富贵有名声。\n辰时末先克母，为人聪明，衣禄丰盈，大有声名，六亲大旺，兄分有顾盼，为官头目之称，女命益夫，旺子福禄双全。",
+    "巳": "巳时初\n宅舍好风光，宜早学文章，女命有权柄，男命作朝郎。\n巳时初先克母，为人衣禄有，六亲小力，兄弟难靠，长子难招，夫妻有克，初年奔波，末限大利，女命益夫。\n\n巳时中\n时中无克破，一生积钱财，因公得财物，出外好安排。\n巳时中父母俱全，一生近贵，财禄足用，兄弟有分，子息和顺，作朝郎，师术，头目之分，大事成小，慷慨之命。\n\n巳时末\n要行千里路，心急马行迟，围棋如天火，放下不能知。\n巳时末先克父，为人近贵，做事一成一败，子息难为，六亲冷淡，早年灾晦，辛苦奔波，末限胜前。",
+    "午": "午时初\n午时自有威，出入有人随，一生常受用，上马贵人超。\n午时初父母双全，为人利害近贵，六亲和，兄弟有靠，子息三五枝，衣禄无亏，为官作吏之命。\n\n午时中\n生来不自由，衣禄财少求，奔波忧恼至，浪子度春秋。\n午时中先克父，衣禄平平，辛苦奔波，三十岁后渐渐好，女命益夫，男命先难后易，六亲少力，一成一败之命。\n\n午时末\n妻儿父母忧，财帛不能求，前程虽有分，必是苦中求。\n午时末先克母，为人性急，六亲无靠，兄弟少力，头子难招，聪明伶俐，早年晦气，奔波，末限荣华。",
+    "未": "未时初\n出世好良时，威权自有余，命中身带贵，必到凤凰池。\n未时初父母双全，为人近贵，一生安乐，六亲得意，兄弟无亏，男子头目之命，女人益夫，知轻识重。\n\n未时中\n衣禄自然随，风光小事为，文章须有贵，眼下要维持。\n未时中先克父，一生性宽近贵，六亲少力，兄弟有情，衣禄平平，初年奔波，克首妻，子息难为，末限胜前。\n\n未时末\n财禄随时求，人情好便休，悲忧连一喜，慷慨汝为头。\n未时末先克母，为人一生近贵，衣禄平平，一成一败，初年辛苦，六亲少力，兄弟不和，子息俱硬，末限胜前。",
+    "申": "申时初\n生来命运高，家中多富豪，早登科甲第，麻衣换锦袍。\n申时初父母双全，为人聪明近贵，文武皆通，六亲有禄，兄弟子息有得力，田产广置，女命益夫旺子。\n\n申时中\n却是有名人，亲疏弟没情，自来时运至，依旧败家声。\n申时中先克父，六亲不和，兄弟少力，一忧一喜，初年劳碌奔波晦气，早婚刑克，晚景好，离祖吉。\n\n申时末\n衣禄自然兴，机谋件件能，为人多计较，作事有谋成。\n申时末先克母，兄弟六亲冷淡，早年辛苦，主招破相，三十岁平平，四十后方好，胜前。",
+    "酉": "酉时初\n家舍是光辉，朝中着紫衣，度民连夜喜，文武贵人提。\n酉时初父母双全，一生利官近贵，文武皆知，六亲有靠，兄弟难为，子息可为，头目官之命。\n\n酉时中\n衣禄不为亏，声名报晓鸡，朝夕惭惶泪，且做别人儿。\n酉时中先克父，为人性宽，兄弟不利，长子难招，早年不遂，末限好，男刑妻，女克夫，离祖过房。\n\n酉时末\n衣禄好安排，人情事可谐，为人心性好，作事有时来。\n酉时末先克母，衣禄平常，兄弟少力，初年晦气辛苦，三十七岁发财，夫妻刑克，男子迟能，女子淫乱，克子。",
+    "戌": "戌时初\n慈心行公道，浮财入手来，且有自作力，常得贵人抬。\n戌时初先克母，为人性急心慈，手足不得力，作事有权柄，六亲平常，初年奔波辛苦，三十七八岁发财，衣食好。\n\n戌时中\n平等心无漏，生来本有防，胆有天来大，开口作颠狂。\n戌时中先克父，六亲兄弟少力，夫妻刑克，长子难招，早年奔波劳苦，四十二后渐好，衣禄平平，晚景有旺。\n\n戌时末\n衣禄自安然，平生福自宽，凡事如心意，福享泰锦人。\n戌时末父母双全，为人性急，文武皆通，六亲兄弟有靠，只宜手艺，学术精巧，夫妻偕老，离祖则吉。",
+    "亥": "亥时初\n命带自然有，初运未通，一朝时运至，白手整家风。\n亥时初先克母，为人性宽，六亲少力，手足情疏，子息二三，一生近贵，衣禄平常，初年欠遂，末限胜前。\n\n亥时中\n有事会谋施，生来福自余，心好存公道，衣禄更无亏。\n亥时中父母俱全，为人聪明性急，亲戚平和，兄弟子息有分，女秉男权，末限胜前，兴家之命。\n\n亥时末\n衣禄自难量，男女带克伤，夫妇无良德，二姓子相当\n亥时末先克父，为人性燥心慈，六亲少力，兄弟难为，早年劳苦，男克二妻，女刑三夫，末限好。"
+}
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# CreateDate: 2025-10-30
+"""
+四柱反查索引：由四柱直接查出可能的出生时间区间（bazi.py -b），不必每次用 sxtwl.siZhu2Year 逐年扫描。
+
+一天按时柱分成 13 段：早子 0-1 点、丑 1-3 点……亥 21-23 点、晚子 23-24 点（日柱不换、时干按次日日干起）。
+索引的键为 ((年柱 × 12 + 月支) × 60 + 日柱) × 13 + 时段，月干、时干分别由五虎遁、五鼠遁定出，
+不合的四柱不必查表，key() 直接返回 None。每条记录是一个 u32：(距起始日的天数 × 13 + 时段)，
+同一个键的记录按时间排序连续存放。交节时刻落在某段中间时，这一段前后两部分分属两个月柱，
+各记一条，查询时再按交节时刻截断（交节时刻存在文件头里）。
+
+生成：python pillarindex.py [--output FILE] [--start 1600] [--end 2200]
+默认写到本目录的 pillars.idx（可用环境变量 BAZI_PILLAR_INDEX 指定），1600-2200 年约 14 MB。文件格式：
+    b'BZPINDEX' | 版本 u32 | 头长度 u32 | zlib 压缩的 JSON 头 | 偏移表 (键数 + 1) × u32 | 记录 × u32
+文件以 mmap 只读打开，查一组四柱只读偏移表的两项；按年份范围过滤时在记录上二分，结果可分页取。
+查询：python pillarindex.py --lookup 庚午 壬午 癸卯 壬子 [--offset N] [--limit N]
+"""
+
+import array
+import bisect
+import datetime
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+import zlib
+
+from lunar_python import Solar
+
+import rectify
+from ganzhi import jiazi_ids, gan_ids, zhi_ids
+from pillartable import month_gan, hour_gan
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+INDEX_ENV = 'BAZI_PILLAR_INDEX'
+_MAGIC = b'BZPINDEX'
+_VERSION = 1
+_HEADER = struct.Struct('<8sII')
+
+SLOTS = 13
+LATE_ZI = 12                # 晚子
+KEYS = 60 * 12 * 60 * SLOTS
+# 各时段在一天中的起止（秒）
+SLOT_SPANS = tuple((0, 3600) if slot == 0 else (82800, 86400) if slot == LATE_ZI
+                   else (slot * 7200 - 3600, slot * 7200 + 3600) for slot in range(SLOTS))
+_DAY = 86400
+
+
+def key(year, month, day, time):
+    """四柱（每柱两个字的干支）-> 索引键；不合五虎遁、五鼠遁或不是干支时为 None。"""
+    try:
+        year_id, day_id = jiazi_ids[year], jiazi_ids[day]
+        month_zhi, hour_zhi = zhi_ids[month[1]], zhi_ids[time[1]]
+        month_ok = gan_ids[month[0]] == month_gan(year_id % 10, month_zhi)
+        time_gan = gan_ids[time[0]]
+    except (KeyError, IndexError, TypeError):
+        return None
+    if not month_ok:
+        return None
+    if time_gan == hour_gan(day_id % 10, hour_zhi):
+        slot = hour_zhi
+    elif hour_zhi == 0 and time_gan == hour_gan(day_id % 10 + 1, 0):
+        slot = LATE_ZI
+    else:
+        return None
+    return ((year_id * 12 + month_zhi) * 60 + day_id) * SLOTS + slot
+
+
+def valid(year, month, day, time=None):
+    """四柱是否合五虎遁、五鼠遁（晚子时时干按次日日干起也算合）；time 为 None 时只查年、月、日柱。"""
+    if time is not None:
+        return key(year, month, day, time) is not None
+    try:
+        return day in jiazi_ids and gan_ids[month[0]] == month_gan(jiazi_ids[year] % 10, zhi_ids[month[1]])
+    except (KeyError, IndexError, TypeError):
+        return False
+
+
+def _pillar_ids(moment):
+    """moment 时刻的 (年柱, 月柱) 六十甲子编号。"""
+    ba = Solar.fromYmdHms(moment.year, moment.month, moment.day,
+                          moment.hour, moment.minute, moment.second).getLunar().getEightChar()
+    return jiazi_ids[ba.getYear()], jiazi_ids[ba.getMonth()]
+
+
+def build_index(path=None, start=1600, end=2200):
+    """算出 start 年 1 月 1 日至 end 年 12 月 31 日的反查索引并写入 path，返回文件名。"""
+    path = index_path() if path is None else path
+    base = datetime.datetime(start, 1, 1)
+    days = (datetime.date(end + 1, 1, 1) - base.date()).days
+    # 交节时刻（距 base 的秒数）与交节后的年柱、月柱；第一项为 base 之前最近的一个节
+    moments = sorted({moment for year in range(start - 1, end + 2) for moment in rectify.jie_times(year)})
+    first = bisect.bisect_right(moments, base) - 1
+    moments = [moment for moment in moments[first:] if moment.year <= end + 1]
+    jie = [int((moment - base).total_seconds()) for moment in moments]
+    year_id, month_id = _pillar_ids(moments[0])
+    pillars = []
+    for index in range(len(moments)):
+        if index:
+            month_id = (month_id + 1) % 60
+            if month_id % 12 == 2:          # 立春换年柱
+                year_id = (year_id + 1) % 60
+        pillars.append((year_id, month_id))
+    day0 = jiazi_ids[Solar.fromYmd(start, 1, 1).getLunar().getDayInGanZhi()]
+
+    keys = array.array('I')
+    records = array.array('I')
+    current = 0
+    for day in range(days):
+        day_id = (day0 + day) % 60
+        for slot, (begin, stop) in enumerate(SLOT_SPANS):
+            begin += day * _DAY
+            stop += day * _DAY
+            while current + 1 < len(jie) and jie[current + 1] <= begin:
+                current += 1
+            parts = [current]
+            if current + 1 < len(jie) and jie[current + 1] < stop:
+                parts.append(current + 1)
+            for part in parts:
+                year_id, month_id = pillars[part]
+                keys.append(((year_id * 12 + month_id % 12) * 60 + day_id) * SLOTS + slot)
+                records.append(day * SLOTS + slot)
+
+    # 按键计数排序，同一键内保持时间顺序
+    offsets = array.array('I', bytes(4 * (KEYS + 1)))
+    for item in keys:
+        offsets[item + 1] += 1
+    for item in range(KEYS):
+        offsets[item + 1] += offsets[item]
+    position = array.array('I', offsets[:-1])
+    ordered = array.array('I', bytes(4 * len(records)))
+    for item, record in zip(keys, records):
+        ordered[position[item]] = record
+        position[item] += 1
+
+    head = zlib.compress(json.dumps({
+        'start': start, 'end': end, 'jie': jie, 'month_zhi': [month_id % 12 for year_id, month_id in pillars],
+    }, separators=(',', ':')).encode('utf-8'), 9)
+    if sys.byteorder != 'little':
+        offsets.byteswap()
+        ordered.byteswap()
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, len(head)))
+        f.write(head)
+        f.write(offsets.tobytes())
+        f.write(ordered.tobytes())
+    os.replace(tmp, path)
+    return path
+
+
+class PillarIndex:
+    """pillars.idx 的只读视图：count/lookup 按四柱取出生时间区间。"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, size = _HEADER.unpack_from(self._map)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("not a pillar index: {}".format(path))
+        head = json.loads(zlib.decompress(self._map[_HEADER.size:_HEADER.size + size]))
+        self.start = head['start']
+        self.end = head['end']
+        self.base = datetime.datetime(self.start, 1, 1)
+        self._jie = head['jie']
+        self._month_zhi = head['month_zhi']
+        begin = _HEADER.size + size
+        words = memoryview(self._map)[begin:]
+        if sys.byteorder != 'little':
+            # mmap 的内容按小端存放，大端机器上先拷贝一份转换
+            words = array.array('I', words)
+            words.byteswap()
+            words = memoryview(words)
+        words = words.cast('I')
+        self._offsets = words[:KEYS + 1]
+        self._records = words[KEYS + 1:]
+
+    def covers(self, start, end):
+        """索引是否覆盖 start 至 end 年。"""
+        return self.start <= start and end <= self.end
+
+    def _range(self, code, start=None, end=None):
+        """code 的记录在 _records 中的 [起, 止)；start/end 为年份（含）时只取其间的。"""
+        first, last = self._offsets[code], self._offsets[code + 1]
+        if start is not None and start > self.start:
+            day = (datetime.date(start, 1, 1) - self.base.date()).days
+            first = bisect.bisect_left(self._records, day * SLOTS, first, last)
+        if end is not None and end < self.end:
+            day = (datetime.date(end + 1, 1, 1) - self.base.date()).days
+            last = bisect.bisect_left(self._records, day * SLOTS, first, last)
+        return first, last
+
+    def count(self, year, month, day, time, start=None, end=None):
+        code = key(year, month, day, time)
+        if code is None:
+            return 0
+        first, last = self._range(code, start, end)
+        return last - first
+
+    def lookup(self, year, month, day, time, start=None, end=None, offset=0, limit=None):
+        """四柱对应的出生时间区间 [(起, 止)]（datetime，含起不含止），按时间排序。
+
+        start/end 为年份（含）时只取其间的；offset/limit 用于分页。不合五虎遁、五鼠遁时为空。
+        """
+        code = key(year, month, day, time)
+        if code is None:
+            return []
+        month_zhi = code // SLOTS // 60 % 12
+        first, last = self._range(code, start, end)
+        first += offset
+        if limit is not None:
+            last = min(last, first + limit)
+        ranges = []
+        for record in self._records[first:last]:
+            day, slot = divmod(record, SLOTS)
+            begin, stop = SLOT_SPANS[slot]
+            begin += day * _DAY
+            stop += day * _DAY
+            # 这一段中间交节时只取月支相符的一边
+            index = bisect.bisect_right(self._jie, begin)
+            if index < len(self._jie) and self._jie[index] < stop:
+                if self._month_zhi[index] == month_zhi:
+                    begin = self._jie[index]
+                else:
+                    stop = self._jie[index]
+            ranges.append((self.base + datetime.timedelta(seconds=begin),
+                           self.base + datetime.timedelta(seconds=stop)))
+        return ranges
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def index_path():
+    return os.environ.get(INDEX_ENV) or os.path.join(_HERE, 'pillars.idx')
+
+
+def open_index(path=None):
+    """path（默认 index_path()）对应的 PillarIndex；没有文件或文件无效时为 None。"""
+    path = index_path() if path is None else path
+    with _indexes_lock:
+        if path not in _indexes:
+            try:
+                _indexes[path] = PillarIndex(path)
+            except (OSError, ValueError, KeyError, struct.error, zlib.error):
+                _indexes[path] = None
+    return _indexes[path]
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description=u'生成四柱反查索引，或按四柱查可能的出生时间')
+    parser.add_argument('--output', metavar='FILE', default=None,
+                        help=u'索引文件，默认 %s 或本目录的 pillars.idx' % INDEX_ENV)
+    parser.add_argument('--start', type=int, default=1600, help=u'起始年（含）')
+    parser.add_argument('--end', type=int, default=2200, help=u'结束年（含）')
+    parser.add_argument('--lookup', nargs=4, metavar='PILLAR', help=u'按四柱查询，如 庚午 壬午 癸卯 壬子')
+    parser.add_argument('--offset', type=int, default=0, help=u'查询结果跳过的条数')
+    parser.add_argument('--limit', type=int, default=None, help=u'查询结果最多条数')
+    options = parser.parse_args(argv)
+    if options.lookup:
+        if not valid(*options.lookup):
+            parser.error(u"四柱不合五虎遁、五鼠遁")
+        index = open_index(options.output)
+        if index is None:
+            parser.error("no pillar index at {}; run python pillarindex.py first".format(options.output or index_path()))
+        total = index.count(*options.lookup, options.start, options.end)
+        for begin, stop in index.lookup(*options.lookup, options.start, options.end, options.offset, options.limit):
+            print(begin, stop)
+        print("total", total)
+        return
+    path = build_index(options.output, options.start, options.end)
+    print(path, os.path.getsize(path))
+
+
+if __name__ == '__main__':
+    main()
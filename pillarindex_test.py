@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+核对四柱反查索引（pillarindex）：随机取真实命盘，索引查出的区间含出生时刻，且与 sxtwl.siZhu2Year
+逐年扫描的结果相同，只有下面两类已知的差别：
+
+- 晚子（23-24 点）：索引按 lunar_python 的排法，日柱不换、时干按次日日干起；sxtwl 的时干仍按当日
+  日干起，这样的四柱在 sxtwl 中查不到，索引中 23 点起的区间 sxtwl 都没有。
+- 交节当天：交节时刻落在某个时辰中间时，索引的区间从交节那一秒起（或止于交节），sxtwl 给的是
+  时辰的起点；交节当天 sxtwl 还常漏掉交节前后的时辰。
+
+随机取的 300 个命盘中有 11 个不同（晚子 10 个、交节当天 1 个），另取的 100 个交节前后的命盘
+中交节当天的差别更多，都属于这两类。
+
+python pillarindex_test.py 或 python -m pytest -q pillarindex_test.py
+"""
+
+import datetime
+import os
+import random
+import sys
+import tempfile
+sys.path.append('.')
+
+import sxtwl
+
+import pillarindex
+import rectify
+from ganzhi import getGZ
+
+START, END = 1940, 2000
+
+
+def _pillars(moment):
+    ba = rectify.eight_char(moment)
+    return ba.getYear(), ba.getMonth(), ba.getDay(), ba.getTime()
+
+
+def _sxtwl_starts(pillars):
+    starts = []
+    for jd in sxtwl.siZhu2Year(*[getGZ(item) for item in pillars], START, END):
+        t = sxtwl.JD2DD(jd)
+        starts.append(datetime.datetime(t.Y, t.M, t.D, int(t.h), int(t.m)) + datetime.timedelta(seconds=round(t.s)))
+    return starts
+
+
+def _within(moment):
+    # sxtwl 按年柱取年份范围，首尾两年立春前后的部分与索引不同，只比较中间的年份
+    return START < moment.year < END
+
+
+def _moments(rng):
+    """300 个随机时刻，另取 100 个交节前后半天内的时刻。"""
+    span = int((datetime.datetime(END, 1, 1) - datetime.datetime(START + 1, 1, 1)).total_seconds())
+    moments = [datetime.datetime(START + 1, 1, 1) + datetime.timedelta(seconds=rng.randrange(span))
+               for _ in range(300)]
+    for _ in range(100):
+        moment = rng.choice(rectify.jie_times(rng.randint(START + 2, END - 2)))
+        moments.append(moment + datetime.timedelta(seconds=rng.randint(-43200, 43200)))
+    return moments
+
+
+def test_index_matches_sxtwl():
+    jie_days = {moment.date() for year in range(START - 1, END + 2) for moment in rectify.jie_times(year)}
+    counts = {'晚子': 0, '交节当天': 0}
+    random_charts = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        index = pillarindex.PillarIndex(pillarindex.build_index(os.path.join(tmp, 'pillars.idx'), START, END))
+        for number, moment in enumerate(_moments(random.Random(24))):
+            pillars = _pillars(moment)
+            ranges = index.lookup(*pillars)
+            assert any(begin <= moment < stop for begin, stop in ranges), (moment, pillars)
+            ours = [begin for begin, stop in ranges if _within(begin)]
+            theirs = [begin for begin in _sxtwl_starts(pillars) if _within(begin)]
+            if ours == theirs:
+                continue
+            for begin in set(ours) ^ set(theirs):
+                assert begin.hour == 23 or begin.date() in jie_days, (moment, pillars, ours, theirs)
+            counts['晚子' if moment.hour == 23 else '交节当天'] += 1
+            if number < 300:
+                random_charts += 1
+    print("differences: {} of 300 random charts, {}".format(random_charts, counts))
+    assert counts['晚子'] and counts['交节当天'] and random_charts < 30, counts
+
+
+if __name__ == '__main__':
+    test_index_matches_sxtwl()
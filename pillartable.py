@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# CreateDate: 2025-10-30
+"""
+四柱全表：离线算好每一组合法四柱、每个性别的报告中与出生时刻无关的部分（见 bazi.CachedChart），
+排盘时按命盘编号直接取出，只需再算公历/农历、大运岁数、流年等与出生时刻有关的部分。
+
+月干由年干按五虎遁定出，时干由日干按五鼠遁定出，所以合法的四柱只有
+60（年柱）× 12（月支）× 60（日柱）× 12（时支）= 518400 组，男女各一份。命盘编号：
+    ((性别 × 60 + 年柱) × 12 + 月支) × 60 + 日柱) × 12 + 时支
+不合五虎遁、五鼠遁的四柱（如晚子时按次日起时干）不在表中，照常计算。
+
+生成：python pillartable.py [--output FILE] [--jobs N] [--year 甲子 ...]
+默认写到本目录的 pillars.pack（可用环境变量 BAZI_PILLARS 指定）。按 (性别, 年柱) 分成
+120 块，由多个进程分别计算，每块先写到 FILE.parts/ 下；中断后再运行只算缺的块，
+全部块齐了（或用 --year 只算其中几个年柱）再拼成一个文件。文件格式：
+    b'BZPILLAR' | 版本 u32 | 头长度 u32 | zlib 压缩的 JSON 头 | 偏移表 (N+1) × u64 | 各条目的 zlib 块
+头里记录生成时的规则、数据版本（bazi.data_version），各部分名，共用字符串表和 zlib 预设字典。
+条目里出现在字符串表中的文字只记编号，其余文字照录，再以预设字典压缩，平均每条约 0.7 KB。
+文件以 mmap 只读打开，多个进程共享页缓存；版本与当前代码不符时不使用。
+"""
+
+import base64
+import collections
+import json
+import mmap
+import os
+import random
+import struct
+import threading
+import zlib
+
+from ganzhi import Gan, Zhi, jiazis, jiazi_ids, gan_ids, zhi_ids
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+TABLE_ENV = 'BAZI_PILLARS'
+_MAGIC = b'BZPILLAR'
+_VERSION = 1
+_HEADER = struct.Struct('<8sII')
+_OFFSET = struct.Struct('<Q')
+
+UNIT = 12 * 60 * 12         # 同一性别、同一年柱的命盘数
+COUNT = 2 * 60 * UNIT
+SAMPLE = 4000               # 生成字符串表和预设字典时抽样的命盘数
+
+
+def month_gan(year_gan, month_zhi):
+    """五虎遁：甲己之年丙作首。子、丑两月在年末，排在寅月之后。"""
+    return (year_gan % 5 * 2 + 2 + (month_zhi - 2) % 12) % 10
+
+
+def hour_gan(day_gan, hour_zhi):
+    """五鼠遁：甲己还加甲。"""
+    return (day_gan % 5 * 2 + hour_zhi) % 10
+
+
+def pillars(code):
+    """命盘编号 -> (年柱, 月柱, 日柱, 时柱, 是否为女)。"""
+    code, hour = divmod(code, 12)
+    code, day = divmod(code, 60)
+    code, month = divmod(code, 12)
+    female, year = divmod(code, 60)
+    year_gan, day_gan = year % 10, day % 10
+    return (jiazis[year], Gan[month_gan(year_gan, month)] + Zhi[month],
+            jiazis[day], Gan[hour_gan(day_gan, hour)] + Zhi[hour], bool(female))
+
+
+def chart_code(key):
+    """bazi.Chart.key（如 '壬戌 癸卯 乙未 丙戌 男'）-> 命盘编号；不合五虎遁、五鼠遁时为 None。"""
+    try:
+        year, month, day, time, sex = key.split()
+        year_id, day_id = jiazi_ids[year], jiazi_ids[day]
+        month_zhi, hour_zhi = zhi_ids[month[1]], zhi_ids[time[1]]
+        if (gan_ids[month[0]] != month_gan(year_id % 10, month_zhi)
+                or gan_ids[time[0]] != hour_gan(day_id % 10, hour_zhi)):
+            return None
+    except (KeyError, ValueError, IndexError):
+        return None
+    female = 1 if sex == '女' else 0
+    return (((female * 60 + year_id) * 12 + month_zhi) * 60 + day_id) * 12 + hour_zhi
+
+
+def _pack(data, ids):
+    """{'sections': {名: 片段}, 'result': {...}} -> 未压缩的 JSON；片段 (文字, 结尾, 是否清洗)
+    为默认的 ('...', '\\n', True) 时只记文字，文字在字符串表中时只记编号。"""
+    sections = []
+    for parts in data['sections'].values():
+        row = []
+        for text, end, clean in parts:
+            text = ids.get(text, text)
+            row.append(text if end == '\n' and clean else [text, end, int(clean)])
+        sections.append(row)
+    return json.dumps([sections, data['result']], ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _encode(data, ids, zdict):
+    compressor = zlib.compressobj(9, zdict=zdict)
+    return compressor.compress(_pack(data, ids)) + compressor.flush()
+
+
+def _decode(block, names, strings, zdict):
+    decompressor = zlib.decompressobj(zdict=zdict)
+    sections, result = json.loads(decompressor.decompress(block) + decompressor.flush())
+
+    def text(item):
+        return strings[item] if isinstance(item, int) else item
+
+    data = {}
+    for name, row in zip(names, sections):
+        data[name] = tuple((text(item[0]), item[1], bool(item[2])) if isinstance(item, list)
+                           else (text(item), '\n', True) for item in row)
+    return {'sections': data, 'result': result}
+
+
+class PillarTable:
+    """pillars.pack 的只读视图，get(key) 与 SQLiteCache 一样按 Chart.key 取值。"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, size = _HEADER.unpack_from(self._map)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("not a pillar table: {}".format(path))
+        head = json.loads(zlib.decompress(self._map[_HEADER.size:_HEADER.size + size]))
+        self.version = head['version']
+        self.names = head['sections']
+        self.strings = head['strings']
+        self.zdict = base64.b64decode(head['zdict'])
+        self.count = head['count']
+        self._offsets = _HEADER.size + size
+        self._base = self._offsets + (self.count + 1) * _OFFSET.size
+        self.hits = 0
+        self.misses = 0
+
+    def _block(self, code):
+        start, = _OFFSET.unpack_from(self._map, self._offsets + code * _OFFSET.size)
+        end, = _OFFSET.unpack_from(self._map, self._offsets + (code + 1) * _OFFSET.size)
+        return self._map[self._base + start:self._base + end]
+
+    def get(self, key, default=None):
+        """{'sections': {名: 片段}, 'result': {...}}；不在表中时返回 default。"""
+        code = chart_code(key)
+        block = self._block(code) if code is not None and code < self.count else b''
+        if not block:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return _decode(block, self.names, self.strings, self.zdict)
+
+    def as_dict(self):
+        return {"path": self.path, "hits": self.hits, "misses": self.misses}
+
+
+_tables = {}
+_tables_lock = threading.Lock()
+
+
+def table_path():
+    return os.environ.get(TABLE_ENV) or os.path.join(_HERE, 'pillars.pack')
+
+
+def open_table(version, path=None):
+    """path（默认 table_path()）对应的 PillarTable；没有文件、文件无效或版本不符时为 None。"""
+    path = table_path() if path is None else path
+    with _tables_lock:
+        if path not in _tables:
+            try:
+                table = PillarTable(path)
+            except (OSError, ValueError, KeyError, struct.error, zlib.error):
+                table = None
+            _tables[path] = table if table is not None and table.version == version else None
+    return _tables[path]
+
+
+# ---- 生成 ----
+
+def _render(code):
+    import bazi
+    year, month, day, time, female = pillars(code)
+    chart = bazi.Chart.from_pillars(year, month, day, time, female=female)
+    entry = bazi.cached_chart(chart)
+    return {'sections': entry.sections, 'result': entry.result._asdict()}
+
+
+def _sample():
+    """抽样命盘，取出现两次以上的文字作字符串表，再以样本条目的 JSON 末尾 32 KB 作预设字典。"""
+    rng = random.Random(0)
+    samples = [_render(rng.randrange(COUNT)) for _ in range(SAMPLE)]
+    counts = collections.Counter()
+    for data in samples:
+        for parts in data['sections'].values():
+            counts.update(text for text, end, clean in parts)
+    strings = sorted(text for text, n in counts.items() if n >= 2)
+    ids = {text: seq for seq, text in enumerate(strings)}
+    zdict = b''.join(_pack(data, ids) for data in samples[:64])[-32768:]
+    return strings, zdict
+
+
+def _unit_path(parts, unit):
+    return os.path.join(parts, '{:03d}.part'.format(unit))
+
+
+def _build_unit(job):
+    """计算一块（同一性别、同一年柱）写到 .part：块数 u32 | 偏移 (UNIT+1) × u64 | 各块。"""
+    parts, unit, strings, zdict = job
+    ids = {text: seq for seq, text in enumerate(strings)}
+    blocks = [_encode(_render(unit * UNIT + seq), ids, zdict) for seq in range(UNIT)]
+    path = _unit_path(parts, unit)
+    with open(path + '.tmp', 'wb') as f:
+        f.write(struct.pack('<I', UNIT))
+        offset = 0
+        for block in blocks:
+            f.write(_OFFSET.pack(offset))
+            offset += len(block)
+        f.write(_OFFSET.pack(offset))
+        for block in blocks:
+            f.write(block)
+    os.replace(path + '.tmp', path)
+    return unit
+
+
+def _read_unit(path):
+    """.part 文件 -> (偏移列表, 各块拼成的 bytes)。"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    count, = struct.unpack_from('<I', data)
+    base = 4 + (count + 1) * _OFFSET.size
+    offsets = [_OFFSET.unpack_from(data, 4 + seq * _OFFSET.size)[0] for seq in range(count + 1)]
+    return offsets, data[base:]
+
+
+def build(path=None, jobs=None, years=None, log=print):
+    """生成四柱全表，返回文件名。years 为年柱列表时只算这些年柱（两个性别）。"""
+    import bazi
+    import multiprocessing
+    path = table_path() if path is None else path
+    parts = path + '.parts'
+    os.makedirs(parts, exist_ok=True)
+    version = bazi.data_version()
+    names = [name for name, func in bazi.SECTIONS if name not in bazi.TIME_SECTIONS]
+
+    # 规则、数据改动后之前算好的块作废
+    meta_path = os.path.join(parts, 'meta.json')
+    meta = None
+    if os.path.exists(meta_path):
+        with open(meta_path, encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta['version'] != version or meta['sections'] != names:
+            for filename in os.listdir(parts):
+                os.remove(os.path.join(parts, filename))
+            meta = None
+    if meta is None:
+        log('sampling {} charts for the string table'.format(SAMPLE))
+        strings, zdict = _sample()
+        meta = {'version': version, 'sections': names, 'strings': strings,
+                'zdict': base64.b64encode(zdict).decode('ascii')}
+        with open(meta_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(meta_path + '.tmp', meta_path)
+    strings, zdict = meta['strings'], base64.b64decode(meta['zdict'])
+
+    year_ids = range(60) if years is None else [jiazi_ids[item] for item in years]
+    units = [female * 60 + year for female in (0, 1) for year in year_ids]
+    todo = [unit for unit in units if not os.path.exists(_unit_path(parts, unit))]
+    log('{} of {} units to compute'.format(len(todo), len(units)))
+    with multiprocessing.Pool(jobs) as pool:
+        jobs_ = [(parts, unit, strings, zdict) for unit in todo]
+        for done, unit in enumerate(pool.imap_unordered(_build_unit, jobs_), 1):
+            log('unit {} done ({}/{})'.format(unit, done, len(todo)))
+
+    # 拼成一个文件；没算的块偏移不变（长度为 0）
+    head = zlib.compress(json.dumps({
+        'version': version, 'sections': names, 'count': COUNT,
+        'strings': strings, 'zdict': meta['zdict']}, ensure_ascii=False).encode('utf-8'), 9)
+    present = [unit for unit in range(2 * 60) if os.path.exists(_unit_path(parts, unit))]
+    with open(path + '.tmp', 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, len(head)))
+        f.write(head)
+        offset = 0
+        for unit in range(2 * 60):
+            if unit in present:
+                offsets, blob = _read_unit(_unit_path(parts, unit))
+                f.write(b''.join(_OFFSET.pack(offset + item) for item in offsets[:-1]))
+                offset += len(blob)
+            else:
+                f.write(_OFFSET.pack(offset) * UNIT)
+        f.write(_OFFSET.pack(offset))
+        for unit in present:
+            f.write(_read_unit(_unit_path(parts, unit))[1])
+    os.replace(path + '.tmp', path)
+    return path
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description=u'离线生成四柱全表，排盘时按四柱直接取出与出生时刻无关的部分')
+    parser.add_argument('--output', metavar='FILE', default=None,
+                        help=u'输出文件，默认 %s 或本目录的 pillars.pack' % TABLE_ENV)
+    parser.add_argument('--jobs', type=int, default=None, help=u'进程数，默认为 CPU 数')
+    parser.add_argument('--year', action='append', metavar='GANZHI',
+                        help=u'只算这些年柱（可重复），如 --year 甲子；其余命盘不在表中')
+    options = parser.parse_args(argv)
+    path = build(options.output, options.jobs, options.year)
+    print(path, os.path.getsize(path))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+核对四柱全表的命盘编号：chart_code 接受每一张真实命盘，pillars 还原出的四柱与 lunar_python 相同。
+子、丑两月在年末（五虎遁排在寅月之后），单独多抽一些。
+
+python pillartable_test.py 或 python -m pytest -q pillartable_test.py
+"""
+
+import datetime
+import random
+import sys
+sys.path.append('.')
+
+from lunar_python import Solar
+
+from pillartable import chart_code, pillars
+
+
+def _eight_char(moment):
+    solar = Solar.fromYmdHms(moment.year, moment.month, moment.day, moment.hour, moment.minute, 0)
+    return solar.getLunar().getEightChar()
+
+
+def _check(moments):
+    bad = []
+    for moment in moments:
+        ba = _eight_char(moment)
+        real = (ba.getYear(), ba.getMonth(), ba.getDay(), ba.getTime())
+        for sex in ('男', '女'):
+            code = chart_code(' '.join(real) + ' ' + sex)
+            if code is None or pillars(code) != real + (sex == '女',):
+                bad.append((moment, real, sex, code))
+    return bad
+
+
+def test_zi_chou_months():
+    """12 月 8 日至次年 2 月 3 日（子、丑月）的命盘。晚子时时干按次日起，不在表中，不抽。"""
+    rng = random.Random(19)
+    moments = []
+    for year in range(1850, 2100, 5):
+        start = datetime.datetime(year, 12, 8)
+        for _ in range(8):
+            moment = start + datetime.timedelta(minutes=rng.randrange(57 * 24 * 60))
+            if moment.hour != 23:
+                moments.append(moment)
+    bad = _check(moments)
+    assert not bad, bad[:5]
+    print("OK: {} charts in 子/丑 months".format(len(moments)))
+
+
+def test_all_months():
+    rng = random.Random(20)
+    moments = []
+    while len(moments) < 600:
+        moment = datetime.datetime(1850, 1, 1) + datetime.timedelta(minutes=rng.randrange(250 * 365 * 24 * 60))
+        if moment.hour != 23:
+            moments.append(moment)
+    bad = _check(moments)
+    assert not bad, bad[:5]
+    print("OK: {} charts in all months".format(len(moments)))
+
+
+if __name__ == '__main__':
+    test_zi_chou_months()
+    test_all_months()
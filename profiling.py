@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# CreateDate: 2025-10-30
+"""
+在 cProfile 下排盘并写出两个文件：
+    <prefix>.pstats     供 pstats、snakeviz 等查看
+    <prefix>.collapsed  折叠栈文本（"a;b;c 微秒"），flamegraph.pl、speedscope 可直接读取
+
+cProfile 只记录 调用者 -> 被调用者 的边，没有完整调用栈。折叠栈按每条边的
+累计时间占比，把被调用函数的时间分摊到各条调用路径上；递归在路径上第一次
+重复处截断，小于 1 微秒的分支不再展开。
+"""
+
+import cProfile
+import collections
+import contextlib
+import os
+import pstats
+import threading
+
+
+def _label(func):
+    filename, lineno, name = func
+    if filename == '~':
+        return name     # 内建函数，如 <method 'join' of 'str' objects>
+    return '{}:{}'.format(os.path.basename(filename), name)
+
+
+def collapsed_stacks(stats):
+    """由 pstats.Stats 推出折叠栈：{"a;b;c": 自身耗时（微秒）}。"""
+    raw = stats.stats
+    children = collections.defaultdict(list)
+    for func, (cc, nc, tt, ct, callers) in raw.items():
+        for caller, edge in callers.items():
+            children[caller].append((func, edge[3]))
+    stacks = collections.Counter()
+
+    def walk(func, path, total):
+        # total 为这条路径上 func 的累计耗时（秒），按比例分给自身和各个子调用
+        tt, ct = raw[func][2], raw[func][3]
+        scale = total / ct if ct else 0.0
+        path = path + (func,)
+        if tt * scale > 0:
+            stacks[';'.join(_label(item) for item in path)] += tt * scale
+        for child, edge_ct in children[func]:
+            if child not in path and edge_ct * scale >= 1e-6:
+                walk(child, path, edge_ct * scale)
+
+    for func, row in raw.items():
+        if not row[4]:
+            walk(func, (), row[3])
+    return {stack: int(round(seconds * 1e6)) for stack, seconds in stacks.items()
+            if seconds >= 0.5e-6}
+
+
+def _prefix(path):
+    root, ext = os.path.splitext(path)
+    return root if ext in ('.pstats', '.prof', '.collapsed') else path
+
+
+def write_profile(profiler, path):
+    """写出 .pstats 与 .collapsed，返回两个文件名。path 可带或不带扩展名。"""
+    prefix = _prefix(path)
+    os.makedirs(os.path.dirname(prefix) or '.', exist_ok=True)
+    stats = pstats.Stats(profiler)
+    stats.dump_stats(prefix + '.pstats')
+    with open(prefix + '.collapsed', 'w', encoding='utf-8') as f:
+        for stack, micros in sorted(collapsed_stacks(stats).items()):
+            f.write('{} {}\n'.format(stack, micros))
+    return prefix + '.pstats', prefix + '.collapsed'
+
+
+# 同一时刻只能有一个 cProfile 在运行，多个线程的 profiled 依次进行
+_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def profiled(path):
+    """with profiled('out/chart'): ...  在 cProfile 下运行代码块，结束时写出结果。
+
+    多个线程同时进入时逐个运行（后来的等前一个写完），各自的结果不混在一起；不可嵌套。
+    """
+    with _lock:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield profiler
+        finally:
+            profiler.disable()
+            write_profile(profiler, path)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# CreateDate: 2025-10-30
+"""
+出生时间校正：在一段公历时间内找出四柱变化的确切时刻，列出其中可能的各个命盘及对应的时间区间。
+
+四柱只在以下时刻变化（lunar_python 的 EightChar，与 bazi.py 相同）：
+    年柱  立春交节时刻（精确到秒）
+    月柱  各节（立春、惊蛰……小寒）交节时刻（精确到秒）
+    日柱  每天 0 点（晚子时日柱不换）
+    时柱  每个奇数点整（23 点起为子时，时干按次日日干起）
+因此不必逐分钟排盘：各节时刻按年取自节气表，排序后二分查找落在时间段内的；再加上整点边界，
+切成若干区间，每个区间只在起点排一次盘，四柱相同的相邻区间合并。
+
+大运顺逆随年干阴阳与性别而定；起运时间随出生时刻与前后节的距离连续变化，
+每个区间给出起点和终点（前一秒）两处的上运日期。
+
+用法：python rectify.py "1990-02-04 08:00" "1990-02-04 20:00" [-n] [--format json]
+"""
+
+import argparse
+import bisect
+import collections
+import datetime
+import json
+
+from lunar_python import Lunar, Solar
+
+# 交节即换月柱的“节”；节气表中下一年的几个节以拼音为键
+_JIE = frozenset(Lunar.JIE_QI_IN_USE[::2])
+_SECOND = datetime.timedelta(seconds=1)
+
+# 一个区间：[start, end) 内出生的命盘都相同；forward 为大运是否顺排，yun 为起点、终点的上运日期
+Interval = collections.namedtuple("Interval", "start end pillars forward yun")
+
+_jie_times = {}
+
+
+def _datetime(solar):
+    return datetime.datetime(solar.getYear(), solar.getMonth(), solar.getDay(),
+                             solar.getHour(), solar.getMinute(), solar.getSecond())
+
+
+def jie_times(year):
+    """year 年节气表中各节的交节时刻（已排序），前后跨到上一年大雪、下一年惊蛰。"""
+    times = _jie_times.get(year)
+    if times is None:
+        table = Lunar.fromYmd(year, 1, 1).getJieQiTable()
+        times = _jie_times[year] = sorted(_datetime(solar) for name, solar in table.items() if name in _JIE)
+    return times
+
+
+def boundaries(start, end):
+    """(start, end) 内四柱可能变化的时刻，已排序：各节交节时刻加上 0 点与奇数点整。"""
+    times = set()
+    for year in range(start.year - 1, end.year + 1):
+        jie = jie_times(year)
+        times.update(jie[bisect.bisect_right(jie, start):bisect.bisect_left(jie, end)])
+    hour = start.replace(minute=0, second=0, microsecond=0) + datetime.timedelta(hours=1)
+    while hour < end:
+        if hour.hour == 0 or hour.hour % 2:
+            times.add(hour)
+        hour += datetime.timedelta(hours=1)
+    return sorted(times)
+
+
+def eight_char(moment):
+    solar = Solar.fromYmdHms(moment.year, moment.month, moment.day, moment.hour, moment.minute, moment.second)
+    return solar.getLunar().getEightChar()
+
+
+def scan(start, end, female=False):
+    """[start, end) 内的命盘区间 [Interval]，按时间排序；四柱相同的相邻区间已合并。"""
+    gender = 0 if female else 1
+    cuts = [start] + boundaries(start, end) + [end]
+    intervals = []
+    for begin, stop in zip(cuts, cuts[1:]):
+        ba = eight_char(begin)
+        pillars = (ba.getYear(), ba.getMonth(), ba.getDay(), ba.getTime())
+        if intervals and intervals[-1].pillars == pillars:
+            intervals[-1] = intervals[-1]._replace(end=stop)
+            continue
+        yun = ba.getYun(gender)
+        intervals.append(Interval(begin, stop, pillars, yun.isForward(), _datetime(yun.getStartSolar())))
+    # 上运日期：区间起点已算，再补终点前一秒的
+    return [item._replace(yun=(item.yun, _datetime(eight_char(item.end - _SECOND).getYun(gender).getStartSolar())))
+            for item in intervals]
+
+
+def charts(intervals):
+    """按命盘归并：{四柱: [Interval]}，按第一次出现的先后排列。"""
+    groups = {}
+    for item in intervals:
+        groups.setdefault(item.pillars, []).append(item)
+    return groups
+
+
+def format_text(intervals):
+    lines = []
+    for pillars, items in charts(intervals).items():
+        lines.append(' '.join(pillars))
+        for item in items:
+            first, last = item.yun[0].date(), item.yun[1].date()
+            lines.append("    {} ~ {}  大运{}  上运 {}".format(
+                item.start, item.end, '顺排' if item.forward else '逆排',
+                first if first == last else "{} ~ {}".format(first, last)))
+    return '\n'.join(lines) + '\n'
+
+
+def to_dict(intervals):
+    return [{"pillars": list(pillars),
+             "intervals": [{"start": item.start.isoformat(' '), "end": item.end.isoformat(' '),
+                            "forward": item.forward,
+                            "yun_start": [item.yun[0].isoformat(' '), item.yun[1].isoformat(' ')]}
+                           for item in items]}
+            for pillars, items in charts(intervals).items()]
+
+
+def _moment(value):
+    try:
+        return datetime.datetime.fromisoformat(value.strip())
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected YYYY-MM-DD[ HH:MM[:SS]], got {!r}".format(value))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=u'出生时间校正：列出一段公历时间内可能的各个命盘及对应区间')
+    parser.add_argument('start', type=_moment, help=u'起始时刻（含），如 "1990-02-04 08:00"')
+    parser.add_argument('end', type=_moment, help=u'结束时刻（不含），如 "1990-02-04 20:00"')
+    parser.add_argument('-n', action="store_true", default=False, help=u'是否为女，默认为男（影响大运顺逆）')
+    parser.add_argument('--format', choices=('text', 'json'), default='text', help=u'输出格式')
+    options = parser.parse_args(argv)
+    if options.end <= options.start:
+        parser.error("end must be later than start")
+    intervals = scan(options.start, options.end, options.n)
+    if options.format == 'json':
+        print(json.dumps(to_dict(intervals), ensure_ascii=False, indent=2))
+    else:
+        print(format_text(intervals), end='')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+核对出生时间校正（rectify）：boundaries 列出的每个交节时刻前后一秒月柱不同，每个整点边界前后
+四柱不同；scan 的各区间内任一时刻排出的四柱都与区间所记的相同，逐分钟排盘得到的区间与之一致。
+
+python rectify_test.py 或 python -m pytest -q rectify_test.py
+"""
+
+import bisect
+import datetime
+import random
+import sys
+sys.path.append('.')
+
+import bazi
+import rectify
+
+SECOND = datetime.timedelta(seconds=1)
+
+
+def _pillars(moment):
+    ba = rectify.eight_char(moment)
+    return ba.getYear(), ba.getMonth(), ba.getDay(), ba.getTime()
+
+
+def test_jie_boundaries_change_month():
+    count = 0
+    for year in range(1900, 2101, 7):
+        start, end = datetime.datetime(year, 1, 1), datetime.datetime(year + 1, 1, 1)
+        times = set(rectify.jie_times(year - 1) + rectify.jie_times(year) + rectify.jie_times(year + 1))
+        jie = [moment for moment in rectify.boundaries(start, end) if moment in times]
+        assert len(jie) == 12, (year, jie)
+        for moment in jie:
+            before, after = _pillars(moment - SECOND), _pillars(moment)
+            assert before[1] != after[1], (moment, before, after)
+            count += 1
+    print("OK: {} jie boundaries".format(count))
+
+
+def test_hour_boundaries_change_pillars():
+    start = datetime.datetime(1990, 2, 3, 0, 30)
+    for moment in rectify.boundaries(start, start + datetime.timedelta(days=3)):
+        assert _pillars(moment - SECOND) != _pillars(moment), moment
+
+
+def test_scan_matches_minute_steps():
+    rng = random.Random(23)
+    for _ in range(6):
+        year = rng.randint(1900, 2100)
+        # 取一个节前后半天
+        moment = rng.choice(rectify.jie_times(year))
+        start = (moment - datetime.timedelta(hours=12)).replace(second=0)
+        end = start + datetime.timedelta(hours=24)
+        intervals = rectify.scan(start, end, rng.random() < 0.5)
+        assert intervals[0].start == start and intervals[-1].end == end
+        for item, following in zip(intervals, intervals[1:]):
+            assert item.end == following.start and item.pillars != following.pillars
+        # 逐分钟排盘：每一分钟的首尾两秒都落在四柱相同的区间里
+        starts = [item.start for item in intervals]
+        minute = start
+        while minute < end:
+            for moment in (minute, minute + datetime.timedelta(seconds=59)):
+                item = intervals[bisect.bisect_right(starts, moment) - 1]
+                assert _pillars(moment) == item.pillars, moment
+            minute += datetime.timedelta(minutes=1)
+
+
+def test_cli():
+    text = bazi.run(['1990', '2', '4', '10', '-g', '--rectify', '2'])
+    assert '己巳 丁丑 庚子 辛巳' in text and '庚午 戊寅 庚子 辛巳' in text
+    assert '1990-02-04 10:14:00' in text
+
+
+if __name__ == '__main__':
+    test_jie_boundaries_change_month()
+    test_hour_boundaries_change_pillars()
+    test_scan_matches_minute_steps()
+    test_cli()
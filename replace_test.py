@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+核对 Chart.replace：换时辰、性别得到的命盘与直接排出的命盘报告相同，
+原盘（如留在 RECENT_CHARTS 中的）不受新盘渲染的影响，两盘不共用按需填充的缓存。
+
+python replace_test.py 或 python -m pytest -q replace_test.py
+"""
+
+import json
+import random
+import sys
+sys.path.append('.')
+
+from bazi import BaziEngine, ChartCache, Chart
+
+# replace 后各自一份的缓存，见 Chart.replace
+LAZY = ('_luck', '_luck_natal', '_luck_bases', '_liunian_cache', '_timeline', '_rule_output')
+
+
+def _fresh(chart):
+    solar = chart.solar
+    return Chart.from_date(solar.getYear(), solar.getMonth(), solar.getDay(), solar.getHour(),
+                           gregorian=True, female=chart.female)
+
+
+def _same(a, b, engine):
+    return (engine.report(a) == BaziEngine().report(b)
+            and json.dumps(a.to_dict(), ensure_ascii=False) == json.dumps(b.to_dict(), ensure_ascii=False)
+            and engine.result(a) == b.result())
+
+
+def test_replace_matches_fresh():
+    rng = random.Random(21)
+    cache = ChartCache(maxsize=None, max_bytes=64 << 20)
+    bad = []
+    count = 0
+    for trial in range(20):
+        chart = Chart.from_date(rng.randint(1900, 2020), rng.randint(1, 12), rng.randint(1, 28), rng.randint(0, 23),
+                                gregorian=rng.random() < 0.5, female=rng.random() < 0.5)
+        BaziEngine(cache=cache if trial % 2 else None).report(chart)
+        for step in range(6):
+            hour = rng.randint(0, 23) if rng.random() < 0.7 else None
+            female = rng.random() < 0.5 if rng.random() < 0.5 else None
+            new = chart.replace(hour=hour, female=female)
+            count += 1
+            if not _same(new, _fresh(new), BaziEngine(cache=cache if step % 2 else None)):
+                bad.append((chart.solar.toYmdHms(), hour, female))
+            chart = new
+    assert not bad, bad
+    print("OK: {} replaced charts".format(count))
+
+
+def test_replace_pillars_only():
+    chart = Chart.from_pillars('戊午', '戊午', '丁亥', '庚戌')
+    BaziEngine().report(chart)
+    for hour, female in [('辛亥', None), ('壬子', True), ('壬子', False)]:
+        new = chart.replace(hour=hour, female=female)
+        fresh = Chart.from_pillars('戊午', '戊午', '丁亥', hour, female=new.female)
+        assert BaziEngine().report(new) == BaziEngine().report(fresh), (hour, female)
+        chart = new
+
+
+def test_source_unchanged():
+    """新盘渲染（含只换性别、时辰不变等沿用缓存的情形）后，原盘的报告不变，缓存不与新盘共用。"""
+    chart = Chart.from_date(1990, 6, 7, 12, gregorian=True)
+    before = BaziEngine().report(chart)
+    for hour, female in [(12, None), (13, None), (12, True), (None, True), (3, False), (None, None)]:
+        new = chart.replace(hour=hour, female=female)
+        for name in LAZY:
+            assert getattr(new, name) is not getattr(chart, name), (hour, female, name)
+        BaziEngine().report(new)
+        new.to_dict()
+        assert BaziEngine().report(chart) == before, (hour, female)
+    print("OK: source chart unchanged")
+
+
+if __name__ == '__main__':
+    test_replace_matches_fresh()
+    test_replace_pillars_only()
+    test_source_unchanged()
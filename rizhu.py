@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# CreateDate: 2025-10-30
+# 按键懒加载的文本库，见 corpus.LazyCorpus；排盘时不 import 本文件。
+
+# 日柱詳細解讀
+day_pillar_detail = {
+    '甲子': '''
+甲木為棟樑之木，木主仁，坐下正印，其人身高體健，慈祥愷悌，相貌俊秀。印為文書，身坐文書，主才學超群，有權柄。印又有生身助學之功，故主人記憶力強，學習成績優秀。
+甲子為"木遇水生"之象，子水中癸透，生扶甲木，一氣純粹。生於此日者，多具仁心慈念，溫厚好學。甲木坐正印，心性安舒，易受母輩影響而偏倚親情；一生多得學緣及文士之助。印旺財官弱，理財宜後習；子中辛金長生，化生庚殺形成"殺印相生"，子息多聰慧。然水旺傷心，父輩或易患心目之疾。若命局木盛，則如喬木挺立；木無根，則似浮蓮隨水，常有宗教玄緣。幼年或有與水相關之驚險。''',
+    
+    '乙丑': '''
+乙木為花果之木，木主仁，坐下偏財、七殺、偏印。乙丑日生慷慨大方，喜愛春風，多學少成，幼年現災，父母重拜；九流中人，夫妻無刑，兒女不孤，六親少靠；女人賢良純和，但求財心切，需體恤家庭。
+乙丑為福星貴，主人秀氣有福。又為金神貴，身坐金庫，木無根，最喜月支逢火星，若坐下七殺無制，則自信心太過，往往一意孤行。
+乙木植於濕土，丑中藏己辛癸，生剋錯綜。己為財，辛為殺，癸為印，一生多財機與磨煉並存。乙木柔弱，賴癸水滋養而不固，氣象為"財殺混雜"。宜以知識與技藝立命。偏印多憂思，故有思慮鬱結、筋骨勞損之虞。婚姻多波折，宜相互包容。父輩多能助力，但勞累成疾。子女平穩安守，福厚而不顯貴。''',
+    
+    '丙寅': '''
+丙火為太陽之火，火主禮，坐下偏印、食神、比肩。丙寅日生多學少成，心性不定；口快舌硬，身閒心直，手足不停，利官近貴，女人賢良，聰明伶俐，辛勤收穫！
+丙為太陽，身坐長生，有光彩之象，主人聰明，但坐下梟神奪食，不吉。
+丙火坐寅木，木火生輝，為長生產氣。命主多充滿熱情、行動力強。寅中甲木偏印，若太旺則奪食生慮；若平衡則能"食神生財"，福祿綿長。其人性明朗豁達，具領導力與創造欲。婚緣上，比肩坐日，多互助亦多競爭。宜循光明正業，如教育、醫療、藝術。火旺金衰，父系呼吸系統宜護。形貌俊朗，少女佳婦類秀麗端莊。''',
+    
+    '丁卯': '''
+丁火為燈燭之火，火主禮，坐下偏印。丁卯日生手足不停，身心不閒，內外有勞，衣祿不少，性巧聰明，做事有頭少尾，男人福份之命，女人企圖寧靜，操勞中有幸而獲，防不知足？
+丁火坐印通根，主人聰明有學問。若四柱出現亥卯未三合局或寅卯辰三會局，為大貴人，但身坐偏印，只能為副職，輔佐他人。
+丁火得卯木偏印而生，智慧靈敏，心思細膩。然過度思慮易憂鬱。仕途多變，宜安於學術與專業。婚緣溫厚，然情感表達不暢，宜溝通維護。與父母子女皆有距離之象，守中道則和諧。生存力強，適合靜業與耐心工作，如文藝、設計、教育類。''',
+    
+    '戊辰': '''
+戊土為城牆之土，土主信，坐下正財、比肩、正官。戊辰日生喜氣春風，利官近貴，骨肉刑傷，兒女不孤，女人溫良賢達，有口無心，烏鴉嘴豆腐心，主招好夫，需防止他人誤會！
+戊辰日柱通根身旺，坐財、官、比肩，但支中藏干比肩、財星化火為印，變成官印相生，故主高貴。支內戊癸化火生土，而辰本為濕土，內中有火，溫暖中和，能生萬物，必然根深葉茂，秀氣有成。
+戊土坐辰庫，藏癸乙戊，財官同庫而貴氣潛存。主穩重踏實，具理財與管理天賦。婚緣得助，配偶賢明。土厚故心存高望，宜戒驕矜，知足則安。父母多助而觀念易異。性格實幹，適宜地產、金融或行政之業。土旺克水，宜防呼吸與脾胃之疾。''',
+    
+    '己巳': '''
+己土為田園之土，土主信，坐下正印、傷官、劫財。己巳日生聰明才智，手足伶俐，小有功名，做事如意；夫妻和睦相處，諸事可為；女人衣食住行不缺，善良待人；男人多出風頭，小有計謀，資性英敏，福厚之命。
+己巳日為金神貴，主人剛毅、聰明，月支有火則貴，卻火則不吉。坐下正印、劫財、傷官，傷官佩印，貴不可言，但傷官遇劫，易遭小人陷害。
+己土居巳火，火生土旺。印生身強，具剛毅與責任心。事業射干，宜實業或軍警文教類。性格厚直，然印旺抑財，經濟由勤儉積累。友人益多，父親勞多體弱。中年後心智成熟，女命多賢母。喜火土事業，慎防血脈與牙疾。''',
+    
+    '庚午': '''
+庚金為斧鉞之金，金主義，坐下正官、正印。庚午日生口快心直，利官近貴，小有殊榮，衣祿豐盈。男人權柄，辛勤持家，外面固執，有人欽佩；女人秀氣，略顯美感，榮夫益子，鄰里欽佩。
+庚午日生，身坐正官正印，氣質清純，必主官貴，但金坐火地，須經火煉，千錘百鍊始成鋼，所以仕途坎坷，有大起，也有大落。
+庚金臨午火，火克金而土生金，克泄並見。情緒多端，遇貴人貴氣自彰。女命配偶賢而性格需穩。宜南方發展，忌北水地。貴以修心，慎勿"傷官見官"。事業多變，健康宜護胃脾。''',
+    
+    '辛未': '''
+辛金為首飾之金，金主義，坐下偏印、偏官、偏財。辛未日生生有志氣，心性寬容尚仁義，少年災病；中年略好，頭胎見女更吉，生男有刑克；夫妻和睦相處，事業順利；女人持家方興旺，男人顧家多利業！
+辛未日柱得庫通根，身旺，坐下偏財、偏印、七殺，一片順生，主小貴，吉。女命辛未愛情專一，奪夫權，守家，獨裁。
+辛金得未庫為財鄉，土生金旺。命有貴氣，宜理財行商。殺印相生，武仕或經商皆利。異性緣深，宜守正道。水火木全則運亨。身體宜護肺皮膚。''',
+    
+    '壬申': '''
+壬水為江河之水，水主智，坐下偏印、偏官、比肩。壬申日生性巧聰明，才智少顯，計謀多變，誠信待人接物功名有份；有賢妻子，為人英敏，受人喜歡；女人美麗，博得人助！階段富貴，榮華自珍！福氣子孫。
+壬申日柱，身坐長生，太旺，主人好動不拘。納音劍鋒金，男命敢於拼打爭鬥，常不善終。女命重武好鬥，具男性風格。
+壬水坐申長生，氣滿神清，智慧深厚。喜流動變化，多貴人助。宜學術科研、交通水運等行。父系體弱，子女獨立。健康宜防肝手之疾。''',
+    
+    '癸酉': '''
+癸水為雨露之水，水主智，坐下偏印。癸酉日生心直公平，伶牙俐齒，防言多失；衣祿自儉，有備無患，平穩足用；六親冷淡，自謀求生；社會交往，多有人愛，雖事不成，少取勿貪，百業可為；女人助夫，勤儉持家；晚年幸福！
+癸水坐偏印金神，外表柔和，內心陰毒。富於心計，會掙錢，但也會花錢。
+酉金生癸水，偏印旺。聰慧而內斂，言語宜慎。命主多幽微思緒。桃花凶易，宜持節制。合適教育、金融、理性行業。戒酒與過度應酬。''',
+    
+    '甲戌': '''
+甲木為棟樑之木，木主仁，坐下偏財、正官、傷官。甲戌日生口快舌伶，身閒心不空，少年貧民，中年奔波，略有權職，心機謀略，多學少成，小有名聲；晚景福祿延年，自珍自愛益壽；助人惹怨，妒嫉常伴隨而來。女人旺夫，勤儉興家。
+甲戌得庫通根身旺，坐下偏財正官、傷官，主人剛強正直，光明正大，為官清廉，但性格過於直爽，易得罪人，難免受到打擊、排擠。
+甲木克戊財，得丁火傷官，寓"傷官生財"。心性高潔，智慧敏銳；女命感情多磨合。好學藝文，且與宗教哲義有緣。父助有力，若能修心，則成雅士風流。''',
+    
+    '乙亥': '''
+乙木為花果之木，木主仁，坐下正印、劫財。乙亥日生為人和順，幼年多災，父母有刑，誠實待人接物，出外稍好；女人夫好，和睦相處、偕老，存心中正，中年財旺，防勞致病；婚遲子晚，子女防克，重拜義母，嚴教成才。
+乙亥雖處死地，卻坐下為正印、劫財幫身，故有枯木逢春之象。男命乙亥主得賢妻；女命乙亥主得貴夫，而且對夫忠誠。另外，女命乙亥非常漂亮。
+乙木坐亥，水旺木寒，需火暖扶身。氣質柔弱而靈秀。母緣深，財運流動，宜教育文化業。謹防筋骨寒濕與疲勞，保暖養氣為要。''',
+    
+    '丙子': '''
+丙火為太陽之火，火主禮，坐下正官。丙子日生膽大言廣，有權謀，心機詭詐，早年平平，中年成就，晚景大好，女人饒舌，言多有失，安分守己，避免麻煩，幸福自來。
+丙子為福星貴，主人聰明，博學多能，易顯威望。丙火坐子無根，主人身矮。丙為太陽主光明，而子鼠狡猾，子中癸水陰濕，故亦主人雙重性格。身坐正官，一權在握，往往自以為是，獨裁固執。
+丙火坐子水，陰陽對立而成調和之象。火遇水克，然癸水潤丙，光暈柔和，主聰慧中帶堅定。此日生人，多具理性與感性兼容之氣，外溫內毅，志趣文雅。丙火臨正官，宜守正途；子為官鄉，主婚緣佳而多磨，感情需互諒方穩。性情仁厚而敏感，易為情所動。事業宜取教育、醫學、能源、社會服務諸業，以火水互制為中道。健康宜護眼與心；修心以和，情可化吉。''',
+    
+    '丁丑': '''
+丁火為燈燭之火，火主禮，坐下食神、偏官、偏財。丁丑日生為人和睦，衣祿不愁，初年有旺祿常在，晚景大好，更有結餘，婚遲子晚，夫妻和睦相處，則百事順利。女人旺夫愛子，孝敬，持家賢良。
+丁火坐丑無根，身弱，但丁為星光，無妨。坐下偏財、七殺、食神，食神生偏財，偏財生殺，也一片順生，故屬吉利。
+丁火坐丑土，為火潤於濕土之象。火得食神，氣息含蓄，主性情內斂、思考細密。此日生人勤謹穩重，凡事注重實效。偏印暗藏，思慮深，稍多憂懷。宜學術、設計、金融、文藝等實務工作。感情平和而淡遠，配偶溫厚；過度憂慮則損氣。健康宜防脾胃與血氣鬱滯。''',
+    
+    '戊寅': '''
+戊土為城牆之土，土主信，坐下七殺、偏印、比肩。戊寅日生計算聰明，才智有餘，文武兩通，兒女早產防克；結婚當晚，財運良好，運氣頗佳，用情不專，家花、野花，警慎為佳！女人自珍，賢慧發福！
+戊寅日柱坐長生，身旺。生於春，則坐下七殺太重，一生勞苦，多為人造福。
+戊土據寅，木火相生，藏七殺、偏印與比肩。土得印生而不燥，志氣高昂，具領導力。此日生人果決堅毅，處事公正。若火木兼旺，則財官生而顯貴；若水多克之，宜守實業。利於管理、建設、教育、軍警等職。健康防血壓與筋骨疲勞；修身守正，剛中有容。''',
+    
+    '己卯': '''
+己土為田園之土，土主信，坐下七殺。己卯日生為人交往廣泛，風流倜倘、豪傑，衣祿豐足，閒情逸緻，嬉戲娛樂，有人遵從；六親冷淡，自立為上，骨肉難為，妻招年長，配偶和睦；女人注意鄰居關係，自我解脫，曠達胸懷，長壽，親族賢達。
+己卯坐殺截腳，為最差之日，人命己卯，易殘疾、受傷，一生勞苦。年上己卯，祖上傷殘，不善終；月上己卯，父母不團圓；日上己卯，青年時期命危；時上己卯，老年不得善終，子女不好。
+己土坐卯木，木剋土，為克中見生。命主柔中帶剛，能受壓而不折。性格沉著慎謹，勤於自省，宜技藝、學術、教育或農木之業。感情互依互剋，宜以理調和。多思而能忍，若火來生土，則志行堅實。健康防肝與筋骨之弊，動靜適度則安。''',
+    
+    '庚辰': '''
+庚金為斧鉞之金，金主義，坐下偏印、正財、傷官。庚辰日生春風和氣，勞祿霜雪一生，利官近貴，名利雙全，衣食足用；中年平順，晚年大興，女人勤儉，持家有方，受人敬仰，坎坷風波。個別命運身體衰弱，注意健康，平安為福。
+庚辰為魁罡，身坐正財、傷官、偏印，主人有財祿，聰明有學識，支中藏干傷官帶偏印有貴氣，而戊癸化火為官殺，變成日坐財官，可做官，但隱含傷官，可能喜開殺戒。
+庚金居辰，土生金而藏水木。庚得生扶，聰敏多變，處事果斷。地支辰中癸水為傷官，乙木為財，兼具靈慧與財能。若能節氣制衡，乃智與才並舉之命。宜工程、醫藥、金融、科研等業。言宜慎和，勿矜才。健康防胃氣與目疾。''',
+    
+    '辛巳': '''
+辛金為首飾之金，金主義，坐下正官、劫財、正印。辛巳日生友善機謀，能應變，志氣過人，衣食足用；有貴人扶助，中年和順，老有福運，心安理得，知足常樂，可以長壽。
+辛巳日柱，身坐正印、正官、劫財，辛金柔弱，有正印生身，劫財幫助，由弱轉旺，而正官丙火制衡，使干支中和，必主官貴，富於成功。
+辛金鍛於巳火，為"金煉成器"之象。火煉之金，質潔而光。此日生人多秀外慧中，心思精微，氣質端雅。居官而有度，經商亦能權衡。巳中庚戊生扶，根氣厚實。若水木輔之，則文理皆通。健康防肺與皮膚疾，慎火。事宜金融、醫學、美術與策劃；以靜制剛為吉。''',
+    
+    '壬午': '''
+壬水為江河之水，水主智，坐下正財、正官。壬午日生為人勤儉，父母刑傷，早年財物不順利，存儲不多，中年勞心，稍有所得，晚景旺子，事應積蓄，防備缺乏。女人興家，賢能自達，恆心有獲。
+壬午坐下財官，無雜氣，多主官貴，丁壬合財，主得妻財或因妻致富。但壬午不如癸巳，癸巳財官雙美無雜氣，又為日貴。另外，壬水蓋頭有掩火之嫌，故雖有官貴，也難免大起大落。
+壬水坐午火，水火交融，為財官雙現之象。命主聰慧和順，處事中和，財緣深長。心性開朗而具責任感，適宜管理、金融或學術領域。感情溫厚而理性，合中有克，需互諒相惜。健康宜護心與血；守誠正則福祿長。''',
+    
+    '癸未': '''
+癸水為雨露之水，水主智，坐下偏官、偏財、食神。癸未日生心急口快，為人伶俐；救人無恩，反招是非，曲直難辯，多有誤會。有財無庫，過眼煙雲，財來財去，精打細算，可免禍災；女人賢慧，勤儉持家；晚景平安。
+癸未坐下有食神生財、財生殺，因坐偏財、七殺，故男女命逢癸未，重婚較多，但男女均俊秀漂亮，愛情專一。
+癸水居未庫，土多水滲。氣質柔利，性情敦厚而思敏。此日生人多具靈感與藝術氣質，善思而重情。事業以創意、教育、公益為宜。情感貞摯但多思，親情深而易憂。健康防脾胃與濕邪，宜靜養心性。''',
+    
+    '甲申': '''
+甲木為棟樑之木，木主仁，坐下七殺、偏印、偏財。甲申日生衣祿不少，心性溫柔，出入有為，技壓群芳，初年不順，中年勞神，晚景利達；夫妻和順，兒女遲到，女人操勞，忍耐莫逆，家事平安。
+甲申坐絕地，一輩子辛苦、奔波，但死木逢殺克削，也不失可用。
+甲木臨申金，木被金制，為剋中藏生之象。此日生人外柔而內勁，歷試而精。七殺得印化，若配合得宜則成"殺印相生"，能化險為宜。性格剛正，具有冒險與突破精神。宜管理、科研、軍警及技術性行業。感情波折，重守信義；多動可通利，宜遠行而成。''',
+    
+    '乙酉': '''
+乙木為花果之木，木主仁，坐下七殺。乙酉日生口快心直，軒昂大方，樂觀；衣祿足用，兄弟雖有，難為助力；與人為善，事業成功；女人興旺，小有蓄財，平穩，求安康。
+乙酉日柱自坐七殺截腳，生在春天有救，生在土月助殺攻身則不妙。命逢乙酉多不善終或不高壽。女命乙酉漂亮，浪漫，早戀愛或早結婚，但是戀愛過程或婚後感情問題卻往往層出不窮。
+乙木坐酉金，金剋木，氣寒而秀。此日生人性敏而勤，才華潛而不顯。以柔制剛，宜以學識立身，如教育、藝術、法務、醫療等業。感情好而多磨，婚緣宜晚。健康防肝膽與循環系統。修德守心，能化剋為生。''',
+    
+    '丙戌': '''
+丙火為太陽之火，火主禮，坐下食神、正財、劫財。丙戌日生性情溫和，技藝護身，衣祿不愁，豪傑和順，自能有財；獨立家業；前運不周，利益不順，中年操勞，錢財有進；晚年榮華。女人中年奔波，辛苦求財，老年稍微聚財發旺，珍惜為盼！
+丙戌坐火庫，身旺，火光熠熠，聰明、漂亮，人緣好。此日生之人多有溫和的品格，注重勤勉，然而似有多管閒事的癖好。又戌土支中藏干為戊、辛、丁，丁為劫財，又日支坐墓，故夫妻間相處不易。
+丙火坐戌土，火土相依，為"食神生財"之象。性情坦率而具修養，志高而務實。此日生人重情重義，常自求完善。財星藏庫，運開而財聚；火暖土潤，主家庭安穩。宜從教育、醫療、文化、建設等業。婚姻感情誠篤，唯心易憂。健康防眼疾與心腹火症。''',
+    
+    '丁亥': '''
+丁火為燈燭之火，火主禮，坐下正印、正官。丁亥日生性巧聰明，小有才智；獨立自營，奔波操勞，兒女有利，見遲方好；好為善事，稍微旺財；女人貞節自愛，得貴人幫助，幸有財運，衣祿平穩。
+丁亥日柱，坐下正印、官星，官印相生，主聰明超群，丁壬合化印星，坐貴，主官貴，與大貴人有緣。女命丁亥，可嫁貴夫。
+丁火居亥水之上，為"官印相生"。性情柔而明，聰慧且仁慈。此日生人正直守禮，具服務精神，適合教育、公職、研究等領域。感情平和，配偶端和；多貴人輔助而不乏機緣。健康宜護血氣與腎，心靜自安。''',
+    
+    '戊子': '''
+戊土為城牆之土，土主信，坐下正財。戊子日生計算聰明，才智有餘，文武兩通，兒女早產防克；結婚當晚，財運良好，運氣頗佳，用情不專，家花、野花，警慎為佳！女人自珍，賢慧發福！
+戊子為六秀日，主人聰明秀氣，坐正財，得賢妻，因妻致富，干支戊癸化火生身，主高貴。
+戊土坐子水，以財為根，為"土制水而財聚"。命主務實能行，思維清晰。此日生人善於理財、管理，重實績而少虛言。性堅定而知節。宜金融、房地產、貿易諸業。健康防脾胃氣滯與眼疾，守和則安。''',
+    
+    '己丑': '''
+己土為田園之土，土主信，坐下比肩、食神、偏財。己丑日生口快心直，通技藝人，能掌實權，誠意待人，博得眾望，衣祿不少；男人防再娶，家庭當和睦相處。女人晚年發福。
+己丑通根，比丁丑好，生於得令之時為強，恐有比肩奪財爭鬥之狀；生於失令時則有兄弟幫忙。己丑日出生的人在天性上是善良的、富責任感、有度量、內向、是做事細膩的人，行動上有點慢吞吞的。
+己土居丑，土氣濕潤，藏辛癸之氣。命主性慎實厚，多感於情。此日生人具耐性與持久力，處事穩而堅；然思多、易憂。財氣浮沈，宜積以時。利於務實產業，如土地、農牧、經管、工藝。健康防胃弱與水濕凝滯；勤學自進可轉機運。''',
+    
+    '庚寅': '''
+庚金為斧鉞之金，金主義，坐下偏財、七殺、偏印。庚寅日生心性急快，有口無心，大事有藏；易好易怒，性情反覆無常，傷人還不知道；易結人緣，也易失人緣，衣祿足用；早年不聚財物，中年奔波，晚景豐隆。女人內助，理事發達，勤儉有得。
+庚寅坐絕地，無根，蓋頭（干克支），女命克夫再嫁，做偏房可以，男命庚寅難得善終，但坐殺印有開拓精神，為官多清廉，支藏偏印宜做副手。
+庚金坐寅木，金剋木，剛中見強。性格果敢，作風直率。若木火調氣，則剛中含柔，能成卓越之才。若金旺木衰，易過於激烈。宜武職工程、司法、科技等實務行業。健康防頭目筋骨；修心以誠，剛柔兼濟。''',
+    
+    '辛卯': '''
+辛金為首飾之金，金主義，坐下偏財。辛卯日生口快心直，有志氣，有權柄，利官近貴，身閒心不空；六親少靠，自立家業，少年勞祿，晚年大利；女人持家，操勞，勤儉節約可興隆。
+辛卯坐偏財，為福貴雙全日。辛卯日柱坐偏財，多桃花，男命喜歡女色，女命稍好，但漂亮卻難免有招蜂引蝶之嫌。
+辛金坐卯木，金克木為刑中有智。命主心思銳敏，見解獨立。此日生人多具藝術與鑑賞天賦，舉止端潔。若過剛則易孤，宜以和氣自調。事宜理財、文化、醫學相關行。健康防呼吸、牙齒或筋絡之疾；勤修柔忍為福。''',
+    
+    '壬辰': '''
+壬水為江河之水，水主智，坐下偏官、劫財、傷官。壬辰日生勞祿之人，手腳停不下來；早年難守，財來財去，晚景發達。女人操家，勤奮興旺。
+壬辰日坐水庫通根身旺，坐下有劫財生食，食神制殺，身旺用殺，主貴。壬辰日為壬騎龍背，亥時生，為龍歸大海，主大貴，午時生則龍死為下等命。
+壬水坐辰庫，水旺土藏，為"智潛不露"之象。性情聰慧而易動，氣勢起伏。若能以土制水，則智守分寸，福祿俱成；若水泛，則多慮多變。宜學術、流通、顧問、交通行業。婚姻平常，重情而敏感。健康防腎脾失調與肢體勞損。''',
+    
+    '癸巳': '''
+癸水為雨露之水，水主智，坐下正財、正官、正印。癸巳日生聰明伶俐，近貴人，中年風霜，春風之徒；慎重守護已成之事業，可暫發福；好心對人，卻被人反目，晚景稍好。
+癸巳日身坐正官、正印、正財，財官印連生，循環清正，主高貴、富貴或清貴，生活富裕，女命癸巳，可嫁貴夫。此日生人，主夫妻有病，或酒色荒淫。
+癸水處巳火，陰陽相交。命主聰慧含蓄，富洞察力。官印並存，若能平衡五行則貴氣自顯。性情溫理，處世明潔。宜金融、設計、教育及文化產業。健康防眼疾與心煩失眠。''',
+    
+    '甲午': '''
+甲木為棟樑之木，木主仁，坐下傷官、正財。甲午日生為人和氣，好娛樂；青春好風盪，交往朋友，利官近貴，逢凶化吉，骨肉少靠。女人口快，心直能言；愛情路上，需防禍不單行！
+甲午日身坐死地，一生勞苦奔波，干生支，對妻子好，傷官生財，對長輩孝順。日主泄出丁火，主利他人，故對別人照顧有加，可自己到老，卻一無所有。
+甲木臨午火，木生火旺，為"傷官生財"之象。命主思敏，富想像力而具表現欲。若能抑強守柔，則成才華之人；若氣過則多爭競。宜創意文化、教育、經商之業。感情熱烈而需節制；健康防血壓與情緒激動。''',
+    
+    '乙未': '''
+乙木為花果之木，木主仁，坐下偏財、比肩、食神。乙未日生少年勤儉，初年平順；兄弟少靠；子息不孤；晚年聚財，可以興旺；女人持家，恩夫旺子，精打細算。
+乙未坐庫通根，財星入庫，主富，但愛財卻小氣，再逢命局或大運流年沖庫，主發財。
+乙木居未土，土中含木火，氣勢溫厚。命主柔中存毅，心靜而志恆。多才多藝，勤奮進取，喜文雅之事。財旺而身強，宜勤儉持家。適合設計、服務、教育、醫療行業。健康防脾胃與筋骨，安於內修則吉。''',
+    
+    '丙申': '''
+丙火為太陽之火，火主禮，坐下偏財、食神、七殺。丙申日生衣食豐足，利路亨通，技能生財；早年勞祿，女人持家，勤儉節約，旺相發達。
+丙申日柱身弱無根，妙在丙火太陽，坐下食神生財，財生殺，壬水殺旺，映照太陽光輝，主人聰明靈氣。但殺旺攻身，老來孤獨，一輩子辛苦，不能坐享其成。
+丙火坐申金，為"火制金成器"。申中藏庚壬戊，生剋交融。此日生人外熱內謹，性情明亮。食神制殺，若組合得宜，主有奇思與靈慧；若火弱被金制，則多勞多思。宜從事科技、醫藥、文化、管理等業。感情有熱有冷，需誠以相待。健康防心臟與呼吸道疾。''',
+    
+    '丁酉': '''
+丁火為燈燭之火，火主禮，坐下偏財。丁酉日生喜好面子，多情重恩，緣份奇特；利官近貴，初年勞累，身閒心苦。晚年興隆，子女有為；女人清秀吉昌，半夫半財，自立成功。
+丁酉坐長生偏財、夜貴、文昌，主人高貴聰明，見識超群，受人欽敬，另有叛逆創新性格。
+丁火臨酉金，為火得財之象。火照金輝，明而不烈，主福祿豐。性格精明節度，為人熱心且知分。坐下偏財，善理財運，貴人相扶。宜商業、金融、設計等行。婚緣美滿，然性急好思。健康防眼與血脈；樂觀行善則久安。''',
+    
+    '戊戌': '''
+戊土為城牆之土，土主信，坐下比肩、正印、傷官。戊戌日生為人和氣，獨立自營；早年顛倒運程，是非耗財；中年貪求，欲望高昂，遭人妒嫉。自重；苦學技藝，學有工夫之命。女人育養，中平之命運。
+戊戌為魁罡日，坐庫通根，土太燥，吉中帶凶。魁罡主人心直口快，臨事果斷，也主聰明，文章振發，但處理事情不夠委婉，所以常得罪人。
+戊土坐戌土，土重氣厚，藏辛丁戊。此為"傷官佩印"之象。性剛果敢，才華外顯。若火土適中，則文質並茂；若土壅火熾，易倔好強。宜管理、建築、策劃、學術工作；少說多行為福。健康防皮膚與消化。''',
+    
+    '己亥': '''
+己土為田園之土，土主信，坐下正財、正官。己亥日生計巧伶俐，衣食安穩，骨肉少力，六親冷淡，兒女早見刑克，遲到稍好；夫妻和順。女人清閒，晚年好。
+乙亥日坐正財、正官，為財官雙美，主貴。女命己亥，也可嫁貴夫。
+己土坐亥水，水潤土柔。命主聰明穩重，操行謙厚。得"財生官"之氣，志在事業，凡事堅忍。配偶多助，行動務實。宜管理、教育、金融及實業。健康防腎水與脾胃寒濕；靜心則長富。''',
+    
+    '庚子': '''
+庚金為斧鉞之金，金主義，坐下傷官。庚子日生持重，安穩，衣祿無虧，妻子賢慧，持家有方，建交貴人，提拔機遇，逢凶化吉。女人興旺，福蔭家庭。
+庚子日坐傷官，女命克夫。干支金水相生，人秀麗、聰明，但耿直，講義氣。做官宜檢調、法務部門。
+庚金據子水，金生水旺，才思聰慧。氣象寒靜，心性敏銳。若火來煉金則成器，無火則冷峭孤傲。適合技術、藝術、教育、科技與研究事業。感情理智，但需溫情調和。健康宜護腰骨與血氣。''',
+    
+    '辛丑': '''
+辛金為首飾之金，金主義，坐下偏印、食神、比肩。辛丑日生心性溫和，早年須防驚恐，意外之厄；雖有衣祿，骨肉少力，晚年好，女人旺家，事多發達。
+辛丑日通根，坐下有印、比、食神，主人靈秀，女命辛丑身材好，秀氣，守家。
+辛金臨丑土，土金相生，為質厚而堅之象。性情沉穩而明理，言行有度。身旺若得火水調氣，則可貴顯；若偏於剛寒，則孤高。宜金融、工業、設計、審計類工作。健康防呼吸與關節；平和待人為佳。''',
+    
+    '壬寅': '''
+壬水為江河之水，水主智，坐下食神、偏財、偏官。壬寅日生為人口快心直，男女都不能早結婚，若早結婚夫妻便相剋。兒女宜遲，初年顛倒，中年興旺。女人如意，發福之命。
+壬寅日柱，身坐食神生偏財再生殺，又為壬騎虎背，主富貴雙全，干支相生，家庭圓滿。
+壬水坐寅木，水生木、木生火，氣脈流通，吉象居多。性情仁厚，智慧兼容，行事踏實。宜教育、經商、服務業皆利。家庭和諧，子女有成。健康宜節食護肝，心平則安。''',
+    
+    '癸卯': '''
+癸水為雨露之水，水主智，坐下食神。癸卯日生衣食不少，凶中化吉，早年不順，財來財去，晚年好。女人操持之命，遭遇妒嫉，好事難全，少年弱，中年勞祿，老有歡樂。
+癸卯日坐長生、日貴，食神吐秀，主人聰明有文才，個性溫和善良、斯文，忠厚圓滿，人緣佳，易受人歡迎、賞識。女命癸卯，生子讀書有成。夫妻多恩愛，家庭幸福。
+癸水居卯木，為"長生"之地，水木相生而氣質清秀。主性情溫柔、思敏而有文采。為人誠淨，重情義。適宜文化、教育、藝術、心理等行業。感情平和，家庭順遂。健康防目疾與寒濕。''',
+    
+    '甲辰': '''
+甲木為棟樑之木，木主仁，坐下偏財、劫財、正印。甲辰日生衣食豐足，清閒心情；早年弱，中年勤奮，情感有波折，事業發達，晚結婚，子女宜遲，幫助多。
+甲辰日柱得氣通根，坐下有偏財破印，缺少貴氣，前半生不太好，後半生平安，財祿豐足。
+甲木臨辰庫，木得水潤兼遇土。聰敏且志廣，然易多思。財氣深藏，宜以勤勞致富。若火助，則光顯；若水過，則憂懷。事業以實業、教學、規劃為宜。感情厚重，需理解包容；防脾胃宿疾。''',
+    
+    '乙巳': '''
+乙木為花果之木，木主仁，坐下傷官、正財、正官。乙巳日生為人好面子，救人無功；好事莫望；早年子女刑克，晚年安寧。女人助夫愛子。
+乙木向陽，英華外發，主人聰明，但泄氣，只利他人，不利己。坐下傷官、正財、正官順生，有錢，富裕。男命乙巳，多晚婚，可得賢妻，但支中傷官見官，過於剛強，不守紀律。
+乙木居巳火，木得火榮，含有"食神生財"之理。氣場活潑、思維靈敏。性情善感，具藝術氣質。然火多則易躁，需靜養以平。宜文化設計、教育、科技行業。健康防眼與心火；適度運動可調氣。''',
+    
+    '丙午': '''
+丙火為太陽之火，火主禮，坐下劫財、傷官、羊刃。丙午日生身閒心不空，初年耗財，宜做基礎，技能工夫，求名不利，事多爭端，兄弟各方。女人清秀，思維奇妙。
+丙午日坐羊刃，過剛，人聰明有文才。男命克妻，女命克夫，不論男女生於丙午，容易受傷，或致殘。武官則不善終。
+丙火臨午火，火炎照天。志氣昂揚，性格直爽。此日生人熱誠豪爽，宜領導創業、科技文化之職。火旺則易急，當節氣以和人。婚姻宜柔化剛。健康防血壓與眼疾；養心寡欲福自長。''',
+    
+    '丁未': '''
+丁火為燈燭之火，火主禮，坐下食神、比肩、偏印。丁未日生喜怒無常，口舌能言，名利不缺，骨肉疏遠，子息遲到；衣祿豐足；女人有旺運，勤儉能興家。
+丁未日生得庫通根，羊刃在支，坐下食神旺，也主人漂亮，但好吃，女命賢慧。
+丁火坐未土，土藏乙丁己，印比並見。氣勢祥和，性婉而堅。此日生人溫文勤謹，處事有條理，喜靜而思深。宜教育、醫療、管理及文職。感情圓融，家庭安穩。防脾胃虛弱與思慮過度。''',
+    
+    '戊申': '''
+戊土為城牆之土，土主信，坐下食神、偏財、比肩。戊申日生為人性急，易反覆無常；一生勞祿，利官見貴，兒女刑傷，財庫富足，女人有旺運，勤儉能興家。
+戊申日土猴孤獨，女命早婚者易離婚，或孤身；男命稍好。不論年、月何柱出現，亦均漂亮，但愛情不專，作風不正。
+戊土居申金，土生金旺，財氣通達。性格厚實誠樸，志行穩健。主有謀略，善理項目與財務。若火見則顯達。宜實業、金融、礦業、交通等。感情敦厚而需體恤。健康防腸胃、皮膚與筋骨。''',
+    
+    '己酉': '''
+己土為田園之土，土主信，坐下食神。己酉日生為人聰明，衣祿豐足，六親少靠，兒女早見；凡事寬量，百事通達，女人技巧多變，少災之命。
+己酉日坐長生、文昌，主人好文學，聰明有文才，且土金相生，主人身體好，但干生支，畢竟泄氣，故得失都有。
+己土坐酉金，金生助力，氣厚而潤。性情溫順謙實，內智外靜。日主偏印轉生財氣，行運得宜則富。宜金融、建築、教育及服務業。情感平緩，家道安；健康防肺弱與耳疾。''',
+    
+    '庚戌': '''
+庚金為斧鉞之金，金主義，坐下偏印、正官、劫財。庚戌日生利官近貴，敏捷聰明，福氣晚年，救人無義；女人心賢，勤奮方能興家。
+庚戌日柱，坐庫通根身強，為「魁罡」，聰明剛毅，有文才，忠義雙全。此日生人，個性較為倔強、固執，在中國古社會對魁罡日出生的人，評語普遍認為是大成大敗，因為堅持力、執著力強，所以較常人更具成功的條件。
+庚金據戌，火土生金，剛正中含柔。理智強健，具組織能力。正官制劫而印生身，此日多能執政理事。宜公務、軍警、機構管理之職。健康宜護肝肌；感情重信義，婚姻需互諒。''',
+    
+    '辛亥': '''
+辛金為首飾之金，金主義，坐下傷官、正財。辛亥日生不惹閒事，清靜守中；早年不聚財，晚景榮華富貴。女人勤儉，福豐，助立家業。
+辛亥日柱干支相生，金水相連，文才好（女命稍差）。坐沐浴，女命不貞，坐下傷官旺不利夫。男命可得妻財，或漂亮之妻。
+辛金臨亥水，為"傷官生財"之象。性秀而聰慧，才思敏捷。以金水之智取財，宜從商、創意、藝術或顧問業。感情豐而專，婚姻需溝通。健康防腎臟與神經緊張；修心則安吉。''',
+    
+    '壬子': '''
+壬水為江河之水，水主智，坐下劫財。壬子日生幼年顯災，中年衣食豐足，男有好妻，身閒心勞，多喜多憂，奔波事業；兄弟少力，六親冷淡，勤奮自立；女人賢能，防止嫉妒。
+壬子日坐刃、坐劫財，水太旺，漂亮。女命不會持家，有多少花多少，花心；男命好色，若經商發財，發多少失多少。
+壬水坐子水，水旺生聰。智性高遠，思維靈活。若土制有度則富貴，水泛則多奔波。宜教育、科技、流通與旅運。感情深遠而遷變多，慎理情志；健康防腰腎與血壓。''',
+    
+    '癸丑': '''
+癸水為雨露之水，水主智，坐下偏官、偏印、比肩。癸丑日生衣祿不少，凶中化吉，早年不順，財來財去，晚年好。女人操持之命，遭遇妒嫉，好事難全，少年弱，中年勞祿，老有歡樂。
+癸丑日生坐庫通根臨羊刃，人秀氣，坐下殺印生比肩，利兄弟，做事吃力不討好，勞累奔波。癸水日主之人如果旁干多癸水必然記憶力極強，但如致身強必較保守，膽小而節儉。
+癸水居丑土，水潤而藏。性柔而堅，心思細膩。日主能化殺而生印，主聰明有恒，勤於規劃。宜金融、工程、管理或醫學。感情穩定，配偶助力。健康防寒濕與胃氣。''',
+    
+    '甲寅': '''
+甲木為棟樑之木，木主仁，坐下比肩、食神、偏印。甲寅日生為人誠實，利官見貴，家道興盛，父母有利，重拜雙親，男人怕妻，命硬三分。女人管夫，子息長。
+甲寅日柱身坐建祿，木旺身強，主人正直，性格仁慈。坐下比肩幫身，食神泄秀，偏印生身，一片順生，主富貴。女命甲寅，克夫，需配強者方能和諧。
+甲木居寅木，木氣專旺，為"建祿"之象。性情剛正，志氣高昂，具領導與開創精神。此日生人重義輕財，處事果決。若火來生身則光顯；若水多則木浮，宜守穩。宜實業、教育、管理之職。感情厚重，需互諒包容；健康防筋骨與肝膽。''',
+    
+    '乙卯': '''
+乙木為花果之木，木主仁，坐下比肩。乙卯日生志氣軒昂，衣祿豐足，計巧精妙，言行有詐，有成有敗；文武兩業，坎坷難免，金石為開，一事可成，女人福祿，勤儉添壽。
+乙卯日坐建祿，木旺身強，主人秀氣，性格溫和。坐下比肩幫身，主自立。若四柱有財官透干，主貴。女命乙卯，美麗，但易有感情波折。
+乙木居卯木，木氣專旺，為"建祿"之地。性情溫柔而堅韌，心靈手巧，具藝術與創造天賦。此日生人處事細膩，善於溝通。若金來制木則貴顯；若火多則木焦，宜適度。宜文化、設計、教育、服務業。感情細膩而需誠意；健康防肝膽與筋骨。''',
+    
+    '丙辰': '''
+丙火為太陽之火，火主禮，坐下食神、正官、正印。丙辰日生聰明才智，手足伶俐，衣祿無虧；身閒心勞，愛交朋友，中年興隆，女人犧牲利益，持家方興旺。
+丙辰日坐冠帶，火旺身強，主人聰明，性格開朗。坐下食神生財，正官制身，正印生身，一片順生，主富貴。女命丙辰，旺夫益子。
+丙火居辰土，火生土旺，為"食神制殺"之象。性情開朗，熱情洋溢，具領導與表現能力。此日生人重情重義，處事明快。若水來制火則貴顯；若木多則火熾，宜平衡。宜教育、管理、文化、能源業。感情熱烈而需節制；健康防眼疾與心火。''',
+    
+    '丁巳': '''
+丁火為燈燭之火，火主禮，坐下劫財、傷官、正財。丁巳日生為人剛烈，聰明伶俐，但喜怒無常；一生奔波，難享祖業，全靠自立，白手成家，人緣關係好。
+丁巳日坐帝旺，火旺身強，主人聰明，性格剛烈。坐下劫財幫身，傷官泄秀，正財生身，主富貴。但火過旺，需水調候。女命丁巳，美麗，但易有感情波折。
+丁火居巳火，火炎照天，為"帝旺"之象。性情剛烈，志氣昂揚，具創新與突破精神。此日生人處事果決，敢於冒險。若水來調候則貴顯；若火過旺則急躁，宜修養。宜科技、能源、文化、管理之職。感情熱烈而需穩重；健康防血壓與眼疾。''',
+    
+    '戊午': '''
+戊土為城牆之土，土主信，坐下正印、劫財。戊午日生為人溫和，重義輕財；六親和睦，兄弟相幫，早年波折，中晚年興旺；女人持家方興旺，男人顧家多利業。
+戊午日坐帝旺，土旺身強，主人穩重，性格溫和。坐下正印生身，劫財幫身，主富貴。但土過旺，需木疏土。女命戊午，旺夫益子。
+戊土居午火，火生土旺，為"正印生身"之象。性情穩重，誠實可靠，具責任與包容能力。此日生人處事踏實，重信守諾。若木來疏土則貴顯；若土過旺則固執，宜靈活。宜實業、金融、教育、管理之職。感情穩重而需體恤；健康防脾胃與血壓。''',
+    
+    '己未': '''
+己土為田園之土，土主信，坐下比肩、偏印、偏財。己未日生口快心硬，衣祿小有，得貴人幫，體重勤儉，工作認真；女人賢慧持家，兒女晚見，辛苦中求發展，晚年對眼疾，應注意。
+己未日坐冠帶，土旺身強，主人穩重，性格溫和。坐下比肩幫身，偏印生身，偏財生身，主富貴。女命己未，美麗，旺夫益子。
+己土居未土，土氣專旺，為"比肩幫身"之象。性情穩重，勤奮踏實，具持家與理財能力。此日生人處事細心，重實際。若木來疏土則貴顯；若火來生土則富厚，宜平衡。宜實業、金融、教育、服務業。感情穩重而需溝通；健康防脾胃與筋骨。''',
+    
+    '庚申': '''
+庚金為斧鉞之金，金主義，坐下比肩、食神、偏印。庚申日生手足不停，為人清高，利官近貴；夫妻口角，煩多愛少，做好事難得好報，救人無功，遭遇妒嫉；女人興旺，勤儉持家。
+庚申日坐建祿，金旺身強，主人剛強，性格正直。坐下比肩幫身，食神泄秀，偏印生身，主富貴。女命庚申，美麗，但易有感情波折。
+庚金居申金，金氣專旺，為"建祿"之象。性情剛強，正直無私，具開創與突破能力。此日生人處事果決，重義輕財。若火來煉金則成器；若水多則金沉，宜適度。宜軍警、工程、科技、管理之職。感情剛烈而需柔化；健康防肺與筋骨。''',
+    
+    '辛酉': '''
+辛金為首飾之金，金主義，坐下比肩。辛酉日生為人伶俐，面氣清爽，艱辛創業，自謀高見，口舌能言，高人敬重，財力廣大，六親冷淡，骨肉情疏，女人賢達。
+辛酉日坐建祿，金旺身強，主人聰明，性格溫和。坐下比肩幫身，主自立。若四柱有財官透干，主貴。女命辛酉，美麗，但易有感情波折。
+辛金居酉金，金氣專旺，為"建祿"之地。性情溫和，聰明伶俐，具藝術與審美能力。此日生人處事細膩，善於溝通。若火來煉金則成器；若水多則金沉，宜適度。宜文化、藝術、金融、設計之職。感情細膩而需誠意；健康防肺與牙齒。''',
+    
+    '壬戌': '''
+壬水為江河之水，水主智，坐下偏官、偏印、劫財。壬戌日生好行善事，四處不停，心勞尤多，衣食不缺，結交貴人，提拔機遇，早年平，中年奔波，老年豐隆。女人助夫，勤儉持家。
+壬戌日坐冠帶，水旺身強，主人聰明，性格溫和。坐下偏官制身，偏印生身，劫財幫身，主富貴。女命壬戌，美麗，旺夫益子。
+壬水居戌土，水土交融，為"偏官制身"之象。性情聰明，善於應變，具智慧與謀略能力。此日生人處事靈活，重情重義。若土來制水則貴顯；若水過旺則泛濫，宜節制。宜教育、科技、流通、服務業。感情深遠而需穩定；健康防腎與脾胃。''',
+    
+    '癸亥': '''
+癸水為雨露之水，水主智，坐下傷官、劫財。癸亥日生為人剛直，言語坦然，不順人情；六親疏遠，交往淡淡；自立家業，女人緣旺，機會屢屢，但多不相對，晚景發達。
+癸亥日坐帝旺，水旺身強，主人聰明，性格剛直。坐下傷官泄秀，劫財幫身，主富貴。但水過旺，需土制水。女命癸亥，美麗，但易有感情波折。
+癸水居亥水，水氣專旺，為"帝旺"之象。性情剛直，聰明伶俐，具創造與表達能力。此日生人處事靈活，善於溝通。若土來制水則貴顯；若水過旺則泛濫，宜節制。宜文化、藝術、教育、服務業。感情豐富而需穩定；健康防腎與脾胃。'''
+}
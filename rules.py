@@ -0,0 +1,1018 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# CreateDate: 2025-10-30
+"""
+十神、格局断语的规则表。
+
+每条 Rule 为 (索引键, 条件, 断语)：
+    索引键：形如 "月令:比"、"天干:财,才"、"日主:甲,乙"、"格局:官"、"地支:劫"，
+            多个取值任一命中即为候选；可有多组，以空格分隔，如 "天干:枭 地支:枭"。
+            "" 表示每个命盘都要检查，只用于条件推不出任何索引键的规则。
+    条件：  函数 when(c)，c 为命盘特征 (Chart.rule_features)，以属性访问，如 c.gan_shens；None 为恒真。
+    断语：  输出文本，或按命盘生成文本的函数 text(c)。
+Each 对四柱逐柱检查，柱序为 seq：guard(c, seq) 为该柱的前置条件，其中各条 Rule 的条件、断语也多一个参数 seq。
+
+条件中反复用到的计数（如天干十神的个数 c.gan_shen_num['财']）在 rule_features 中只算一次。
+RuleBook 按索引键建倒排表，只对可能命中的规则求值，输出顺序与规则表顺序一致；
+并记下每条规则读取的特征名，另一命盘只有部分特征不同时（如只换时辰），
+读到的特征都没变的规则可沿用其输出，见 RuleBook.outputs。
+RuleStats 可选地累计每条规则的求值、命中次数和报告各部分的耗时。
+"""
+
+import collections
+import csv
+import json
+import os
+import types
+
+from common import gan_ke, get_empty, is_yang, jin_jiao, not_yang, zhi_ku
+from datas import day_shens, empties, lu_ku_cai, shang_guans, tianyuans
+from ganzhi import gan_ids, kus, ten_deities, zhengs, zhi5
+
+Rule = collections.namedtuple("Rule", "keys when text end", defaults=('\n',))
+Each = collections.namedtuple("Each", "keys when guard rules")
+
+
+def trigger_keys(features):
+    """命盘的索引键：日主、月令十神、格局，以及天干透出、地支主气的十神。"""
+    keys = {('日主', features['me']), ('月令', features['zhi_shens'][1]),
+            ('格局', features['ge'])}
+    keys.update(('天干', shen) for shen in features['gan_shens'])
+    keys.update(('地支', shen) for shen in features['zhi_shens'])
+    return keys
+
+
+def _names(func):
+    """条件或断语函数读取的名字（特征名、全局名），含推导式等内嵌代码中的。"""
+    if func is None or isinstance(func, str):
+        return set()
+    return _code_names(func.__code__)
+
+
+def _code_names(code):
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if hasattr(const, 'co_names'):
+            names |= _code_names(const)
+    return names
+
+
+def _where(func):
+    """条件函数在源文件中的位置，如 'rules.py:251'，供统计表定位规则。"""
+    if func is None:
+        return ''
+    code = func.__code__
+    return '{}:{}'.format(os.path.basename(code.co_filename), code.co_firstlineno)
+
+
+def _parse_keys(keys):
+    result = []
+    for group in keys.split():
+        label, values = group.split(':')
+        result.extend((label, value) for value in values.split(','))
+    return tuple(result)
+
+
+class RuleBook:
+    """规则表，按索引键分派。"""
+
+    def __init__(self, rules, name=''):
+        self.rules = rules
+        self.name = name
+        self.entries = []
+        self.reads = []     # 每条规则读取的名字
+        self.always = []
+        self.index = collections.defaultdict(list)
+        for order, rule in enumerate(rules):
+            if isinstance(rule, Each):
+                entry = (rule.when, range(4), rule.guard, tuple((r.when, r.text, r.end) for r in rule.rules))
+            else:
+                entry = (rule.when, (None,), None, ((None, rule.text, rule.end),))
+            self.entries.append(entry)
+            when, seqs, guard, body = entry
+            reads = _names(when) | _names(guard)
+            for cond, text, end in body:
+                reads |= _names(cond) | _names(text)
+            self.reads.append(frozenset(reads))
+            keys = _parse_keys(rule.keys)
+            if not keys:
+                self.always.append(order)
+            for key in keys:
+                self.index[key].append(order)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def candidates(self, keys):
+        """可能命中的规则序号，按表序排列。"""
+        orders = set(self.always)
+        for key in keys:
+            orders.update(self.index.get(key, ()))
+        return sorted(orders)
+
+    @staticmethod
+    def _scope(features):
+        return types.SimpleNamespace(**features)
+
+    def _fire(self, order, c):
+        when, seqs, guard, body = self.entries[order]
+        if when is not None and not when(c):
+            return
+        if seqs[0] is None:
+            cond, text, end = body[0]
+            yield 0, (text if isinstance(text, str) else text(c)), end
+            return
+        for seq in seqs:
+            if guard is not None and not guard(c, seq):
+                continue
+            for sub, (cond, text, end) in enumerate(body):
+                if cond is None or cond(c, seq):
+                    yield sub, (text if isinstance(text, str) else text(c, seq)), end
+
+    def _fire_counted(self, order, scope, stats):
+        stats.checked(self, order)
+        for sub, text, end in self._fire(order, scope):
+            stats.hit(self, order, sub)
+            yield sub, text, end
+
+    def run(self, features, stats=None):
+        """逐条产出 (断语, end)；stats 为 RuleStats 时记录求值和命中次数。"""
+        scope = self._scope(features)
+        for order in self.candidates(trigger_keys(features)):
+            fired = self._fire(order, scope) if stats is None else self._fire_counted(order, scope, stats)
+            for sub, text, end in fired:
+                yield text, end
+
+    def outputs(self, features, before=None):
+        """{规则序号: ((断语, end), ...)}，含未命中的候选规则（输出为空）。
+
+        before 为另一命盘的 (特征, outputs)：读取的特征都与之相同的规则直接沿用其输出，不再求值。
+        """
+        reuse = {}
+        if before is not None:
+            old, fired = before
+            changed = {name for name, value in features.items() if name not in old or old[name] != value}
+            reuse = {order: texts for order, texts in fired.items() if changed.isdisjoint(self.reads[order])}
+        scope = None
+        result = {}
+        for order in self.candidates(trigger_keys(features)):
+            texts = reuse.get(order)
+            if texts is None:
+                if scope is None:
+                    scope = self._scope(features)
+                texts = tuple((text, end) for sub, text, end in self._fire(order, scope))
+            result[order] = texts
+        return result
+
+    def run_many(self, features_list, stats=None):
+        """对多个命盘一起求值，返回各命盘的 [(断语, end), ...]。
+
+        按规则逐条扫过所有命盘，只有索引键命中的命盘才会检查该规则。
+        """
+        scopes = [self._scope(features) for features in features_list]
+        by_order = collections.defaultdict(list)
+        for i, features in enumerate(features_list):
+            for order in self.candidates(trigger_keys(features)):
+                by_order[order].append(i)
+        results = [[] for _ in scopes]
+        for order in sorted(by_order):
+            for i in by_order[order]:
+                fired = self._fire(order, scopes[i]) if stats is None else self._fire_counted(order, scopes[i], stats)
+                results[i].extend((text, end) for sub, text, end in fired)
+        return results
+
+
+class RuleStats:
+    """规则命中次数与报告各部分耗时的累计统计，可跨多个命盘汇总后写成 JSON 或 CSV。
+
+    不加锁，多线程排盘时每个线程应使用各自的 RuleStats。
+    """
+
+    FIELDS = ('kind', 'name', 'keys', 'when', 'guard', 'cond', 'text', 'calls', 'hits', 'seconds')
+
+    def __init__(self):
+        self.charts = 0
+        self.books = {}
+        self.checks = collections.Counter()     # (规则表, 序号) -> 求值次数
+        self.hits = collections.Counter()       # (规则表, 序号, 子序号) -> 输出条数
+        self.calls = collections.Counter()      # 部分 -> 调用次数
+        self.seconds = collections.Counter()    # 部分 -> 累计秒数
+
+    def checked(self, book, order):
+        self.books.setdefault(book.name, book)
+        self.checks[book.name, order] += 1
+
+    def hit(self, book, order, sub):
+        self.hits[book.name, order, sub] += 1
+
+    def add_section(self, name, seconds):
+        self.calls[name] += 1
+        self.seconds[name] += seconds
+
+    def section_rows(self):
+        return [{'kind': 'section', 'name': name, 'calls': self.calls[name],
+                 'seconds': round(self.seconds[name], 6)} for name in self.calls]
+
+    def rule_rows(self):
+        """每条规则一行，含从未命中的规则；Each 的每条子规则各占一行。条件及按命盘生成的断语记其源码位置。"""
+        rows = []
+        for name, book in self.books.items():
+            for order, rule in enumerate(book.rules):
+                each = isinstance(rule, Each)
+                for sub, item in enumerate(rule.rules if each else (rule,)):
+                    rows.append({
+                        'kind': 'rule',
+                        'name': '{}:{}.{}'.format(name, order, sub) if each else '{}:{}'.format(name, order),
+                        'keys': rule.keys,
+                        'when': _where(rule.when),
+                        'guard': _where(rule.guard) if each else '',
+                        'cond': _where(item.when) if each else '',
+                        'text': item.text[:40] if isinstance(item.text, str) else _where(item.text),
+                        'calls': self.checks[name, order],
+                        'hits': self.hits[name, order, sub],
+                    })
+        return rows
+
+    def as_dict(self):
+        return {'charts': self.charts, 'sections': self.section_rows(), 'rules': self.rule_rows()}
+
+    def write(self, path):
+        """按扩展名写出：.csv 为单张表（kind 区分 section/rule），其余为 JSON。"""
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            if path.lower().endswith('.csv'):
+                writer = csv.DictWriter(f, self.FIELDS)
+                writer.writeheader()
+                writer.writerows(self.section_rows() + self.rule_rows())
+            else:
+                json.dump(self.as_dict(), f, ensure_ascii=False, indent=2)
+
+
+ten_god_rules = (
+    # 地网
+    Rule("", lambda c: '辰' in c.zhis and '巳' in c.zhis, "地网：地支辰巳。天罗：戌亥。天罗地网全凶。"),
+    # 天罗
+    Rule("", lambda c: '戌' in c.zhis and '亥' in c.zhis, "天罗：戌亥。地网：地支辰巳。天罗地网全凶。"),
+    # 魁罡格
+    Rule("", lambda c: c.zhus[2] in (('庚', '辰'), ('庚', '戌'), ('壬', '辰'), ('戊', '戌')),
+         "魁罡格：基础96，日主庚辰,庚戌,壬辰, 戊戌，重叠方有力。日主强，无刑冲佳。"),
+    Rule("", lambda c: c.zhus[2] in (('庚', '辰'), ('庚', '戌'), ('壬', '辰'), ('戊', '戌')),
+         "魁罡四柱曰多同，贵气朝来在此中，日主独逢冲克重，财官显露祸无穷。魁罡重叠是贵人，天元健旺喜临身，财官一见生灾祸，刑煞俱全定苦辛。"),
+    # 金神格
+    Rule("", lambda c: c.zhus[3] in (('乙', '丑'), ('己', '巳'), ('癸', '酉')),
+         "金神格：基础97，时柱乙丑、己巳、癸酉。只有甲和己日，甲日为主，甲子、甲辰最突出。月支通金火2局为佳命。不通可以选其他格"),
+    # 六阴朝阳
+    Rule("日主:辛", lambda c: c.zhis.time == '子', "六阴朝阳格：基础98，辛日时辰为子。"),
+    # 六乙鼠贵
+    Rule("日主:乙", lambda c: c.zhis.time == '子',
+         "六阴朝阳格：基础99，乙日时辰为子。忌讳午冲，丑合，不适合有2个子。月支最好通木局，水也可以，不适合金火。申酉大运有凶，午也不行。夏季为伤官。入其他格以格局论。"),
+    # 从格
+    Rule("", lambda c: max(c.scores.values()) > 25, "有五行大于25分，需要考虑专格或者从格。"),
+    Rule("", lambda c: max(c.scores.values()) > 25, "从旺格：安居远害、退身避位、淡泊名利,基础94;从势格：日主无根。"),
+    Rule("", lambda c: c.zhi_6he[3] and abs(gan_ids[c.gans[3]] - gan_ids[c.gans[2]]) == 1,
+         "日时干邻支合：连珠得合：妻贤子佳，与事业无关。母法总则P21-11"),
+    Each("天干:才,财", None, None, (
+        Rule("", lambda c, seq: c.zhis[seq] == c.me_ku and c.gan_shens[seq] in ('才', '财'), "财坐劫库，大破败。母法P61-4 戊寅 丙辰 壬辰 庚子"),
+    )),
+    Rule("", lambda c: c.zhi_6chong[3] and c.gans[3] == c.me, "日时天比地冲：女为家庭辛劳，男艺术宗教。 母法P61-5 己丑 丙寅 甲辰 甲戌"),
+    Rule("", lambda c: c.zhi_xing[3] and gan_ke(c.me, c.gans[3]), "日时天克地刑：破败祖业、自立发展、后无终局。 母法P61-7 己丑 丙寅 甲午 庚午"),
+    Rule("", lambda c: (c.cai, c.yin_lu) in c.zhus and c.cai not in c.zhi_shens2, "浮财坐印禄:破祖之后，自己也败。 母法P78-29 辛丑 丁酉 壬寅 庚子"),
+    Each("", None, lambda c, seq: seq < 3 and not is_yang(c.me), (
+        Rule("", lambda c, seq: c.zhi_xing[seq] and c.zhi_xing[seq + 1] and gan_ke(c.gans[seq], c.gans[seq + 1]),
+             "阴日主天克地刑：孤独、双妻。 母法P61-7 己丑 丙寅 甲午 庚午"),
+    )),
+    # 建禄格
+    Rule("月令:比", None, "建禄格：最好天干有财官。如果官杀不成格，有兄弟，且任性。有争财和理财的双重性格。如果创业独自搞比较好，如果合伙有完善的财务制度也可以。"),
+    Rule("月令:比", lambda c: c.gan_shens[0] in '比劫', "\t建禄年透比劫凶"),
+    Rule("月令:比", lambda c: c.gan_shens[0] not in '比劫' and '财' in c.gan_shens and '官' in c.gan_shens, "\t建禄财官双透，吉"),
+    Rule("月令:比", lambda c: c.me in ('甲', '乙'), "\t甲乙建禄四柱劫财多，无祖财，克妻，一生不聚财，做事虚诈，为人大模大样，不踏实。乙财官多可为吉。甲壬申时佳；乙辛巳时佳；"),
+    Rule("月令:比", lambda c: c.me in '丙', "\t丙：己亥时辰佳；"),
+    Rule("月令:比", lambda c: c.me in '丁', "\t丁：阴男克1妻，阳男克3妻。财官多可为吉。庚子时辰佳；"),
+    Rule("月令:比", lambda c: c.me in '戊', "\t戊：四柱无财克妻，无祖业，后代多事端。如合申子辰，子息晚，有2子。甲寅时辰佳；"),
+    Rule("月令:比", lambda c: c.me in '己', "\t己：即使官财出干成格，妻也晚。偏财、杀印成格为佳。乙丑时辰佳；"),
+    Rule("月令:比", lambda c: c.me in '庚', "\t庚：上半月生难有祖财，下半月较好，财格比官杀要好。丙戌时辰佳；"),
+    Rule("月令:比", lambda c: c.me in '辛', "\t辛：干透劫财，妻迟财少；丁酉时辰佳；"),
+    Rule("月令:比", lambda c: c.me in '壬', "\t 壬：戊申时辰佳；"),
+    Rule("月令:比", lambda c: c.me in '癸', "\t 癸：己亥时辰佳"),
+    # 甲分析
+    Rule("日主:甲", lambda c: c.zhi_num['辰'] > 1 or c.zhi_num['戌'] > 1, "甲日：辰或戌多、性能急躁不能忍。"),
+    Rule("日主:甲", lambda c: c.zhis[2] == '子', "甲子：调候要火。"),
+    Rule("日主:甲", lambda c: c.zhis[2] == '寅', "甲寅：有主见之人，需要财官旺支。"),
+    Rule("日主:甲", lambda c: c.zhis[2] == '辰', "甲辰：印库、性柔和而有实权。"),
+    Rule("日主:甲", lambda c: c.zhis[2] == '午', "甲午：一生有财、调候要水。"),
+    Rule("日主:甲", lambda c: c.zhis[2] == '戌', "甲戌：自坐伤官，不易生财，为人仁善。"),
+    Rule("日主:庚,辛", lambda c: c.zhis[1] == '子' and c.zhi_num['子'] > 1, "冬金子月，再有一子字，孤克。 母法P28-106 甲戌 丙子 庚子 丁丑"),
+    # 比肩分析
+    Rule("天干:比", None,
+         "比：同性相斥。讨厌自己。老是想之前有没有搞错。没有持久性，最多跟你三五年。 散财，月上比肩，做事没有定性，不看重钱，感情不持久。不怀疑人家，人心很好。善意好心惹麻烦。年上问题不大。"),
+    Rule("天干:比", lambda c: c.gan_shens[0] == '比' and c.gan_shens[1] == '比',
+         "比肩年月天干并现：不是老大，出身平常。女仪容端庄，有自己的思想；不重视钱财,话多不能守秘。30随以前是非小人不断。"),
+    Rule("天干:比", lambda c: c.gan_shens[1] == '比' and '比' in c.zhi_shen3[1], "月柱干支比肩：争夫感情丰富。30岁以前钱不够花。"),
+    Rule("天干:比", lambda c: c.gan_shens[0] == '比', "年干比：與同輩之間有較多的合作或競爭。"),
+    Rule("天干:比", lambda c: c.zhi_shens[2] == '比', "基52女坐比透比:夫妻互恨 丙辰 辛卯 辛酉 甲午。"),
+    Rule("天干:比", lambda c: c.gan_shen_num['比'] > 1,
+         """----基51:天干2比
+        自我排斥，易后悔、举棋不定、匆促决定而有失；男倾向于群力，自己决策容易孤注一掷，小事谨慎，大事决定后不再重复考虑。
+        女有自己的思想、容貌佳，注意细节，喜欢小孩重过丈夫。轻视老公。对丈夫多疑心，容易吃醋冲动。
+        男不得女欢心.
+        难以保守秘密，不适合多言；
+        地支有根，一生小是非不断。没官杀制，无耐心。 END"""),
+    Rule("天干:比", lambda c: c.shen2_num['比'] > 2 and '比' in c.zhi_shens,
+         '''----比肩过多：
+        女的爱子女超过丈夫；轻易否定丈夫。 换一种说法：有理想、自信、贪财、不惧内。男的双妻。
+        兄弟之间缺乏帮助。夫妻有时不太和谐。好友知交相处不会很久。
+        即使成好格局，也是劳累命，事必躬亲。除非有官杀制服。感情烦心。
+        基53：善意多言，引无畏之争；难以保守秘密，不适合多言；易犯无事忙的自我表现；不好意思拒绝他人;累积情绪而突然放弃。
+        比肩过多，女：你有帮夫运，多协助他的事业，多提意见，偶尔有争执，问题也不大。女：感情啰嗦
+        对人警惕性低，乐天知命;情感过程多有波折
+        '''),
+    Rule("天干:比", lambda c: c.shen2_num['比'] > 2 and '比' in c.zhi_shens and not '官' in c.shens and not '杀' in c.shens,
+         "基51: 比肩多，四柱无正官七杀，性情急躁。"),
+    Rule("天干:比", lambda c: c.shen2_num['比'] > 2 and '比' in c.zhi_shens and '劫' in c.gan_shens,
+         "天干比劫并立，比肩地支专位，女命感情丰富，多遇争夫。基52"),
+    Rule("天干:比", lambda c: c.shen2_num['比'] > 2 and '比' in c.zhi_shens and c.gan_shens[0] == '比', "年干为比，不是长子，父母缘较薄，晚婚。"),
+    Rule("天干:比", lambda c: c.shen2_num['比'] > 2 and '比' in c.zhi_shens and c.gan_shens[3] == '比',
+         "母法总则P21-6：时干为比，如日时地支冲，男的对妻子不利，女的为夫辛劳，九流艺术、宗教则关系不大。"),
+    Rule("天干:比", lambda c: c.shen2_num['比'] > 2 and '比' in c.zhi_shens and c.gan_shens[1] == '比' and c.zhi_shens[1] == '食',
+         "月柱比坐食，易得贵人相助。"),
+    Rule("天干:比", lambda c: c.shen2_num['比'] > 2 and '比' in c.zhi_shens and c.gan_shens[1] == '比' and c.zhi_shens[1] == '伤',
+         "月柱比坐伤，一生只有小财气，难富贵。"),
+    Rule("天干:比", lambda c: c.shen2_num['比'] > 2 and '比' in c.zhi_shens and c.gan_shens[1] == '比' and c.zhi_shens[1] == '比',
+         "月柱比坐比，单亲家庭，一婚不能到头。地支三合或三会比，天干2比也如此。"),
+    Rule("天干:比", lambda c: c.shen2_num['比'] > 2 and '比' in c.zhi_shens and c.gan_shens[1] == '比' and c.zhi_shens[1] == '财',
+         "月柱比坐财，不利妻，也主父母身体不佳。因亲友、人情等招财物的无谓损失。"),
+    Rule("天干:比", lambda c: c.shen2_num['比'] > 2 and '比' in c.zhi_shens and c.gan_shens[1] == '比' and c.zhi_shens[1] == '杀',
+         "月柱比坐杀，稳重。"),
+    Each("天干:比", None, lambda c, seq: c.gan_shens[seq] == '比', (
+        Rule("", lambda c, seq: c.zhis[seq] in empties[c.zhus[2]],
+             "基51:比肩坐空亡，不利父亲与妻。年不利父，月不利父和妻，在时则没有关系。甲戌 丙寅 甲子 己巳\n\t基52女：夫妻缘分偏薄，在年只是不利父，在月30岁以前夫妻缘薄 E"),
+        Rule("", lambda c, seq: c.zhi_shens[seq] == '比', "比坐比-平吉：与官杀对立，无主权。养子：克偏财，泄正印。吉：为朋友尽力；凶：受兄弟朋友拖累。父缘分薄，自我孤僻，男多迟婚"),
+        Rule("", lambda c, seq: c.zhi_shens[seq] == '劫',
+             "女比肩坐劫:夫妻互恨，基52丁丑 壬子 壬戌 壬寅。\n\t还有刑冲且为羊刃，女恐有不测之灾：比如车祸、开刀和意外等。基52丙午 庚子 丙戌 丙申"),
+        Rule("", lambda c, seq: c.zhi_shens[seq] == '劫', "比坐劫-大凶：为忌亲友受损，合作事业中途解散，与妻子不合。如年月3见比，父缘薄或已死别。"),
+        Rule("", lambda c, seq: c.zhi_shens[seq] == '劫' and ten_deities[c.gans[seq]][c.zhis[seq]] == '绝' and seq < 2,
+             "比肩坐绝，兄弟不多，或者很难谋面。戊己和壬癸的准确率偏低些。"),
+        Rule("", lambda c, seq: c.zhi_shens[seq] == '财', "比肩坐财：因亲人、人情等原因引起无谓损失。"),
+        Rule("", lambda c, seq: c.zhi_shens[seq] == '杀', "比肩坐杀:稳重。"),
+        Rule("", lambda c, seq: c.zhi_shens[seq] == '枭', "比肩坐偏印：三五年发达，后面守成。"),
+        Rule("", lambda c, seq: c.zhi_shens[seq] == '劫' and gan_ids[c.me] % 2 == 0,
+             "比肩坐阳刃：父亲先亡，基于在哪柱判断时间。基51：丙午 丙申 丙申 丁酉。E在年不利父，在其他有刀伤、车祸、意外灾害。\t基52女命年克父亲，月若30岁以前结婚不利婚姻"),
+        Rule("", lambda c, seq: c.zhi_shens[seq] in ('劫', '比') and '劫' in c.gan_shens, "天干比劫并立，比肩又坐比劫，女多遇争夫，个性强，不易协调。"),
+        Rule("", lambda c, seq: c.zhi_xing[seq], "比肩坐刑(注意不是半刑)，幼年艰苦，白手自立长。 甲申 己巳 甲寅 庚午 基51"),
+        Rule("", lambda c, seq: c.zhi_xing[seq] and c.zhi_shens[seq] == '劫', "比肩坐刑劫,兄弟不合、也可能与妻子分居。"),
+        Rule("", lambda c, seq: c.zhi_6chong[seq], "比肩冲，手足不和，基于柱定时间 甲申 己巳 甲寅 庚午 基51。女命忌讳比劫和合官杀，多为任性引发困难之事。"),
+    )),
+    Rule("地支:比", lambda c: c.zhi_shens[2] == '比', "日支比：1-39对家务事有家长式领导；钱来得不容易且有时有小损财。e 自我，如有刑冲，不喜归家！"),
+    Rule("地支:比", lambda c: c.zhi_shens[3] == '比', "时支比：子女为人公正倔强、行动力强，能得资产。"),
+    Rule("月令:比", None, "月柱比：三十岁以前难有成就。冒进、不稳定。女友不持久、大男子主义。"),
+    Rule("天干:比 地支:比", lambda c: '比' in (c.gan_shens[3], c.zhi_shens[3]), "时柱比：与亲人意见不合。"),
+    Rule("", lambda c: c.bi_num + c.jie_num > 1, "比劫大于2，男：感情阻碍、事业起伏不定。"),
+    # 日坐禄
+    Rule("天干:比,劫", lambda c: c.me_lu == c.zhis[2] and c.zhi_num[c.me_lu] > 1 and c.yin_lu in c.zhis and ('比' in c.gan_shens or '劫' in c.gan_shens),
+         "双禄带比印（专旺）、孤克之命。比论孤，劫论凶。母法总则P20-3。比禄印劫不可合见四位"),
+    Rule("天干:比", lambda c: c.me_lu == c.zhis[2] and c.zhi_6he[2] and '比' in c.gan_shens and c.yin_lu in c.zhis,
+         "透比，坐禄六合，有印专旺：官非、残疾。六合近似劫财，如地支会印，法死。 母法总则P20-4"),
+    Rule("天干:比", lambda c: c.me_lu == c.zhis[2] and c.zhi_6he[2] and '比' in c.gan_shens, "透比，坐禄六合，如地支会印，法死。 母法总则P20-4"),
+    Rule("天干:财", lambda c: c.me_lu == c.zhis[2] and ((c.zhi_xing[3] and c.gan_he[3] and c.gan_shens[3] == '财') or (c.zhi_xing[2] and c.gan_he[2] and c.zhi_xing[1] and c.gan_he[1] and c.gan_shens[1] == '财')),
+         "日禄与正财干合支刑：克妻子，即便是吉命，也无天伦之乐。 母法总则P22-21"),
+    Rule("", lambda c: c.zhi_num[c.me_lu] > 2, "禄有三，孤。 母法总则P23-36"),
+    Rule("天干:才,财", lambda c: c.zhis[3] == c.me_ku and ('财' in c.gan_shens or '才' in c.gan_shens),
+         "时支日库，透财：清高、艺术九流。 母法总则P59-5 己未 辛未 丁巳 庚戌 P61-8 丁未 壬寅 癸卯 丙辰"),
+    Rule("", lambda c: c.zhis[3] == c.me_ku and c.piancai_lu == c.zhis[2], "时支日库，坐偏财：吉祥近贵，但亲属淡薄。 母法总则P59-6 辛未 辛卯 丁酉 庚戌"),
+    # 时坐禄
+    Rule("天干:伤", lambda c: c.me_lu == c.zhis[3] and '伤' in c.gan_shens and '伤' in c.zhi_shens2,
+         "时禄，伤官格，晚年吉。 母法总则P56-26 己未 丙寅 乙丑 己卯"),
+    Rule("天干:杀", lambda c: c.me_lu == c.zhis[3] and '杀' == c.gan_shens[3], "杀坐时禄：为人反复不定。 母法总则P56-28 己未 丙寅 乙丑 己卯"),
+    # 自坐劫库
+    Rule("天干:杀", lambda c: c.zhis[2] == c.me_ku and c.gan_shens[3] == '杀' and '杀' in c.zhi_shen3[3],
+         "自坐劫库,时杀格，贵！母法总则P30-143 辛未 辛卯 壬辰 戊申 母法总则P55-14 P60-22"),
+    Rule("天干:官", lambda c: c.zhis[2] == c.me_ku and c.gan_shens[3] == '官' and '官' in c.zhi_shen3[3],
+         "自坐劫库,正官格，孤贵！母法总则P56-24 辛未 辛卯 壬辰 戊申 母法总则P55-14"),
+    Rule("", lambda c: c.zhis[2] == c.me_ku and zhi_ku(c.zhis[3], (c.cai, c.piancai)),
+         "自坐劫库,时财库，另有刃禄孤刑艺术，无者辛劳！母法总则P30-149 母法总则P56-17 56-18"),
+    Rule("天干:财", lambda c: c.zhis[2] == c.me_ku and c.gan_shens[3] == '财' and '财' in c.zhi_shen3[3],
+         "自坐劫库，时正财格，双妻，丧妻。 母法总则P55-13 己酉 戊寅 壬辰 丁未 P61-6 乙酉 戊寅 壬辰 丁未"),
+    Rule("", lambda c: c.zhis[2] == c.me_ku and (c.yin, c.me_lu) in c.zhus, "自坐劫库,即便吉，也会猝亡 母法总则P61-9 丁丑 甲辰 壬辰 辛亥"),
+    # 劫财分析
+    Rule("天干:劫", None, "劫财扶助，无微不至。劫财多者谦虚之中带有傲气。凡事先理情，而后情理。先细节后全局。性刚强、精明干练、女命不适合干透支藏。"),
+    Rule("天干:劫", None, "务实，不喜欢抽象性的空谈。不容易认错，比较倔。有理想，但是不够灵活。不怕闲言闲语干扰。不顾及别人面子。"),
+    Rule("天干:劫", None, "合作事业有始无终。太重细节。做小领导还是可以的。有志向，自信。杀或食透干可解所有负面。女命忌讳比劫和合官杀，多为任性引发困难之事。"),
+    Rule("天干:劫", lambda c: c.gan_shens[0] == '劫' and c.gan_shens[1] == '劫', "劫年月天干并现：喜怒形于色，30岁以前大失败一次。过度自信，精明反被精明误。"),
+    Rule("天干:劫", lambda c: c.gan_shens[1] == '劫' and '劫' in c.zhi_shen3[1], "月柱干支劫：与父亲无缘，30岁以前任性，早婚防分手，自我精神压力极其重。"),
+    Rule("天干:劫", lambda c: c.gan_shens[1] == '劫' and c.zhis[1] == c.cai_lu and c.zhi_num[c.yin_lu] > 1,
+         "月干劫：月支财禄，如地支2旺印，旺财不敌，官非、刑名意外。"),
+    Rule("天干:劫", lambda c: c.shen2_num['劫'] > 2, '----劫财过多, 婚姻不好'),
+    Rule("天干:劫", lambda c: c.zhi_shens[2] == '劫',
+         "日坐劫财，透天干。在年父早亡，在月夫妻关系不好。比如财产互相防范；鄙视对方；自己决定，哪怕对方不同意；老夫少妻；身世有差距；斤斤计较；敢爱敢恨的后遗症\n\t以上多针对女。男的一般有双妻。天干有杀或食可解。基54丁未 己酉 丙午 己丑"),
+    Rule("", lambda c: c.zhus[2] in (('壬', '子'), ('丙', '午'), ('戊', '午')),
+         "日主专位劫财，壬子和丙午，晚婚。不透天干，一般是眼光高、独立性强。对配偶不利，互相轻视；若刑冲，做事立场不明遭嫉妒，但不会有大灾。女性婚后通常还有自己的事业,能办事。"),
+    Rule("", lambda c: ('劫', '伤') in c.shen_zhus or ('伤', '劫') in c.shen_zhus,
+         "同一柱中，劫财、阳刃伤官都有，外表华美，富屋穷人，婚姻不稳定，富而不久；年柱不利家长，月柱不利婚姻，时柱不利子女。伤官的狂妄。基55丙申 丁酉 甲子 丁卯"),
+    Rule("天干:劫", lambda c: c.gan_shens[0] == '劫', "年干劫财：家运不济。克父，如果坐劫财，通常少年失父；反之要看地支劫财根在哪一柱子。"),
+    Rule("月令:劫 天干:劫", lambda c: '劫' in (c.gan_shens[1], c.zhi_shens[1]), "月柱劫：容易孤注一掷，30岁以前难稳定。男早婚不利。"),
+    Rule("天干:劫 地支:劫", lambda c: '劫' in (c.gan_shens[3], c.zhi_shens[3]), "时柱劫：只要不是去经济大权还好。"),
+    Rule("地支:劫", lambda c: c.zhi_shens[2] == '劫', "日支劫：男的克妻，一说是家庭有纠纷，对外尚无重大损失。如再透月或时天干，有严重内忧外患。"),
+    Rule("地支:比", lambda c: '劫' in c.shens2 and '比' in c.zhi_shens and '印' in c.shens2 and not_yang(c.me), "阴干比劫印齐全，单身，可入道！"),
+    Rule("地支:劫", lambda c: c.zhi_shens[0] == '劫' and is_yang(c.me), "年阳刃：得不到长辈福；不知足、施恩反怨。"),
+    Rule("地支:劫", lambda c: c.zhi_shens[3] == '劫' and is_yang(c.me), "时阳刃：与妻子不和，晚无结果，四柱再有比刃，有疾病与外灾。"),
+    # 阳刃格
+    Rule("月令:劫", lambda c: is_yang(c.me), "阳刃格：喜七杀或三四个官。基础90 甲戊庚逢冲多祸，壬丙逢冲还好。"),
+    Rule("月令:劫", lambda c: is_yang(c.me) and c.me in ('庚', '壬', '戊'),
+         "阳刃'庚', '壬','午'忌讳正财运。庚逢辛酉凶，丁酉吉，庚辰和丁酉六合不凶。壬逢壬子凶，戊子吉；壬午和戊子换禄不凶。"),
+    Rule("月令:劫", lambda c: is_yang(c.me) and c.me not in ('庚', '壬', '戊'),
+         "阳刃'甲', '丙',忌讳杀运，正财偏财财库运还好。甲：乙卯凶，辛卯吉；甲申与丁卯暗合吉。丙：丙午凶，壬午吉。丙子和壬午换禄不凶。"),
+    Rule("月令:劫", lambda c: is_yang(c.me) and c.zhi_num[c.yin_lu] > 0 and c.gan_shens[1] == '劫',
+         "阳刃格月干为劫：如果印禄位有2个，过旺，凶灾。不透劫财，有一印禄,食伤泄，仍然可以吉。 母法总则P20-1"),
+    Rule("月令:劫", lambda c: is_yang(c.me) and c.gan_shens[3] == '枭' and '枭' in c.zhi_shen3[3],
+         "阳刃格:时柱成偏印格，贫、夭、带疾。 母法总则P28-107 癸未 辛酉 庚寅 戊寅"),
+    Rule("地支:劫", lambda c: c.zhi_shen_num['劫'] > 1 and gan_ids[c.me] % 2 == 0 and c.zhis.day == c.yin_lu,
+         "双阳刃，自坐印专位：刑妻、妨子。凶终、官非、意外灾害。母法总则P21-13"),
+    Rule("天干:比,劫", lambda c: c.zhi_shens[1:].count('劫') > 0 and gan_ids[c.me] % 2 == 0 and c.zhis.day == c.yin_lu and ('劫' in c.gan_shens or '比' in c.gan_shens),
+         "阳刃，自坐印专位，透比或劫：刑妻。母法总则P36-8 己酉 丁卯 甲子 乙亥"),
+    Rule("", lambda c: c.zhis[2] in (c.me_lu, c.me_di) and c.zhis[3] in (c.me_lu, c.me_di),
+         "日时禄刃全，如没有官杀制，刑伤父母，妨碍妻子。母法总则P30-151 丁酉 癸卯 壬子 辛亥 母法总则P31-153 "),
+    Each("天干:劫", None, lambda c, seq: c.gan_shens[seq] == '劫', (
+        Rule("", lambda c, seq: c.zhis[seq] in (c.cai_lu, c.piancai_lu), "劫财坐财禄，如逢冲，大凶。先冲后合和稍缓解！母法总则P21-7 书上实例不准！"),
+        Rule("", lambda c, seq: c.zhis[seq] in (c.cai_lu, c.piancai_lu) and c.zhi_shens[seq] == '财' and c.zhi_6he[seq],
+             "劫财坐六合财支：久疾暗病！母法总则P28-113 乙未 丙戌 辛亥 庚寅！"),
+    )),
+    Rule("天干:劫", lambda c: c.gan_shens[1] == '劫' and c.zhis[1] in (c.cai_lu, c.piancai_lu) and c.zhi_num[c.yin_lu] > 1 and '劫' in c.gan_shens,
+         "月干劫坐财禄，有2印禄，劫透，财旺也败：官非、刑名、意外灾害！  母法总则P20-2"),
+    # 自坐阳刃
+    Rule("", lambda c: '劫' in c.zhi_shen3[2] and is_yang(c.me) and c.zhis[2] in zhengs and c.zhis[3] in (c.cai_lu, c.piancai_lu),
+         "坐阳刃,时支财禄，吉祥但是妻子性格不受管制！母法总则P30-137 丁未 庚戌 壬子 乙巳"),
+    Rule("", lambda c: '劫' in c.zhi_shen3[2] and is_yang(c.me) and c.zhis[2] in zhengs and zhi_ku(c.zhis[3], (c.cai, c.piancai)),
+         "坐阳刃,时支财库，名利时进时退！母法总则P30-148 丙寅 壬寅 壬子 庚戌"),
+    Rule("天干:杀", lambda c: '劫' in c.zhi_shen3[2] and is_yang(c.me) and c.zhis[2] in zhengs and c.gan_shens[3] == '杀' and '杀' in c.zhi_shen3[3],
+         "坐阳刃,时杀格，贵人提携而富贵！母法总则P30-143 甲戌 丙寅 壬子 戊申"),
+    # 偏印分析
+    Rule("天干:枭", None, "----偏印在天干如成格：偏印在前，偏财(财次之)在后，有天月德就是佳命(偏印格在日时，不在月透天干也麻烦)。忌讳倒食，但是坐绝没有这能力。"),
+    Rule("天干:枭", None, "经典认为：偏印不能扶身，要身旺；偏印见官杀未必是福；喜伤官，喜财；忌日主无根；   女顾兄弟姐妹；男六亲似冰"),
+    Rule("天干:枭", None, "偏印格干支有冲、合、刑，地支是偏印的绝位也不佳。"),
+    Rule("天干:枭", lambda c: c.gan_shens[1] == '枭' and '枭' in c.zhi_shen3[1], "枭月重叠：福薄慧多，青年孤独，有文艺宗教倾向。"),
+    Rule("天干:枭", lambda c: c.zhi_shen2_num['枭'] > 1, "偏印根透2柱，孤独有色情之患难。做事有始无终，女声誉不佳！pd40"),
+    Rule("天干:枭", lambda c: c.zhi_shen2_num['枭'], "偏印成格基础89生财、配印；最喜偏财同时成格，偏印在前，偏财在后。最忌讳日时坐实比劫刃。"),
+    Rule("天干:枭", lambda c: c.shen2_num['枭'] > 2,
+         "偏印过多，性格孤僻，表达太含蓄，要别人猜，说话有时带刺。偏悲观。有偏财和天月德贵人可以改善。有艺术天赋。做事大多有始无终。如四柱全阴，女性声誉不佳。"),
+    Rule("天干:枭", lambda c: c.shen2_num['枭'] > 2, "对兄弟姐妹不错。男的因才干受子女尊敬。女的偏印多，子女不多。第1克伤食，第2艺术性。"),
+    Rule("天干:枭", lambda c: c.shen2_num['枭'] > 2 and '伤' in c.gan_shens, "女命偏印多，又与伤官同透，夫离子散。有偏财和天月德贵人可以改善。"),
+    Rule("天干:枭", lambda c: c.gan_shen_num['枭'] > 1, "天干两个偏印：迟婚，独身等，婚姻不好。三偏印，家族人口少，亲属不多建。基56甲午 甲戌 丙午 丙申"),
+    Rule("天干:枭", lambda c: c.shen_zhus[0] == ('枭', '枭'), "偏印在年，干支俱透，不利于长辈。偏母当令，正母无权，可能是领养，庶出、同父异母等。 基56乙卯 甲申 丁丑 丁未"),
+    Rule("天干:枭", lambda c: c.zhi_shen3[1] == ['枭'], "月专位偏印：有手艺。坐衰其貌不扬。"),
+    Each("天干:枭 地支:枭", None, lambda c, seq: c.zhi_shens[seq] == '枭' or c.gan_shens[seq] == '枭', (
+        Rule("", lambda c, seq: ten_deities[c.gans[seq]][c.zhis[seq]] == '绝',
+             "偏印坐绝，或者天干坐偏印为绝，难以得志。费力不讨好。基56辛酉 辛卯 丁巳 甲辰  丁卯 丁未 己丑 丁卯"),
+        Rule("", lambda c, seq: c.gan_shens[seq] == '枭' and '枭' in c.zhi_shen3[seq], "干支都与偏印，克夫福薄！"),
+        Rule("", lambda c, seq: c.gan_shens[seq] == '枭' and '比' in c.zhi_shen3[seq], "偏印坐比：劳心劳力，常遇阴折 pd41"),
+        Rule("", lambda c, seq: c.gan_shens[seq] == '枭' and c.zhi_shens[seq] == '伤', "偏印坐伤官：克夫丧子 pd41"),
+    )),
+    Rule("天干:枭", lambda c: c.zhi_shens[3] == '枭' and c.gan_shens[0] == '枭', "偏印透年干-时支，一直受家里影响。"),
+    Rule("天干:枭 地支:枭", lambda c: '枭' in (c.gan_shens[0], c.zhi_shens[0]), "偏印在年：少有富贵家庭；有宗教素养，不喜享乐，第六感强。"),
+    Rule("月令:枭 天干:枭", lambda c: '枭' in (c.gan_shens[1], c.zhi_shens[1]), "偏印在月：有慧少福，能舍己为人。"),
+    Rule("月令:枭", lambda c: '枭' in (c.gan_shens[1], c.zhi_shens[1]) and c.zhi_shens[1] == '枭' and c.zhis[1] in '子午卯酉',
+         "偏印专位在月支：比较适合音乐，艺术，宗教等。子午卯酉。22-30之间职业定型。基56：壬午 癸卯 丁丑 丁未"),
+    Rule("月令:枭", lambda c: '枭' in (c.gan_shens[1], c.zhi_shens[1]) and c.zhi_shens[1] == '枭' and c.zhis[1] in '子午卯酉' and c.gan_shens[1] == '枭',
+         "干支偏印月柱，专位入格，有慧福浅，不争名利。基57:戊子 辛酉 癸未 丁巳"),
+    Rule("天干:枭 地支:枭", lambda c: '枭' in (c.gan_shens[3], c.zhi_shens[3]), "偏印在时：女与后代分居；男50以前奠定基础，晚年享清福。"),
+    Rule("", lambda c: c.zhi_shens[2] == '枭' or c.zhis.day == c.xiao_lu, "偏印在日支：家庭生活沉闷"),
+    Rule("", lambda c: (c.zhi_shens[2] == '枭' or c.zhis.day == c.xiao_lu) and (c.zhi_6chong[2] or c.zhi_xing[2]),
+         "偏印在日支(专位？),有冲刑：孤独。基57：甲午 癸酉 丁卯 丁未 母法总则P55-5： 辛丑 辛卯 癸酉 戊午 P77-13"),
+    Rule("", lambda c: (c.zhi_shens[2] == '枭' or c.zhis.day == c.xiao_lu) and c.zhus[2] in (('丁', '卯'), ('癸', '酉')),
+         "日专坐偏印：丁卯和癸酉。婚姻不顺。又刑冲，因性格而起争端而意外伤害。 基56"),
+    Rule("", lambda c: (c.zhi_shens[2] == '枭' or c.zhis.day == c.xiao_lu) and c.zhis[3] == c.me_jue,
+         "日坐偏印，日支绝：无亲人依靠，贫乏。 母法总则P55-5：丙辰 丙申 丁卯 壬子。pd41 专位偏印：男女姻缘都不佳。"),
+    Rule("天干:枭", lambda c: (c.zhi_shens[2] == '枭' or c.zhis.day == c.xiao_lu) and '枭' in c.gan_shens and is_yang(c.me) and c.zhis.time == c.me_di,
+         "日坐偏印成格，时支阳刃：不利妻子，自身有疾病。 母法总则P55-6：甲子 甲戌 丙寅 甲午"),
+    Rule("", lambda c: (c.zhi_shens[2] == '枭' or c.zhis.day == c.xiao_lu) and c.gan_shens[3] == c.zhi_shens[3] == '劫',
+         "日坐偏印，时干支劫：因自己性格而引灾。 母法总则P57-34：甲子 甲戌 丙寅 甲午"),
+    Rule("", lambda c: (c.zhi_shens[2] == '枭' or c.zhis.day == c.xiao_lu) and c.zhi_num[c.me_di] > 1 and is_yang(c.me),
+         "日坐偏印，地支双阳刃：性格有极端倾向。 母法总则P57-35：甲申 庚午 丙寅 甲午"),
+    Rule("天干:枭", lambda c: c.zhis.time == c.xiao_lu and c.zhi_shens[3] == '枭' and '枭' in c.gan_shens and ('财' in c.shens2 or '才' in c.shens2),
+         "时支偏印成格有财：因机智引凶。 母法总则P60-18：甲申 乙亥 丁亥 癸卯"),
+    Rule("天干:枭", lambda c: c.zhis.time == c.xiao_lu and c.zhi_shens[3] == '枭' and '枭' in c.gan_shens and '财' not in c.shens2 and '才' not in c.shens2,
+         "时支偏印成格无财：顽固引凶。 母法总则P60-17：甲子 乙亥 丁亥 癸卯"),
+    # 印分析
+    Rule("天干:印", lambda c: '印' in c.zhi_shens2, "基础82，成格喜官杀、身弱、忌财克印。合印留财，见利忘义.透财官杀通关或印生比劫；合冲印若无他格或调候破格。日主强凶，禄刃一支可以食伤泄。"),
+    Rule("天干:印", lambda c: c.gan_shens[1] == '印' and '印' in c.zhi_shen3[1], "印月重叠：女迟婚，月阳刃者离寡，能独立谋生，有修养的才女。"),
+    Rule("天干:印", lambda c: c.gan_shens[0] == '印', "若年干印为喜且未受刑克：出身于富贵之家。"),
+    Rule("天干:印", lambda c: c.shen2_num['印'] > 2,
+         "正印多的：聪明有谋略，比较含蓄，不害人，识时务。正印不怕日主死绝，反而怕太强。日主强，正印多，孤寂，不善理财。 pd41男的克妻，子嗣少。女的克母。"),
+    Each("天干:印", None, lambda c, seq: c.gan_shens[seq] == '印', (
+        Rule("", lambda c, seq: ten_deities[c.gans[seq]][c.zhis[seq]] in ('绝', '死') and seq < 3, "正印坐死绝，或天干正印地支有冲刑，不利母亲。时柱不算。"),
+        Rule("", lambda c, seq: c.zhi_shens[seq] == '财',
+             "男正印坐正财，夫妻不好。月柱正印坐正财专位，必离婚。在时柱，50多岁才有正常婚姻。(男) 基59 乙酉 己卯 庚子 丁亥  庚申 庚辰 庚午 己卯"),
+        Rule("", lambda c, seq: c.zhi_shens[seq] == '印',
+             "正印坐正印，专位，过于自信。基59：戊辰 乙卯 丙申 丙申。务实，拿得起放得下。女的话大多晚婚。母长寿；女子息迟，头胎恐流产。女四柱没有官杀，没有良缘。男的搞艺术比较好，经商则孤僻，不聚财。"),
+        Rule("", lambda c, seq: c.zhi_shens[seq] == '枭' and len(zhi5[c.zhis[seq]]) == 1,
+             "正印坐偏印专位：基59壬寅 壬子 乙酉 甲申。有多种职业;家庭不吉：亲人有疾或者特别嗜好。子息迟;财务双关。明一套，暗一套。女的双重性格。"),
+        Rule("", lambda c, seq: c.zhi_shens[seq] == '伤', "正印坐伤官：适合清高的职业。不适合追逐名利，女的婚姻不好。基59辛未 丁酉 戊子 丙辰"),
+        Rule("", lambda c, seq: c.zhi_shens[seq] == '劫' and c.me in ('甲', '庚', '壬'), "正印坐阳刃，身心多伤，心疲力竭，偶有因公殉职。主要指月柱。工作看得比较重要。"),
+    )),
+    Rule("天干:印", lambda c: '杀' in c.gan_shens and '劫' in c.zhi_shens and c.me in ('甲', '庚', '壬'),
+         "正印、七杀、阳刃全：基60癸巳 庚申 甲寅 丁卯：女命宗教人，否则独身，清高，身体恐有隐疾，性格狭隘缺耐心。男小疾多，纸上谈兵，婚姻不佳，恐非婚生子女，心思细腻对人要求也高。"),
+    Rule("天干:印", lambda c: '官' in c.gan_shens or '杀' in c.gan_shens, "身弱官杀和印都透天干，格局佳。"),
+    Rule("天干:印", lambda c: '官' not in c.gan_shens and '杀' not in c.gan_shens, "单独正印主秀气、艺术、文才。性格保守"),
+    Rule("天干:印", lambda c: '官' in c.gan_shens or '杀' in c.gan_shens or '比' in c.gan_shens,
+         "正印多者，有比肩在天干，不怕财。有官杀在天干也不怕。财不强也没关系。"),
+    Rule("天干:印", lambda c: '官' not in c.gan_shens and '杀' not in c.gan_shens and '比' not in c.gan_shens, "正印怕财。"),
+    Rule("天干:印", lambda c: '财' in c.gan_shens, "印和财都透天干，都有根，最好先财后印，一生吉祥。先印后财，能力不错，但多为他人奔波。(男)"),
+    Rule("月令:印", None, "月支印：女命觉得丈夫不如自己，分居是常态，自己有能力。"),
+    Rule("月令:印", lambda c: c.gan_shens[1] == '印', "月干支印：男权重于名，女命很自信，与夫平权。pd41:聪明有权谋，自我"),
+    Rule("月令:印", lambda c: c.gan_shens[1] == '印' and '比' in c.gan_shens, "月干支印格，透比，有冲亡。"),
+    Rule("天干:才", lambda c: c.zhi_shens[2] == '印' and c.gan_shens[3] == '才' and '才' in c.zhi_shen3[3],
+         "坐印，时偏财格：他乡发迹，改弦易宗，妻贤子孝。 母法总则：P55-1 丁丑 丁未 甲子 戊辰"),
+    Rule("天干:财", lambda c: c.zhi_shens[2] == '印' and c.gan_shens[3] == '财' and ('财' in c.zhi_shen3[3] or c.zhis[3] in (c.cai_di, c.cai_lu)),
+         "坐印，时财正格：晚年发达，妻贤子不孝。 母法总则：P55-2 乙酉 丙申 甲子 己巳"),
+    Rule("地支:印", lambda c: c.zhi_shens[3] == '印' and c.zhis[3] in zhengs, "时支专位正印。男忙碌到老。女的子女各居一方。亲情淡薄。"),
+    Rule("天干:印", lambda c: c.gan_shens[3] == '印' and '印' in c.zhi_shen3[3], "时柱正印格，不论男女，老年辛苦。女的到死都要控制家产。子女无缘。"),
+    Rule("", lambda c: c.gan_shen_num['印'] + c.gan_shen_num['枭'] > 1,
+         "印枭在年干月干，性格迂腐，故作清高，女子息迟，婚姻有阻碍。印枭在时干，不利母子，性格不和谐。"),
+    Rule("", lambda c: c.zhis[1] in (c.yin_lu, c.xiao_lu), "印或枭在月支，有压制丈夫的心态。"),
+    Rule("", lambda c: c.zhis[3] in (c.yin_lu, c.xiao_lu), "印或枭在时支，夫灾子寡。"),
+    # 坐印库
+    Rule("", lambda c: zhi_ku(c.zhis[2], (c.yin, c.xiao)) and c.shen2_num['印'] > 2, "母法总则P21-5: 日坐印库，又成印格，意外伤残，凶终。过旺。"),
+    Rule("地支:劫", lambda c: zhi_ku(c.zhis[2], (c.yin, c.xiao)) and c.zhi_shens[3] == '劫', "自坐印库，时阳刃。带比禄印者贫，不带吉。 母法总则P21-14"),
+    Rule("月令:印", lambda c: c.zhi_num['印'] > 1 and c.gan_shens[1] == '印' and c.zhi_shens[1] == '印' and '比' in c.gan_shens,
+         "月干支印，印旺，透比，旺而不久，冲亡。母法总则P21-8"),
+    Rule("天干:才,财", lambda c: c.zhis[1] == c.yin_lu and (('财' in c.gan_shens and '财' in c.zhi_shens) or ('才' in c.gan_shens and '才' in c.zhi_shens)),
+         "母法总则P22-18 自坐正印专旺，成财格，移他乡易宗，妻贤子孝。"),
+    # 偏财分析
+    Rule("天干:才", None, "偏财明现天干，不论是否有根:财富外人可见;实际财力不及外观一半。没钱别人都不相信;协助他人常超过自己的能力"),
+    Rule("天干:才", None, "偏财出天干，如与天月德贵人同一天干者，在年月有声明远扬的父亲，月时有聪慧的红颜知己。喜奉承。"),
+    Rule("天干:才", None, "偏财透天干，四柱没有刑冲，长寿。女子为孝顺女，主要针对年月。时柱表示中年以后有自己的事业，善于理财。"),
+    Rule("天干:才", lambda c: '才' in c.zhi_shens2, "财格基础80:比劫用食伤通关或官杀制；身弱有比劫仍然用食伤通关。如果时柱坐实比劫，晚年破产。"),
+    Rule("天干:才", None, "偏财透天干，讲究原则，不拘小节。喜奉承，善于享受。财格基础80"),
+    Rule("天干:才", lambda c: '比' in c.gan_shens or ('劫' in c.gan_shens and c.gan_shens[3] == '才'),
+         "年月比劫，时干透出偏财。祖业凋零，再白手起家。有刑冲为千金散尽还复来"),
+    Rule("天干:才", lambda c: '杀' in c.gan_shens and '杀' in c.zhi_shens,
+         "偏财和七杀并位，地支又有根，父子外合心不合。因为偏财生杀攻身。偏财七杀在日时，则为有难伺候的女朋友。 基62壬午 甲辰 戊寅 癸亥"),
+    Rule("天干:才", lambda c: c.zhi_shens[0] == '才', "偏财根透年柱，家世良好，且能承受祖业。"),
+    Each("天干:才", None, None, (
+        Rule("", lambda c, seq: '劫' in c.zhi_shen3[seq] and c.zhis[seq] in zhengs,
+             "偏财坐阳刃劫财,可做父缘薄，也可幼年家贫。也可以父先亡，要参考第一大运。偏财坐专位阳刃劫财,父亲去他乡.基61壬午 壬寅 戊子 丁巳"),
+        Rule("", lambda c, seq: get_empty(c.zhus[2], c.zhis[seq]) == '空', "偏财坐空亡，财官难求。"),
+    )),
+    Rule("", lambda c: c.shen2_num['才'] > 2, "偏财多的人慷慨，得失看淡。花钱一般不会后悔。偏乐观，甚至是浮夸。生活习惯颠倒。适应能力强。有团队精神。得女性欢心。小事很少失信。"),
+    Rule("", lambda c: c.shen2_num['才'] > 2, "乐善好施，有团队精神，女命偏财，听父亲的话。时柱偏财女，善于理财，中年以后有事业。"),
+    Rule("地支:才", lambda c: (c.zhi_shens[2] == '才' and len(zhi5[c.zhis[2]]) == 1) or (c.zhi_shens[3] == '才' and len(zhi5[c.zhis[3]]) == 1),
+         "日时地支坐专位偏财。不见刑冲，时干不是比劫，大运也没有比劫刑冲，晚年发达。"),
+    # 财分析
+    Rule("天干:才,财", lambda c: (c.gan_shens[0] in ('财', '才') and c.gan_shens[1] in ('财', '才')) or (c.gan_shens[1] in ('财', '才') and ('财' in c.zhi_shen3[1] or '才' in c.zhi_shen3[1])),
+         "财或偏财月重叠：女职业妇女，有理财办事能力。因自己理财能力而影响婚姻。一财得所，红颜失配。男的双妻。"),
+    Rule("天干:财", lambda c: is_yang(c.me), "男日主合财星，夫妻恩爱。如果争合或天干有劫财，双妻。"),
+    Rule("天干:财", lambda c: '财' in c.zhi_shens, "财格基础80:比劫用食伤通关或官杀制；身弱有比劫仍然用食伤通关。"),
+    Rule("天干:财", lambda c: '官' in c.gan_shens, "正官正财并行透出，(身强)出身书香门第。"),
+    Rule("天干:财", lambda c: '官' in c.gan_shens or '杀' in c.gan_shens, "官或杀与财并行透出，女压夫，财生官杀，老公压力大。"),
+    Rule("天干:财", lambda c: c.gan_shens[0] == '财', "年干正财若为喜，富裕家庭，但不利母亲。"),
+    Rule("天干:财", lambda c: '财' in c.zhi_shens and ('官' in c.gan_shens or '杀' in c.gan_shens), "男财旺透官杀，女厌夫。"),
+    Rule("天干:财", lambda c: c.gan_shen_num['财'] > 1, "天干两正财，财源多，大多做好几种生意，好赶潮流，人云亦云。有时会做自己外行的生意。"),
+    Rule("天干:财", lambda c: c.gan_shen_num['财'] > 1 and '财' not in c.zhi_shens2, "正财多而无根虚而不踏实。重财不富。"),
+    Each("", None, lambda c, seq: c.gan_shens[seq] == '财' or c.zhis[seq] == '财', (
+        Rule("", lambda c, seq: c.zhis[seq] in day_shens['驿马'][c.zhis.day] and seq != 2, "女柱有财+驿马，动力持家。"),
+        Rule("", lambda c, seq: c.zhis[seq] in day_shens['桃花'][c.zhis.day] and seq != 2, "女柱有财+桃花，不吉利。"),
+        Rule("", lambda c, seq: c.zhis[seq] in empties[c.zhus[2]], "财坐空亡，不持久。"),
+        Rule("", lambda c, seq: ten_deities[c.gans[seq]][c.zhis[seq]] in ('绝', '墓'), "男财坐绝或墓，不利婚姻。"),
+    )),
+    Rule("", lambda c: c.shen2_num['财'] > 2, "正财多者，为人端正，有信用，简朴稳重。"),
+    Rule("", lambda c: c.shen2_num['财'] > 2 and '财' in c.zhi_shens2 and c.me not in c.zhi_shens2, "正财多而有根，日主不在生旺库，身弱惧内。"),
+    Rule("月令:财", lambda c: c.female, "女命月支正财，有务实的婚姻观。"),
+    Rule("月令:财", None, "月令正财，无冲刑，有贤内助，但是母亲与妻子不和。生活简朴，多为理财人士。"),
+    Rule("地支:财", lambda c: c.zhi_shens[3] == '财' and len(zhi5[c.zhis[3]]) == 1, "时支正财，一般两个儿子。"),
+    Rule("", lambda c: c.zhus[2] in (('戊', '子'),) or c.zhus[3] in (('戊', '子'),), "日支专位正财，得勤俭老婆。日时专位支正财，又透正官，中年以后发达，独立富贵。"),
+    Rule("", lambda c: c.zhus[2] in (('壬', '午'), ('癸', '巳')), "坐财官印，只要四柱没有刑冲，大吉！"),
+    Rule("", lambda c: c.zhus[2] in (('甲', '戌'), ('乙', '亥')), "女('甲','戌'),('乙','亥'） 晚婚 -- 不准！"),
+    Rule("天干:财 地支:财", lambda c: '财' == c.gan_shens[3] or '财' == c.zhi_shens[3], "未必准确：时柱有正财，口快心直，不喜拖泥带水，刑冲则浮躁。阳刃也不佳.反之有美妻佳子"),
+    Rule("", lambda c: not '财' in c.shens2 and not '才' in c.shens2, "四柱无财，即便逢财运，也是虚名虚利. 男的晚婚"),
+    #if ten_deities[shang].inverse['建'] in zhis:
+    Rule("月令:劫 地支:劫", lambda c: c.zhis.day in (c.cai_lu, c.cai_di) and (c.zhi_shens[1] == '劫' or c.zhi_shens[3] == '劫') and gan_ids[c.me] % 2 == 0,
+         "自坐财禄，月支或时支为阳刃，凶。无冲是非多，冲刑主病灾。 母法总则P22-15  母法总则P36-4 丙寅 戊戌 甲午 丁卯 P56-32 己未 丙寅 丙申 甲午"),
+    Rule("天干:劫", lambda c: c.zhis.day in (c.cai_lu, c.cai_di) and '劫' in c.zhi_shens and gan_ids[c.me] % 2 == 0 and '劫' in c.gan_shens,
+         "自坐财禄，透劫财，有阳刃，刑妻无结局。 母法总则P36-7 戊子 乙卯 甲午 乙亥"),
+    Rule("日主:甲,乙", lambda c: c.zhis.day in (c.cai_lu, c.cai_di) and c.me in ('甲', '乙') and ('戊' in c.gans or '己' in c.gans),
+         "火土代用财，如果透财，多成多败，早年灰心。 母法总则P22-19 辛未 癸巳 甲午 戊辰"),
+    Rule("天干:枭", lambda c: c.zhis.day in (c.cai_lu, c.cai_di) and c.gan_shens[3] == '枭', "财禄时干偏印：主亲属孤独 母法总则P31-158 丁丑 丙午 甲辰 己巳"),
+    Rule("天干:枭", lambda c: c.zhis.day in (c.cai_lu, c.cai_di) and c.gan_shens[3] == '枭' and '枭' in c.zhi_shen3[3],
+         "财禄时干偏印格：财虽吉、人丁孤单、性格艺术化 母法总则P56-20 己巳 丙辰 甲午 壬申"),
+    Rule("", lambda c: c.zhis.day in (c.cai_lu, c.cai_di) and c.zhis[3] == c.yin_lu,
+         "坐财禄，时支印禄：先难后易 母法总则P30-147 甲申 己巳 壬午 己酉 母法总则P55-16"),
+    Rule("天干:财", lambda c: (c.gan_he[3] and c.gan_shens[3] == '财' and jin_jiao(c.zhis[2], c.zhis[3])) or (c.gan_he[2] and c.gan_he[1] and c.gan_shens[1] == '财' and jin_jiao(c.zhis[1], c.zhis[2])),
+         "日主合财且进角合：一生吉祥、平安有裕！ 母法总则P22-22 丁丑 丙午 甲辰 己巳"),
+    Rule("天干:枭", lambda c: (c.zhis.day == c.cai_lu or c.zhi_shens[2] == '财') and c.gan_shens[3] == '枭' and ('枭' in c.zhi_shen3[3] or c.zhis[3] == c.xiao_lu),
+         "日坐财，时偏印格：他乡有成，为人敦厚。母法总则P55-4 甲寅 辛未 甲午 壬申"),
+    Rule("", lambda c: (c.zhis.day == c.cai_lu or c.zhi_shens[2] == '财') and (c.zhi_6chong[2] or c.zhi_xing[2]),
+         "日坐财，有冲或刑：财吉而有疾。母法总则P55-10 丙寅 戊戌 甲午 甲子"),
+    Rule("天干:财", lambda c: c.gan_shens[3] == '财' and zhi_ku(c.zhis[3], (c.me, c.jie)),
+         "正财坐日库于时柱:孤独、难为父母，但事业有成。 母法总则P31-156 丁丑 丙午 甲辰 己巳"),
+    # 自坐财库
+    Rule("", lambda c: c.zhis[2] == c.cai_ku and c.zhis[3] == c.me_ku,
+         "自坐财库,时劫库：有财而孤单。 母法总则P30-136 丁丑 丙午 甲辰 己巳 母法总则P55-11 P61-5 甲子 己巳 壬戌 甲辰"),
+    Rule("", lambda c: c.zhis[2] == c.cai_ku and c.zhis[2] == c.zhis[3],
+         "自坐财库,时坐财库：妻有灾，妻反被妾制服。 母法总则P30-150 辛酉 乙未 壬戌 庚戌 母法总则P56-19"),
+    Rule("天干:杀", lambda c: c.zhis[2] == c.cai_ku and c.gan_shens[3] == '杀' and '杀' in c.zhi_shen3[3],
+         "自坐财库,时杀格，财生杀，凶！母法总则P30-147 甲寅 己巳 壬戌 戊申 有可能是时柱有杀就算。 母法总则P55-15"),
+    # 时坐财库
+    Rule("天干:伤", lambda c: zhi_ku(c.zhis[3], (c.cai, c.piancai)) and '伤' in c.gan_shens and '伤' in c.zhi_shens,
+         "时坐财库,伤官生财:财好，体弱，旺处寿倾倒！母法总则P59-8 戊申 辛酉 戊子 丙辰"),
+    Rule("天干:财", lambda c: c.gan_shens[3] == '财' and '财' in c.zhi_shen3[3],
+         "时上正财格:不必财旺，因妻致富。 母法总则P30-140 丙午 戊戌 壬寅 丁未 母法总则P60-21"),
+    Rule("天干:财", lambda c: c.gan_shens[3] == '财' and '财' in c.zhi_shen3[3] and c.zhis[3] == c.me_ku,
+         "时上正财格坐比劫库，克妻。 母法总则P30-141 丙午 戊戌 壬寅 丁未"),
+    Rule("天干:财", lambda c: c.gan_shens[3] == '财' and '财' in c.zhi_shen3[3] and c.zhis[2] == c.cai_ku,
+         "时上正财格自坐财库，妻佳，中年丧妻，续弦也佳。 母法总则P30-142 庚子 辛巳 壬戌 丁未 P61-7"),
+    Rule("", lambda c: c.zhis[3] in (c.cai_di, c.cai_lu) and c.gan_he[3], "时财禄，天干日时双合，损妻家财。 母法总则P31-157 庚戌 戊寅 癸酉 戊午"),
+    Rule("天干:伤", lambda c: c.zhis[3] in (c.cai_di, c.cai_lu) and '伤' == c.gan_shens[3] and '伤' in c.zhi_shens2,
+         "时支正财时干伤成格：虽富有也刑克。 母法总则P59-1 丁丑 壬寅 丁巳 戊申"),
+    Rule("", lambda c: c.zhis[3] in (c.cai_di, c.cai_lu) and zhi_ku(c.zhis[1], (c.shi, c.shang)) and c.zhis[3] == c.cai_lu,
+         "时支正财禄，月支伤入墓：生财极为辛勤。 母法总则P59-4 甲子 戊辰 庚戌 己卯"),
+    Rule("", lambda c: c.zhis[3] == c.cai_lu and (c.zhi_xing[3] or c.zhi_6chong[3]),
+         "时支正财禄有冲刑：得女伴且文学清贵。 母法总则P60-11 丁丑 辛亥 己巳 乙亥"),
+    Rule("", lambda c: c.zhis[3] == c.cai_lu and (any(c.zhi_xing[:3]) or any(c.zhi_6chong[:3])),
+         "时支正财禄,它支有冲刑：刑妻、孤高、艺术、近贵人。 母法00总则P60-19 乙未 己丑 庚寅 己卯"),
+    Rule("天干:财", lambda c: c.zhis[3] == c.cai_lu and c.gan_shen_num['财'] > 1,
+         "时支正财禄,天干财星多：孤雅、九流、表面风光。 母法总则P60-20 乙酉 乙酉 庚辰 己卯"),
+    # 官分析
+    Rule("天干:官", lambda c: '官' in c.zhi_shens2, "官若成格：忌伤；忌混杂；基础78。有伤用财通关或印制。混杂用合或者身官两停。日主弱则不可扶。"),
+    Rule("天干:官", lambda c: '官' in c.zhi_shens2 and ('比' in c.gan_shens or '劫' in c.gan_shens), "官格透比或劫：故做清高或有洁癖的文人。"),
+    Rule("天干:官", lambda c: '官' in c.zhi_shens2 and '伤' in c.gan_shens, "官格透伤：表里不一。"),
+    Rule("天干:官", lambda c: '官' in c.zhi_shens2 and ('财' in c.gan_shens or '才' in c.gan_shens), "官格透财：聚财。"),
+    Rule("天干:官", lambda c: '官' in c.zhi_shens2 and '印' in c.gan_shens, "官格透印：人品清雅。"),
+    Rule("天干:官", lambda c: '官' in c.zhi_shens2 and not ('印' in c.gan_shens or '财' in c.gan_shens or '才' in c.gan_shens),
+         "官独透成格：敦厚人。"),
+    Rule("天干:官", lambda c: (c.gan_shens[0] == '官' and c.gan_shens[1] == '官') or (c.gan_shens[1] == '官' and '官' in c.zhi_shen3[1]),
+         "官月重叠：女易离婚，早婚不吉利。为人性格温和。"),
+    Rule("天干:官", lambda c: c.gan_shens[3] == '官' and len(zhi5[c.zhis[3]]) == 1, "官专位时坐地支，男有得力子息。"),
+    Rule("天干:官", lambda c: c.gan_shens[0] == '官', "年干为官，身强有可能出身书香门第。"),
+    Rule("天干:官", lambda c: c.gan_shens[0] == '官' and c.gan_shens[3] == '官', "男命年干，时干都为官，对后代和头胎不利。"),
+    Rule("天干:官", lambda c: not '财' in c.gan_shens and not '印' in c.gan_shens, "官独透天干成格，四柱无财或印，为老实人。"),
+    Rule("天干:官", lambda c: '伤' in c.gan_shens, "正官伤官通根透，又无其他格局，失策。尤其是女命，异地分居居多，婚姻不美满。基64:辛未 丁酉 甲戌 辛未 "),
+    Rule("天干:官", lambda c: '杀' in c.gan_shens, "年月干杀和偏官，30以前婚姻不稳定。月时多为体弱多病。"),
+    Rule("天干:官", lambda c: '印' in c.gan_shens and '印' in c.zhi_shens2 and '官' in c.zhi_shens2, "官印同根透，无刑冲合，吉。"),
+    Rule("天干:官", lambda c: '印' in c.gan_shens and '印' in c.zhi_shens2 and '官' in c.zhi_shens2 and '财' in c.gan_shens and '财' in c.zhi_shens2,
+         "财官印同根透，无刑冲合，吉。"),
+    Rule("天干:官", lambda c: c.gan_shens[1] == '官' in ten_deities[c.me][c.zhis[1]] in ('绝', '墓'),
+         "官在月坐墓绝，不是特殊婚姻就是迟婚。如果与天月德同柱，依然不错。丈夫在库中：1，老夫少妻；2，不为外人所知的亲密感情；3，特殊又合法的婚姻。"),
+    Rule("天干:官", lambda c: c.zhi_shens[1] == '官' and c.gan_shens[1] == '官', "月柱正官坐正官，婚变。月柱不宜通。坐禄的。"),
+    Each("天干:官", None, lambda c, seq: c.gan_shens[seq] == '官', (
+        Rule("", lambda c, seq: c.zhi_shens[seq] in ('劫', '比'), "天干正官，地支比肩或劫财，亲友之间不适合合作，但是他适合经营烂摊子。"),
+        Rule("", lambda c, seq: c.zhi_shens[seq] == '杀', "正官坐七杀，男命恐有诉讼之灾。女命婚姻不佳。月柱尤其麻烦，二度有感情纠纷。年不算，时从轻。 基64 壬子 壬子 丁丑 癸卯"),
+        Rule("", lambda c, seq: c.zhi_shens[seq] == '劫' and gan_ids[c.me] % 2 == 0, "官坐羊刃：要杀才能制服阳刃，有力不从心之事情。 辛卯 丁酉 庚午 庚辰 基65"),
+        Rule("", lambda c, seq: c.zhi_shens[seq] == '印', "官坐印，无刑冲合，吉"),
+    )),
+    Rule("天干:官", lambda c: c.shen2_num['官'] > 2 and '官' in c.gan_shens and '官' in c.zhi_shens2, "正官多者，虚名。为人性格温和，比较实在。做七杀看"),
+    Rule("", lambda c: c.zhis.day == c.guan_lu or c.zhi_shens[2] == '官', "日坐正官专位，淑女。 基65 庚申 癸未 丙子 乙未"),
+    Rule("", lambda c: (c.zhis.day == c.guan_lu or c.zhi_shens[2] == '官') and is_yang(c.me) and c.zhis.time == c.me_di,
+         "日坐正官，时支阳刃：先富后败，再东山再起。 子平母法 P55-7"),
+    Rule("天干:官", lambda c: c.gan_shen_num['官'] > 2, "天干2官，女下有弟妹要照顾，一生为情所困。"),
+    Rule("月令:官", lambda c: '伤' in c.zhi_shens2, "月支正官，又成伤官格，难做真正夫妻。有实，无名。 基66辛丑 辛卯 戊子 辛酉"),
+    # 杀分析
+    Rule("天干:杀", None, "七杀是非多。但是对男人有时是贵格。成格基础85可杀生印或食制印、身杀两停、阳刃驾杀。"),
+    Rule("天干:杀", lambda c: '杀' in c.zhi_shens2, "杀格：喜食神制，要食在前，杀在后。阳刃驾杀：杀在前，刃在后。身杀两停：比如甲寅日庚申月。杀印相生，忌食同成格。"),
+    Rule("天干:杀", lambda c: '杀' in c.zhi_shens2 and ('比' in c.gan_shens or '劫' in c.gan_shens), "杀格透比或劫：性急但还有分寸。"),
+    Rule("天干:杀", lambda c: '杀' in c.zhi_shens2 and '杀' in c.gan_shens, "杀格透官：精明琐屑，不怕脏。"),
+    Rule("天干:杀", lambda c: '杀' in c.zhi_shens2 and ('食' in c.gan_shens or '伤' in c.gan_shens), "杀格透食伤：外表宁静，内心刚毅。"),
+    Rule("天干:杀", lambda c: '杀' in c.zhi_shens2 and '印' in c.gan_shens, "杀格透印：圆润、精明干练。"),
+    Rule("天干:杀", lambda c: c.gan_shens[0] == '杀' and c.gan_shens[1] == '杀', "杀月干年干重叠：不是老大，出身平常，多灾，为人不稳重。"),
+    Rule("天干:杀", lambda c: c.gan_shens[1] == '杀' and '杀' in c.zhi_shen3[1], "杀月重叠：女易离婚，其他格一生多病。"),
+    Rule("天干:杀", lambda c: c.gan_shens[0] == '杀', "年干七杀，早年不好。或家里穷或身体不好。"),
+    Rule("天干:杀", lambda c: c.gan_shens[0] == '杀' and c.gan_shens[1] == '杀', "年月天干七杀，家庭复杂。"),
+    Rule("天干:杀", lambda c: '官' in c.gan_shens, "官和杀同见天干不佳。女在年干月干，30以前婚姻不佳，或体弱多病。基65 甲寅 乙亥 戊子 丙辰"),
+    Rule("天干:杀", lambda c: c.gan_shens[1] == '杀' and c.zhi_shens[1] == '杀', "月柱都是七杀，克得太过。有福不会享。六亲福薄。时柱没关系。"),
+    Rule("天干:杀", lambda c: c.gan_shens[1] == '杀' and c.zhi_shens[1] == '杀' and '杀' not in c.zhi_shens2,
+         "七杀年月浮现天干，性格好变，不容易定下来。30岁以前不行。"),
+    Rule("天干:杀", lambda c: '杀' in c.zhi_shens and '劫' in c.zhi_shens, "七杀地支有根时要有阳刃强为佳。杀身两停。"),
+    Rule("天干:杀", lambda c: c.gan_shens[1] == '杀' and c.gan_shens[3] == '杀', "月时天干为七杀：体弱多病"),
+    Rule("天干:杀", lambda c: c.gan_shens[0] == '杀' and c.gan_shens[3] == '杀', "七杀年干时干：男头胎麻烦（概率），女婚姻有阻碍。"),
+    Rule("天干:杀", lambda c: c.gan_shens[3] == '杀', "七杀在时干，固执有毅力。基67"),
+    Rule("天干:杀", lambda c: '印' in c.gan_shens, "身弱杀生印，不少是精明练达的商人。"),
+    Rule("天干:杀", lambda c: '财' in c.gan_shens or '才' in c.gan_shens, "财生杀，如果不是身弱有印，不佳。"),
+    Each("天干:杀", lambda c: '财' in c.gan_shens or '才' in c.gan_shens, None, (
+        Rule("", lambda c, seq: set((ten_deities[c.me].inverse['杀'], ten_deities[c.me].inverse['财'])) in set(zhi5[c.zhis[seq]]),
+             "杀不喜与财同根透出，这样杀的力量太强。"),
+    )),
+    Each("天干:杀 地支:杀", None, lambda c, seq: c.gan_shens[seq] == '杀' or c.zhi_shens[seq] == '杀', (
+        Rule("", lambda c, seq: c.gan_shens[seq] == '杀' and '杀' in c.zhi_shen3[seq] and seq != 3, "七杀坐七杀，六亲福薄。"),
+        Rule("", lambda c, seq: get_empty(c.zhus[2], c.zhis[seq]) == '空', "七杀坐空亡，女命夫缘薄。 基68 壬申 庚戌 甲子 丙寅"),
+        Rule("", lambda c, seq: c.zhis[seq] == '食', "七杀坐食：易有错误判断。"),
+        Rule("", lambda c, seq: c.zhi_xing[seq] or c.zhi_6chong[seq], "七杀坐刑或对冲，夫妻不和。"),
+    )),
+    Rule("", lambda c: c.shen2_num['杀'] > 2, "杀多者如果无制，性格刚强。打抱不平，不易听人劝。女的喜欢佩服的人。"),
+    Rule("地支:杀", lambda c: c.zhi_shens[2] == '杀' and len(zhi5[c.zhis[2]]) == 1,
+         "天元坐杀：乙酉，己卯，如无食神，阳刃，性急，聪明，对人不信任。如果七杀还透出月干无制，体弱多病，甚至夭折。如果在时干，晚年不好。"),
+    Rule("", lambda c: c.zhus[2] in (('丁', '卯'), ('丁', '亥'), ('丁', '未')) and c.zhis.time == '子', "七杀坐桃花，如有刑冲，引感情引祸。忌讳午运。"),
+    Rule("天干:杀", lambda c: c.gan_shen_num['杀'] > 2, "天干2杀，不是老大、性格浮躁不持久。"),
+    Rule("", lambda c: ten_deities[c.shang].inverse['建'] in c.zhis and c.female, "女地支有杀的禄：丈夫条件还可以。对外性格急，对丈夫还算顺从。"),
+    Rule("", lambda c: c.zhis[2] == c.me_jue, '########## 自坐绝'),
+    Rule("", lambda c: c.zhis[2] == c.me_jue and c.zhi_6he[2], "自己坐绝（天元坐杀）：日支与它支合化、双妻，子息迟。母法总则P21-9 P56-30 d第10点暂未编码。"),
+    Rule("", lambda c: c.zhis[2] == c.me_jue, "自己坐绝支，绝支合会，先贫后富。母法总则P57-3 母法总则P23-33"),
+    Rule("", lambda c: c.zhis[2] == c.me_jue and c.zhis[3] == c.zhis[2], "日主日时绝，旺达则有刑灾。母法总则P57-2 母法总则P24-43 戊午 癸亥 乙酉 乙酉"),
+    Rule("", lambda c: c.zhis[2] == c.me_jue and c.zhis[3] == c.zhis[2] == c.zhis[1], "日主月日时绝，旺达则有刑灾，平常人不要紧。母法总则P57-1"),
+    Rule("", lambda c: c.zhis[2] == c.me_jue and c.zhi_shen_num['比'] + c.zhi_shen_num['劫'] > 1,
+         "自坐绝，地支比劫大于1，旺衰巨变，凶：母法总则P22-16。 母法总则P36-5月支或时支都为阳刃，凶。"),
+    Rule("", lambda c: c.zhis[2] == c.me_jue and c.zhis[1] == c.me_jue, "日主月日绝，有格也疾病夭。母法总则P23-35"),
+    Rule("", lambda c: c.zhis[2] == c.me_jue and c.zhis[3] == c.cai_lu, " 母法总则P59-2  自坐绝，月支财禄:身弱财旺有衰困时，克妻子。书上例子不对"),
+    Rule("", lambda c: c.zhis[2] == c.me_jue and c.zhis[3] == c.cai_di, " 母法总则P59-3  自坐绝，月支偏财禄:有困顿时娶背景不佳妻。书上例子不对"),
+    Rule("", lambda c: c.zhis[3] == c.me_jue, '########## 自己时坐绝: 母法总则P57-4: 若成伤官格，难求功名，适合艺术九流。'),
+    Rule("地支:枭", lambda c: c.zhis[3] == c.me_jue and c.zhi_shens[2] == '枭', "母法总则P57-5: 自时支坐绝，自坐枭: 不是生意人，清贫艺术九流人士。"),
+    Rule("", lambda c: c.zhis[3] == c.me_jue and c.zhis[1] in (c.cai_di, c.cai_lu),
+         " 母法总则P57-6  自时支坐绝，月支坐财:先富，晚年大败，刑破。 癸未 庚申 丁巳 庚子"),
+    Rule("", lambda c: c.zhis[3] == c.me_jue and c.zhis[1] in (c.me_lu, c.me_di),
+         " 母法总则P28-114  自时支坐绝，月支帝:刑妻克子。 甲子 癸酉 辛丑 辛卯 -- 阴干也算阳刃？"),
+    Rule("", lambda c: c.zhis[3] == c.me_jue and c.zhis[3] in (c.cai_di, c.cai_lu), " 母法总则P57-8  自时支坐绝，时支财:中年发后无作为。 甲子 癸酉 辛丑 辛卯"),
+    Rule("", lambda c: c.zhis[2] == c.sha_lu and zhi_ku(c.zhis[3], (c.guan, c.sha)),
+         "自坐杀禄，时支为官杀库，一生有疾，生计平常。 母法总则P21-12 母法总则P55-8 甲子 丙寅 乙酉 己丑 P56-31"),
+    Rule("", lambda c: c.zhis[3] == c.sha_lu and (c.zhi_xing[3] or c.zhi_6chong[3]),
+         "时支杀禄带刑冲：纵然吉命也带疾不永寿。 母法总则P60-15 乙未 乙酉 戊申 甲寅"),
+    Rule("天干:杀", lambda c: c.gan_shens[3] == '杀' and c.zhis[3] in (c.cai_di, c.cai_lu),
+         "七杀时柱坐财禄旺：性格严肃。 母法总则P59-7 母法总则P79-3 双妻，子息迟。 "),
+    Rule("", lambda c: c.zhis[3] == c.sha_lu and (c.zhi_6chong[3] or c.zhi_xing[3]),
+         "七杀时禄旺：遇刑冲寿夭带疾。 母法总则P28-118 冲别的柱也算？ 乙未 戊寅 辛丑 甲午 "),
+    Rule("", lambda c: c.zhis[3] == c.sha_lu and c.zhis[1] == c.sha_lu, "七杀时月禄旺：体疾。 母法总则P28-119 甲寅 庚午 辛丑 甲午  母法总则P60-16"),
+    Rule("", lambda c: zhi_ku(c.zhis[2], (c.guan, c.sha)) and set(c.zhis).issubset(set('辰戌丑未')),
+         "自坐七杀入墓：地支都为库，孤独艺术。 母法总则P57-33  丙辰 戊戌 乙丑 庚辰"),
+    Rule("天干:杀", lambda c: c.zhi_shen_num['杀'] > 1, "七杀透干，地支双根，不论贫富，亲属离散。母法总则P79-6 乙未 丙戌 戊寅 甲寅"),
+    Rule("天干:比,劫", lambda c: '杀' in c.jus + c.all_ges and ('比' in c.gan_shens or '劫' in c.gan_shens), "杀格透比或劫：性急但还有分寸。"),
+    Rule("天干:杀", lambda c: '杀' in c.jus + c.all_ges and '杀' in c.gan_shens, "杀格透官：精明琐屑，不怕脏。"),
+    Rule("天干:食,伤", lambda c: '杀' in c.jus + c.all_ges and ('食' in c.gan_shens or '伤' in c.gan_shens), "杀格透食伤：外表宁静，内心刚毅。"),
+    Rule("天干:印", lambda c: '杀' in c.jus + c.all_ges and '印' in c.gan_shens, "杀格透印：圆润、精明干练。"),
+    # 食分析
+    Rule("天干:食", lambda c: '食' in c.zhi_shens2, "食神成格的情况下，寿命比较好。食神和偏财格比较长寿。食神厚道，为人不慷慨。食神有口福。成格基础84，喜财忌偏印(只能偏财制)。"),
+    Rule("天干:食", lambda c: '食' in c.zhi_shens2, "食神无财一生衣食无忧，无大福。有印用比劫通关或财制。"),
+    Rule("天干:食", lambda c: (c.gan_shens[0] == '食' and c.gan_shens[1] == '食') or (c.gan_shens[1] == '食' and '食' in c.zhi_shen3[1]),
+         "食月重叠：生长安定环境，性格仁慈、无冲刑长寿。女早年得子。无冲刑偏印者是佳命。"),
+    Rule("天干:食", lambda c: '枭' in c.gan_shens, "男的食神碰到偏印，身体不好。怕偏印，正印要好一点。四柱透出偏财可解。"),
+    Rule("天干:食", lambda c: '枭' in c.gan_shens and '劫' in c.gan_shens, "食神不宜与劫财、偏印齐出干。体弱多病。基69"),
+    Rule("天干:食", lambda c: '枭' in c.gan_shens and '杀' in c.gan_shens, "食神不宜与杀、偏印齐成格。体弱多病。"),
+    Rule("天干:食", lambda c: '食' in c.zhi_shens, "食神天透地藏，女命阳日主适合社会性职业，阴日主适合上班族。"),
+    Rule("天干:食", lambda c: not '财' in c.gan_shens and not '才' in c.gan_shens, "食神多，要食伤生财才好，无财难发。"),
+    Rule("天干:食", lambda c: '伤' in c.gan_shens, "食伤混杂：食神和伤官同透天干：志大才疏。"),
+    Rule("天干:食", lambda c: '杀' in c.gan_shens, "食神制杀，杀不是主格，施舍后后悔。"),
+    Each("天干:食", None, lambda c, seq: c.gan_shens[seq] == '食', (
+        Rule("", lambda c, seq: c.zhi_shens[seq] == '劫', "食神坐阳刃，辛劳。基69 戊申 戊午 丙子 丙申"),
+    )),
+    Rule("", lambda c: c.shen2_num['食'] > 2, "食神四个及以上的为多，做伤官处理。食神多，要食伤生财才好，无财难发。"),
+    Rule("天干:比,劫", lambda c: c.shen2_num['食'] > 2 and ('劫' in c.gan_shens or '比' in c.gan_shens), "食神带比劫，好施舍，乐于做社会服务。"),
+    Rule("", lambda c: ('杀', '食') in c.shen_zhus or ('食', '杀') in c.shen_zhus,
+         "食神与七杀同一柱，易怒。食神制杀，最好食在前。有一定概率。基69辛未 丁酉 乙未 戊寅"),
+    Rule("", lambda c: ('枭', '食') in c.shen_zhus or ('食', '枭') in c.shen_zhus, "女命最怕食神偏印同一柱。不利后代，时柱尤其重要。基69庚午 己卯 丁未 丁未"),
+    Rule("", lambda c: '食' in c.zhi_shen3[2] and c.zhis[2] in zhengs, "日支食神专位容易发胖，有福。只有2日：癸卯，己酉。男命有有助之妻。"),
+    Rule("地支:食", lambda c: c.zhi_shens[2] == '食' and c.zhi_shens[2] == '杀', "自坐食神，时支杀专，二者不出天干，多成败，最后失局。"),
+    Rule("地支:食", lambda c: c.zhi_shens[2] == '食', "自坐食神，相敬相助，即使透枭也无事，不过心思不定，做事毅力不足，也可能假客气。专位容易发胖，有福。"),
+    Rule("", lambda c: c.zhis[2] == c.shi_lu and c.zhis[3] == c.sha_lu and c.sha not in c.gan_shens,
+         "自坐食，时支专杀不透干：多成败，终局失制。母法总则P56-22 丙子 庚寅 己酉 丁卯"),
+    Rule("", lambda c: '食' in c.zhi_shen3[3] and '枭' in c.zhi_shen3[3] + c.gan_shens[3], "时支食神逢偏印：体弱，慢性病，女的一婚不到头。"),
+    Rule("", lambda c: c.zhis[2] in kus and c.zhi_shen3[2][2] in ('食', '伤'), "自坐食伤库：总觉得钱不够。"),
+    Rule("天干:食 地支:食", lambda c: '食' in (c.gan_shens[0], c.zhi_shens[0]), "年柱食：可三代同堂。"),
+    Rule("", lambda c: zhi_ku(c.zhis[3], (c.shi, c.shang)) and ('食' in c.zhi_shen3[1] or '伤' in c.zhi_shen3[1]), "时食库，月食当令，孤克。"),
+    # 自坐食伤库
+    Rule("", lambda c: zhi_ku(c.zhis[2], (c.shi, c.shang)) and c.zhis[3] == c.guan_lu,
+         "坐食伤库：时支官，发达时接近寿终。 母法总则P60-13 乙丑 丙戌 庚辰 壬午"),
+    # 自坐食伤库
+    Rule("", lambda c: zhi_ku(c.zhis[3], (c.shi, c.shang)) and c.zhis[1] in (c.shi_di, c.shi_lu),
+         "坐食伤库：月支食伤当令，吉命而孤克。 母法总则P60-14 甲戌 丙子 辛卯 壬辰"),
+    # 伤分析
+    Rule("天干:伤", None, "伤官有才华，但是清高。要生财，或者印制。"),
+    Rule("天干:伤", lambda c: '伤' in c.zhi_shens2, "食神重成伤官，不适合伤官配印。金水、土金、木火命造更高。火土要调候，容易火炎土燥。伤官和七杀的局不适合月支为库。"),
+    Rule("天干:伤", lambda c: '伤' in c.zhi_shens2,
+         "伤官成格基础87生财、配印。不考虑调候逆用比顺用好，调候更重要。生正财用偏印，生偏财用正印。\n伤官配印，如果透杀，透财不佳。伤官七杀同时成格，不透财为上好命局。"),
+    Rule("天干:伤", lambda c: (c.gan_shens[0] == '伤' and c.gan_shens[1] == '伤') or (c.gan_shens[1] == '伤' and '伤' in c.zhi_shen3[1]),
+         "父母兄弟均无缘。孤苦，性刚毅好掌权。30岁以前有严重感情苦重，适合老夫少妻，继室先同居后结婚。"),
+    Rule("天干:伤", lambda c: '印' in c.gan_shens and '财' not in c.gan_shens, "伤官配印，无财，有手艺，但是不善于理财。有一定个性"),
+    Rule("天干:伤", lambda c: c.gan_shens[0] == '伤' and c.gan_shens[1] == '伤' and not '伤' in c.zhi_shens2, "年月天干都浮现伤官，亲属少。"),
+    Rule("天干:伤", lambda c: c.zhi_shens[1] == '伤' and len(zhi5[c.zhis[1]]) == 1 and c.gan_shens[1] == '伤',
+         "月柱：伤官坐专位伤官，夫缘不定。假夫妻。比如老板和小蜜。"),
+    Each("天干:伤", None, lambda c, seq: c.gan_shens[seq] == '伤', (
+        Rule("", lambda c, seq: c.zhi_shens[seq] == '劫',
+             "伤官地支坐阳刃，力不从心 基70己酉 丁卯 甲午 辛未。背禄逐马，克官劫财。影响15年。伤官坐劫财：只适合纯粹之精明商人或严谨掌握财之人。"),
+    )),
+    Rule("", lambda c: c.shen2_num['伤'] > 2 and c.female, "女命伤官多，即使不入伤官格，也缘分浅，多有苦情。"),
+    Rule("天干:伤", lambda c: c.shen2_num['伤'] > 2 and c.gan_shen_num['伤'] > 2, "天干2伤官：性骄，六亲不靠。婚前诉说家人，婚后埋怨老公。30岁以前为婚姻危机期。"),
+    Rule("地支:伤", lambda c: c.zhi_shens[2] == '伤' and len(zhi5[c.zhis[2]]) == 1, "女命婚姻宫伤官：强势克夫。男的对妻子不利。只有庚子日。"),
+    Rule("天干:伤", lambda c: c.gan_shens[3] == '伤' and c.me_lu == c.zhis[3],
+         "伤官坐时禄：六亲不靠，无冲刑晚年发，有冲刑不发。 母法P27-96己未 壬申 己亥 庚午, 可以参三命。"),
+    Rule("", lambda c: c.zhis[3] in (c.shang_lu, c.shang_di) and c.zhis[1] in (c.shang_lu, c.shang_di),
+         "月支时支食伤当令：日主无根，泄尽日主，凶。 母法P28-104 甲午 乙亥 庚戌 丙子  母法P60-104"),
+    Rule("", lambda c: ten_deities[c.shang].inverse['建'] in c.zhis and c.female, "女命地支伤官禄：婚姻受不得穷。"),
+)
+
+ge_rules = (
+    # 出身分析
+    # 食神分析
+    Rule("格局:食", None, "\n****食神分析****: 格要日主食神俱生旺，无冲破。有财辅助财有用。  食神可生偏财、克杀"),
+    Rule("格局:食", None, " 阳日食神暗官星，阴日食神暗正印。食神格人聪明、乐观、优雅、多才多艺。食居先，煞居后，功名显达。"),
+    Rule("格局:食", None, "======================================"),
+    Rule("格局:食", None,
+         '''
+    喜:身旺 宜行财乡 逢食看财  忌:身弱 比 倒食(偏印)  一名进神　　二名爵星　　三名寿星
+    月令建禄最佳，时禄次之，更逢贵人运
+    '''),
+    Rule("格局:食", lambda c: c.shi_num > 2, "食神过多:食神重见，变为伤官，令人少子，纵有，或带破拗性. 行印运", end=' '),
+    Rule("格局:食", lambda c: set(('财', '食')) in set(c.gan_shens[:2] + c.zhi_shens[:2]), "祖父荫业丰隆", end=' '),
+    Rule("格局:食", lambda c: set(('财', '食')) in set(c.gan_shens[2:] + c.zhi_shens[2:]), "妻男获福，怕母子俱衰绝，两皆无成", end=' '),
+    Rule("格局:食", lambda c: c.cai_num > 1, "财多则不清，富而已", end=' '),
+    Each("格局:食", None, None, (
+        Rule("", lambda c, seq: c.gan_shens[seq] == '食' and ten_deities[c.gans[seq]][c.zhis[seq]] == '墓', "食入墓，即是伤官入墓，住寿难延。"),
+    )),
+    Each("格局:食", None, None, (
+        Rule("", lambda c, seq: (c.gan_shens[seq] == '食' or c.zhi_shens[seq] == '食') and get_empty(c.zhus[2], c.zhis[seq]),
+             "大忌空亡，更有官煞显露，为太医师巫术数九流之士，若食神逢克，又遇空亡，则不贵，再行死绝或枭运，则因食上气上生灾，翻胃噎食，缺衣食，忍饥寒而已"),
+    )),
+    Rule("格局:食", lambda c: '枭' in c.shens and c.me not in ['庚', '辛', '壬'] and ten_deities[c.me] != '建' and ten_deities[c.me]['合'] not in zhi5[c.zhis.day],
+         "倒食:凡命带倒食，福薄寿夭，若有制合没事，主要为地支为天干的杀;日支或者偏印的坐支为日主的建禄状态。偏印和日支的主要成分天干合"),
+    Rule("格局:食", lambda c: '枭' in c.shens and c.me not in ['庚', '辛', '壬'] and ten_deities[c.me] != '建' and ten_deities[c.me]['合'] not in zhi5[c.zhis.day],
+         "凡命有食遇枭，犹尊长之制我，不得自由，作事进退悔懒，有始无终，财源屡成屡败，容貌欹斜，身品琐小，胆怯心虚，凡事无成，克害六亲，幼时克母，长大伤妻子"),
+    Rule("格局:食", lambda c: '枭' in c.shens and c.me not in ['庚', '辛', '壬'] and ten_deities[c.me] != '建' and ten_deities[c.me]['合'] not in zhi5[c.zhis.day],
+         "身旺遇此方为福"),
+    Rule("格局:食", None, ""),
+    Rule("格局:食", None, "-"*120),
+    # 伤官分析
+    Rule("格局:伤", None, "\n****伤官分析****: 喜:身旺,财星,印绶,伤尽 忌:身弱,无财,刑冲,入墓枭印　"),
+    Rule("格局:伤", None, " 多材艺，傲物气高，心险无忌惮，多谋少遂，弄巧成拙，常以天下之人不如己，而人亦惮之、恶之。 一名剥官神　　二名羊刃煞"),
+    Rule("格局:伤", None, " 身旺用财，身弱用印。用印不忌讳官煞。用印者须去财方能发福"),
+    Rule("格局:伤", None, "官星隐显，伤之不尽，岁运再见官星，官来乘旺，再见刑冲破害，刃煞克身，身弱财旺，必主徒流死亡，五行有救，亦残疾。若四柱无官而遇伤煞重者，运入官乡，岁君又遇，若不目疾，必主灾破。"),
+    Rule("格局:伤", None, "娇贵伤不起、谨慎过头了略显胆小，节俭近于吝啬"),
+    Rule("格局:伤", None, "======================================"),
+    Rule("格局:伤", lambda c: '财' in c.shens or '才' in c.shens, "伤官生财"),
+    Rule("格局:伤", lambda c: '财' not in c.shens and '才' not in c.shens, "伤官无财，主贫穷"),
+    Rule("格局:伤", lambda c: '印' in c.shens or '枭' in c.shens,
+         '印能制伤，所以为贵，反要伤官旺，身稍弱，始为秀气;印旺极深，不必多见，偏正叠出，反为不秀，故伤轻身重而印绶多见，贫穷之格也。'),
+    Rule("格局:伤", lambda c: ('印' in c.shens or '枭' in c.shens) and ('财' in c.shens or '才' in c.shens),
+         '财印相克，本不并用，只要干头两清而不相碍；又必生财者，财太旺而带印，佩印者印太重而带财，调停中和，遂为贵格'),
+    Rule("格局:伤", lambda c: '官' in c.shens, lambda c: shang_guans[ten_deities[c.me]['本']]),
+    Rule("格局:伤", lambda c: '官' in c.shens, '金水独宜，然要财印为辅，不可伤官并透。若冬金用官，而又化伤为财，则尤为极秀极贵。若孤官无辅，或官伤并透，则发福不大矣。'),
+    Rule("格局:伤", lambda c: '杀' in c.shens, "煞因伤而有制，两得其宜，只要无财，便为贵格"),
+    Rule("格局:伤", lambda c: c.gan_shens[0] == '伤', "年干伤官最重，谓之福基受伤，终身不可除去，若月支更有，甚于伤身七煞"),
+    Each("格局:伤", None, None, (
+        Rule("", lambda c, seq: c.gan_shens[seq] == '伤' and ten_deities[c.gans[seq]][c.zhis[seq]] == '墓', "食入墓，即是伤官入墓，住寿难延。"),
+    )),
+    Each("格局:伤", None, None, (
+        Rule("", lambda c, seq: (c.gan_shens[seq] == '食' or c.zhi_shens[seq] == '食') and get_empty(c.zhus[2], c.zhis[seq]),
+             "大忌空亡，更有官煞显露，为太医师巫术数九流之士，若食神逢克，又遇空亡，则不贵，再行死绝或枭运，则因食上气上生灾，翻胃噎食，缺衣食，忍饥寒而已"),
+    )),
+    Rule("格局:伤", None, ""),
+    Rule("格局:伤", None, "-"*120),
+    # 劫财分析
+    Rule("格局:劫", None, "\n****劫财(阳刃)分析****：阳刃冲合岁君,勃然祸至。身弱不作凶。"),
+    Rule("格局:劫", None, "======================================"),
+    Rule("格局:劫", lambda c: '劫' == c.gan_shens[3] or '劫' == c.zhi_shens[3], "劫财阳刃,切忌时逢,岁运并临,灾殃立至,独阳刃以时言,重于年月日也。"),
+    Rule("格局:劫", None, "-"*120),
+    # 财分析
+    Rule("格局:财,才", None, "\n****财分析 **** 喜:旺,印,食,官 忌:比 羊刃 空绝 冲合   财星,天马星,催官星,壮志神"),
+    Rule("格局:财,才", None, "\n=== 月柱财强分析 ==="),
+    Rule("格局:财,才", lambda c: c.gan_shens[1] in ('财', '才') and c.zhi_shens[1] in ('财', '才') and c.gan_shens[1] == '财' and c.zhi_shens[1] == '财',
+         "🔥 月柱财强：正财双显 - 天干地支同为财星，财势强盛"),
+    Rule("格局:财,才", lambda c: c.gan_shens[1] in ('财', '才') and c.zhi_shens[1] in ('财', '才') and (c.gan_shens[1] != '财' or c.zhi_shens[1] != '财') and c.gan_shens[1] == '才' and c.zhi_shens[1] == '才',
+         "🔥 月柱财强：偏财双显 - 天干地支同为财星，财势强盛"),
+    Rule("格局:财,才", lambda c: c.gan_shens[1] in ('财', '才') and c.zhi_shens[1] in ('财', '才') and (c.gan_shens[1] != '财' or c.zhi_shens[1] != '财') and (c.gan_shens[1] != '才' or c.zhi_shens[1] != '才'),
+         "🔥 月柱财强：财星双显 - 天干地支同为财星，财势强盛"),
+    Rule("格局:财,才", lambda c: c.gan_shens[1] in ('财', '才') and c.zhi_shens[1] in ('财', '才'),
+         "   特征：具有强烈的财富意识和赚钱能力，善于理财投资，财运亨通"),
+    Rule("格局:财,才", lambda c: c.gan_shens[1] in ('财', '才') and c.zhi_shens[1] in ('财', '才') and c.favorable_shas,
+         lambda c: '   🌟 吉神助力：{} - 大大增强财运势力'.format(', '.join(c.favorable_shas))),
+    Rule("格局:财,才", lambda c: c.gan_shens[1] in ('财', '才') and c.zhi_shens[1] in ('财', '才') and c.favorable_shas and '天德贵人' in c.favorable_shas,
+         "      • 天德：先天福报深厚，财来自然，贵人相助"),
+    Rule("格局:财,才", lambda c: c.gan_shens[1] in ('财', '才') and c.zhi_shens[1] in ('财', '才') and c.favorable_shas and '太极贵人' in c.favorable_shas,
+         "      • 太极：聪明好学，有钻劲，喜文史哲，财智双全"),
+    Rule("格局:财,才", lambda c: c.gan_shens[1] in ('财', '才') and c.zhi_shens[1] in ('财', '才') and c.favorable_shas and '金匮' in c.favorable_shas,
+         "      • 金匮：主财库丰厚，有聚财能力，善于理财投资"),
+    Rule("格局:财,才", lambda c: c.gan_shens[1] in ('财', '才') and c.zhi_shens[1] in ('财', '才') and c.favorable_shas and '太阴' in c.favorable_shas,
+         "      • 太阴：主女性助力，贵人相助，温和仁慈，财源广进"),
+    Rule("格局:财,才", lambda c: c.gan_shens[1] in ('财', '才') and c.zhi_shens[1] in ('财', '才') and c.favorable_shas and '将星' in c.favorable_shas,
+         "      • 将星：有理想气度，从容不迫，具领导财运能力"),
+    Rule("格局:财,才", lambda c: c.gan_shens[1] in ('财', '才') and c.zhi_shens[1] in ('财', '才') and c.favorable_shas and '禄神' in c.favorable_shas,
+         "      • 禄神：俸禄丰厚，财运稳定，衣食无忧"),
+    Rule("格局:财,才", lambda c: c.gan_shens[1] in ('财', '才') and c.zhi_shens[1] in ('财', '才'), "   💡 发展建议："),
+    Rule("格局:财,才", lambda c: c.gan_shens[1] in ('财', '才') and c.zhi_shens[1] in ('财', '才'), "      • 适合从事金融、投资、贸易等与财相关的行业"),
+    Rule("格局:财,才", lambda c: c.gan_shens[1] in ('财', '才') and c.zhi_shens[1] in ('财', '才'), "      • 善用理财工具，合理配置资产，实现财富增值"),
+    Rule("格局:财,才", lambda c: c.gan_shens[1] in ('财', '才') and c.zhi_shens[1] in ('财', '才'), "      • 可考虑与人合作投资，但要避免过度冒险"),
+    Rule("格局:财,才", lambda c: c.gan_shens[1] in ('财', '才') and c.zhi_shens[1] in ('财', '才'),
+         "      • 财运虽强，仍需注意积累与节制，避免财来财去"),
+    Rule("格局:财,才", lambda c: c.gan_shens[1] not in ('财', '才') or c.zhi_shens[1] not in ('财', '才'),
+         "📝 月柱财强分析：月柱天干地支非同财星，财势中等"),
+    Rule("格局:财,才", lambda c: c.gan_shens[1] not in ('财', '才') or c.zhi_shens[1] not in ('财', '才'), "   建议通过其他柱位或大运流年来提升财运"),
+    Rule("格局:财,才", None, "========================="),
+    Rule("格局:财,才", lambda c: c.gan_shen_num['财'] + c.gan_shen_num['才'] > 1,
+         '财喜根深，不宜太露，然透一位以清用，格所最喜，不为之露。即非月令用神，若寅透乙、卯透甲之类，一亦不为过，太多则露矣。'),
+    Rule("格局:财,才", lambda c: c.gan_shen_num['财'] + c.gan_shen_num['才'] > 1,
+         '财旺生官，露亦不忌，盖露不忌，盖露以防劫，生官则劫退，譬如府库钱粮，有官守护，即使露白，谁敢劫之？'),
+    Rule("格局:财,才", lambda c: '伤' in c.gan_shens, "有伤官，财不能生官"),
+    Rule("格局:财,才", lambda c: '食' in c.shens, "有财用食生者，身强而不露官，略带一位比劫，益觉有情"),
+    Rule("格局:财,才", lambda c: '食' in c.shens and ('印' in c.shens or '枭' in 'shens'), "注意印食冲突"),
+    Rule("格局:财,才", lambda c: '比' in c.shens, "比不吉，但是伤官食神可化!"),
+    Rule("格局:财,才", lambda c: '杀' in c.shens, "不论合煞制煞，运喜食伤身旺之方!"),
+    Rule("格局:财,才", lambda c: '财' == c.zhi_shens[0], "岁带正马：月令有财或伤食，不犯刑冲分夺，旺祖业丰厚。同类月令且带比，或遇运行伤劫 贫"),
+    Rule("格局:财,才", lambda c: '财' == c.zhi_shens[3], "时带正马：无冲刑破劫，主招美妻，得外来财物，生子荣贵，财产丰厚，此非父母之财，乃身外之财，招来产业，宜俭不宜奢。"),
+    Rule("格局:财,才", lambda c: '财' == c.zhi_shens[2] and c.me not in ('壬', '癸'), "天元坐财：喜印食 畏官煞，喜月令旺 "),
+    Rule("格局:财,才", lambda c: '官' not in c.shens and '伤' not in c.shens and '食' not in c.shens, "财旺生官:若月令财无损克，亦主登科"),
+    Rule("格局:财,才", lambda c: c.cai_num > 2 and '劫' not in c.shens and '比' not in c.shens and '比' not in c.shens and '印' not in c.shens,
+         "财　不重叠多见　财多身弱，柱无印助; 若财多身弱，柱无印助不为福。"),
+    Rule("格局:财,才", lambda c: '印' in c.shens, "先财后印，反成其福，先印后财，反成其辱是也?"),
+    Rule("格局:财,才", lambda c: '官' in c.gan_shens, "官星显露，别无伤损，或更食生印助日主健旺，富贵双全"),
+    Rule("格局:财,才", lambda c: '财' in c.gan_shens and '劫' not in c.shens and '比' not in c.shens, "财不宜明露"),
+    Each("格局:财,才", None, None, (
+        Rule("", lambda c, seq: c.gan_shens[seq] == '财' and ten_deities[c.gans[seq]][c.zhis[seq]] == '墓', "财星入墓，必定刑妻"),
+        Rule("", lambda c, seq: c.gan_shens[seq] == '财' and ten_deities[c.gans[seq]][c.zhis[seq]] == '长', "财遇长生，田园万顷"),
+    )),
+    Rule("格局:财,才", lambda c: '官' not in c.shens and ('劫' in c.shens or '比' in c.shens), "切忌有姊妹兄弟分夺，柱无官星，祸患百出。"),
+    Rule("格局:财,才", lambda c: c.bi_num + c.jie_num > 1, "兄弟辈出: 纵入官乡，发福必渺."),
+    Each("格局:财,才", None, None, (
+        Rule("", lambda c, seq: (c.zhi_shens[seq] == '才' or ten_deities[c.me][c.zhis[seq]] == '才') and get_empty(c.zhus[2], c.zhis[seq]),
+             "空亡 官将不成，财将不住"),
+    )),
+    Rule("格局:财,才", None, "-"*120),
+    # 财库分析
+    Rule("", lambda c: ten_deities[ten_deities[c.me].inverse['财']]['库'][-1] in c.zhis, "财临库墓: 一生财帛丰厚，因财致官, 天干透土更佳"),
+    Rule("", lambda c: c.cai_num < 2 and c.strong > 29 and ('劫' in c.shens or '比' in c.shens), "财少身强，柱有比劫，不为福"),
+    # 官分析
+    Rule("格局:官", None, "\n**** 官分析 ****\n 喜:身旺 财印   忌：身弱 偏官 伤官 刑冲 泄气 贪合 入墓"),
+    Rule("格局:官", None, "一曰正官 二曰禄神 最忌刑冲破害、伤官七煞，贪合忘官，劫财比等等，遇到这些情况便成为破格 财印并存要分开"),
+    Rule("格局:官", None, "运：财旺印衰喜印，忌食伤生财；旺印财衰喜财，喜食伤生财；带伤食用印制；"),
+    Rule("格局:官", None, "带煞伤食不碍。劫合煞财运可行，伤食可行，身旺，印绶亦可行；伤官合煞，则伤食与财俱可行，而不宜逢印"),
+    Rule("格局:官", None, "======================================"),
+    Rule("格局:官", lambda c: c.guan_num > 1, "官多变杀，以干为准"),
+    Rule("格局:官", lambda c: '财' in c.shens and '印' in c.shens and '伤' not in c.shens and '杀' not in c.shens,
+         "官星通过天干显露出来，又得到财、印两方面的扶持，四柱中又没有伤煞，行运再引到官乡，是大富大贵的命。"),
+    Rule("格局:官", lambda c: '财' in c.shens or '才' in c.shens, "有财辅助"),
+    Rule("格局:官", lambda c: '印' in c.shens or '枭' in c.shens, "有印辅助　正官带伤食而用印制，运喜官旺印旺之乡，财运切忌。若印绶叠出，财运亦无害矣。"),
+    Rule("格局:官", lambda c: '食' in c.shens, "又曰凡论官星，略见一位食神坐实，便能损局，有杀则无妨。惟月令隐禄，见食却为三奇之贵。因为食神和官相合。"),
+    Rule("格局:官", lambda c: '伤' in c.shens, "伤官需要印或偏印来抑制，　有杀也无妨"),
+    Rule("格局:官", lambda c: '杀' in c.shens, "伤官需要印或偏印来抑制。用劫合煞，则财运可行，伤食可行，身旺，印绶亦可行，只不过复露七煞。若命用伤官合煞，则伤食与财俱可行，而不宜逢印矣。"),
+    Rule("格局:官", lambda c: c.zhi_shens[2] in ('财', '印'), "凡用官，日干自坐财印，终显"),
+    Rule("格局:官", lambda c: c.zhi_shens[2] in ('伤', '杀'), "自坐伤、煞，终有节病"),
+    Rule("格局:官", lambda c: (c.guan, ten_deities[c.guan].inverse['建']) in c.zhus, "天福贵人:主科名巍峨，官职尊崇，多掌丝纶文翰之美!"),
+    Rule("格局:官", lambda c: c.guan in zhi5[c.zhis[2]], "天元作禄: 日主与官星并旺,才是贵命。大多不贵即富,即使是命局中有缺点,行到好的大运时,便能一发如雷。"),
+    Rule("格局:官", lambda c: c.guan in zhi5[c.zhis[2]], lambda c: tianyuans[ten_deities[c.me]['本']]),
+    Rule("格局:官", lambda c: c.gan_shens[0] == '官' or c.zhi_shens[0] == '官',
+         "岁德正官: 必生宦族,或荫袭祖父之职,若月居财官分野,运向财官旺地,日主健旺,贵无疑矣。凡年干遇官,福气最重,发达必早。"),
+    Rule("格局:官", lambda c: c.gan_shens[0] == '官' or c.zhi_shens[0] == '官', "时上正官: 正官有用不须多，多则伤身少则和，日旺再逢生印绶，定须平步擢高科。"),
+    Rule("格局:官", None, ""),
+    Rule("格局:官", None, "-"*120),
+    # 官库分析
+    Rule("", lambda c: ten_deities[ten_deities[c.me].inverse['官']]['库'][-1] in c.zhis, "官临库墓"),
+    Rule("", lambda c: ten_deities[ten_deities[c.me].inverse['官']]['库'][-1] in c.zhis and lu_ku_cai[c.me] in c.zhis,
+         "官印禄库: 有官库，且库中有财"),
+    # 杀(偏官)分析
+    Rule("格局:杀", None, "\n杀(偏官)分析 **** 喜:身旺  印绶  合煞  食制 羊刃  比  逢煞看印及刃  以食为引   忌：身弱  财星  正官  刑冲  入墓"),
+    Rule("格局:杀", None, "一曰偏官 二曰七煞 三曰五鬼 四曰将星 五曰孤极星 原有制伏,煞出为福,原无制伏,煞出为祸   性情如虎，急躁如风,尤其是七杀为丙、丁火时。"),
+    Rule("格局:杀", None, "坐长生、临官、帝旺,更多带比同类相扶,则能化鬼为官,化煞为权,行运引至印乡,必发富贵。倘岁运再遇煞地,祸不旋踵。"),
+    Rule("格局:杀", None, "七杀喜酒色而偏争好斗、爱轩昂而扶弱欺强"),
+    Rule("格局:杀", None, "======================================"),
+    Rule("格局:杀", lambda c: '财' in c.shens, "逢煞看财,如身强煞弱,有财星则吉,身弱煞强,有财引鬼盗气,非贫则夭;"),
+    Rule("格局:杀", lambda c: '比' in c.shens, "如果比比自己弱，可以先挨杀。"),
+    Rule("格局:杀", lambda c: '食' in c.shens, "有食神透制,即《经》云:一见制伏,却为贵本"),
+    Rule("格局:杀", lambda c: '食' in c.shens and ('财' in c.shens or '印' in c.shens or '才' in c.shens or '枭' in c.shens),
+         "煞用食制，不要露财透印，以财能转食生煞，而印能去食护煞也。然而财先食后，财生煞而食以制之，或印先食后，食太旺而印制，则格成大贵。"),
+    Rule("格局:杀", lambda c: '劫' in c.shens, "有阳刃配合,即《经》云:煞无刃不显,逢煞看刃是也。"),
+    Rule("格局:杀", lambda c: '印' in c.shens, "印: 则煞生印，印生身"),
+    Rule("格局:杀", lambda c: c.sha_num > 1, "七煞重逢"),
+    Rule("格局:杀", lambda c: c.sha_num > 1 and c.weak, "弃命从煞，须要会煞从财.四柱无一点比印绶方论，如遇运扶身旺，与煞为敌，从煞不专，故为祸患"),
+    Rule("格局:杀", lambda c: c.sha_num > 1 and c.weak, "阴干从地支，煞纯者多贵，以阴柔能从物也。阳干从地支，煞纯者亦贵，但次于阴，以阳不受制也。"),
+    Rule("格局:杀", lambda c: c.sha_num > 1 and c.weak, "水火金土皆从，惟阳木不能从，死木受斧斤，反遭其伤故也。"),
+    Rule("格局:杀", lambda c: c.sha_num > 1 and c.weak, "古歌曰：五阳坐日全逢煞，弃命相从寿不坚，如是五阴逢此地，身衰煞旺吉堪言。"),
+    Rule("格局:杀", lambda c: '杀' == c.zhi_shens[2], "为人心多性急，阴险怀毒，僭伪谋害，不近人情"),
+    Rule("格局:杀", lambda c: '杀' == c.zhi_shens[3] or '杀' == c.gan_shens[3],
+         " 时杀：月制干强，其煞反为权印。《经》云：时上偏官身要强，阳刃、冲刑煞敢当，制多要行煞旺运，煞多制少必为殃。"),
+    Rule("格局:杀", lambda c: '杀' == c.zhi_shens[3] or '杀' == c.gan_shens[3],
+         " 一位为妙，年、月、日重见，反主辛苦劳碌。若身旺，煞制太过，喜行煞旺运，或三合煞运，如无制伏，要行制伏运方发。但忌身弱，纵得运扶持发福，运过依旧不济。"),
+    Rule("格局:杀", lambda c: '杀' == c.zhi_shens[3] or '杀' == c.gan_shens[3], "《独步》云：时上一位，贵藏在支中，是日，主要旺强名利，方有气。"),
+    Rule("格局:杀", lambda c: '杀' == c.zhi_shens[3] or '杀' == c.gan_shens[3], "《古歌》云：时上偏官喜刃冲，身强制伏禄丰隆。正官若也来相混，身弱财多主困穷。"),
+    Rule("格局:杀", lambda c: '杀' == c.zhi_shens[3] or '杀' == c.gan_shens[3], "时上偏官一位强，日辰自旺喜非常。有财有印多财禄，定是天生作栋梁。"),
+    Rule("格局:杀", lambda c: '杀' == c.zhi_shens[3] or '杀' == c.gan_shens[3], "煞临子位，必招悖逆之儿。"),
+    Rule("格局:杀", lambda c: '杀' == c.zhi_shens[0], " 年上七煞：出身寒微，命有贵子。"),
+    Rule("格局:杀", lambda c: '杀' == c.zhi_shens[0],
+         "岁煞一位不宜制，四柱重见却宜制，日主生旺，制伏略多，喜行煞旺地，制伏太过，或煞旺身衰，官煞混杂，岁运如之，碌碌之辈。若制伏不及，运至身衰煞旺乡，必生祸患。"),
+    Rule("格局:杀", lambda c: '杀' == c.zhi_shens[0], "《独步》云：时上一位，贵藏在支中，是日，主要旺强名利，方有气。"),
+    Rule("格局:杀", lambda c: '杀' == c.zhi_shens[0], "《古歌》云：时上偏官喜刃冲，身强制伏禄丰隆。正官若也来相混，身弱财多主困穷。"),
+    Rule("格局:杀", lambda c: '杀' == c.zhi_shens[0], "时上偏官一位强，日辰自旺喜非常。有财有印多财禄，定是天生作栋梁。"),
+    Rule("格局:杀", lambda c: '官' in c.shens, "官煞混杂：身弱多夭贫"),
+    Each("格局:杀", None, None, (
+        Rule("", lambda c, seq: c.gan_shens[seq] == '杀' and ten_deities[c.gans[seq]][c.zhis[seq]] == '长', "七煞遇长生乙位，女招贵夫。"),
+    )),
+    Rule("格局:杀", None, ""),
+    Rule("格局:杀", None, "-"*120),
+    # 印分析
+    Rule("格局:印", None, "\n印分析 **** 喜:食神 天月德 七煞 逢印看煞 以官为引   忌： 刑冲 伤官 死墓 辰戊印怕木 丑未印不怕木"),
+    Rule("格局:印", None, "一曰正印 二曰魁星 三曰孙极星"),
+    Rule("格局:印", None, "以印绶多者为上,月最要,日时次之,年干虽重,须归禄月、日、时,方可取用,若年露印,月日时无,亦不济事。"),
+    Rule("格局:印", None, "======================================"),
+    Rule("格局:印", lambda c: '官' in c.shens, "官能生印。身旺印强，不愁太过，只要官星清纯"),
+    Rule("格局:印", lambda c: '杀' in c.shens, "喜七煞,但煞不可太多,多则伤身。原无七煞,行运遇之则发;原有七煞,行财运,或印绶死绝,或临墓地,皆凶。"),
+    Rule("格局:印", lambda c: '伤' in c.shens or '食' in c.shens, "伤食：身强印旺，恐其太过，泄身以为秀气；若印浅身轻，而用层层伤食，则寒贫之局矣。"),
+    Rule("格局:印", lambda c: '财' in c.shens or '才' in c.shens,
+         "有印多而用财者，印重身强，透财以抑太过，权而用之，只要根深，无防财破。 若印轻财重，又无劫财以救，则为贪财破印，贫贱之局也。"),
+    Rule("格局:印", lambda c: c.yin_num > 1, "印绶复遇拱禄、专禄、归禄、鼠贵、夹贵、时贵等格,尤为奇特,但主少子或无子,印绶多者清孤。"),
+    Rule("格局:印", lambda c: '劫' in c.shens, "化印为劫；弃之以就财官"),
+    Rule("格局:印", None, ""),
+    Rule("格局:印", None, "-"*120),
+    # 偏印分析
+    Rule("格局:枭", None, "\n印分析 **** 喜:食神 天月德 七煞 逢印看煞 以官为引   忌： 刑冲 伤官 死墓 辰戊印怕木 丑未印不怕木"),
+    Rule("格局:枭", None, "一曰正印 二曰魁星 三曰孙极星"),
+    Rule("格局:枭", None, "以印绶多者为上,月最要,日时次之,年干虽重,须归禄月、日、时,方可取用,若年露印,月日时无,亦不济事。"),
+    Rule("格局:枭", None, "======================================"),
+    Rule("格局:枭", lambda c: '官' in c.shens, "官能生印。身旺印强，不愁太过，只要官星清纯"),
+    Rule("格局:枭", lambda c: '杀' in c.shens, "喜七煞,但煞不可太多,多则伤身。原无七煞,行运遇之则发;原有七煞,行财运,或印绶死绝,或临墓地,皆凶。"),
+    Rule("格局:枭", lambda c: '伤' in c.shens or '食' in c.shens, "伤食：身强印旺，恐其太过，泄身以为秀气；若印浅身轻，而用层层伤食，则寒贫之局矣。"),
+    Rule("格局:枭", lambda c: '财' in c.shens or '才' in c.shens, "弃印就财。"),
+    Rule("格局:枭", lambda c: c.yin_num > 1, "印绶复遇拱禄、专禄、归禄、鼠贵、夹贵、时贵等格,尤为奇特,但主少子或无子,印绶多者清孤。"),
+    Rule("格局:枭", lambda c: '劫' in c.shens, "化印为劫；弃之以就财官"),
+    Rule("格局:枭", None, ""),
+    Rule("格局:枭", None, "-"*120),
+)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+核对断语规则表：一组固定命盘上各规则的输出与 rules_expected.json 中记下的相同。
+
+rules_expected.json 由规则改写成函数之前的规则表（字符串条件，eval 求值）生成：每个命盘一行，
+依次为十神、格局规则表命中规则输出的摘要。改动断语内容后需重新生成：python rules_test.py --write
+
+python rules_test.py 或 python -m pytest -q rules_test.py
+"""
+
+import hashlib
+import json
+import os
+import random
+import sys
+sys.path.append('.')
+
+import bazi
+
+EXPECTED = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'rules_expected.json')
+BOOKS = (bazi.RULE_BOOK, bazi.GE_RULE_BOOK)
+
+
+def _charts():
+    """固定的一组命盘输入：(公历年, 月, 日, 时, 是否为女)。"""
+    rng = random.Random(11)
+    return [(rng.randint(1900, 2030), rng.randint(1, 12), rng.randint(1, 28), rng.randint(0, 23), rng.random() < 0.5)
+            for _ in range(600)]
+
+
+def _digest(fired):
+    """{规则序号: ((断语, end), ...)} 中命中的部分的摘要。"""
+    data = [[order, texts] for order, texts in sorted(fired.items()) if texts]
+    return hashlib.sha1(json.dumps(data, ensure_ascii=False).encode('utf-8')).hexdigest()[:16]
+
+
+def outputs():
+    result = []
+    for year, month, day, hour, female in _charts():
+        chart = bazi.Chart.from_date(year, month, day, hour, gregorian=True, female=female)
+        features = chart.rule_features()
+        result.append([_digest(book.outputs(features)) for book in BOOKS])
+    return result
+
+
+def test_rules_match_expected():
+    with open(EXPECTED, encoding='utf-8') as f:
+        expected = json.load(f)
+    got = outputs()
+    bad = [(inputs, book.name) for inputs, old, new in zip(_charts(), expected, got)
+           for book, a, b in zip(BOOKS, old, new) if a != b]
+    assert len(got) == len(expected) and not bad, bad[:10]
+    print("OK: {} charts".format(len(got)))
+
+
+def test_run_paths_agree():
+    """run、run_many、outputs（含沿用另一命盘的输出）给出同样的断语。"""
+    charts = [bazi.Chart.from_date(year, month, day, hour, gregorian=True, female=female)
+              for year, month, day, hour, female in _charts()[:40]]
+    for book in BOOKS:
+        features = [chart.rule_features() for chart in charts]
+        many = book.run_many(features)
+        for index, item in enumerate(features):
+            single = list(book.run(item))
+            assert single == many[index]
+            assert single == [text for texts in book.outputs(item).values() for text in texts]
+            before = features[index - 1], book.outputs(features[index - 1])
+            assert single == [text for texts in book.outputs(item, before).values() for text in texts]
+
+
+if __name__ == '__main__':
+    if '--write' in sys.argv[1:]:
+        with open(EXPECTED, 'w', encoding='utf-8') as f:
+            f.write('[\n' + ',\n'.join(json.dumps(item) for item in outputs()) + '\n]\n')
+    else:
+        test_rules_match_expected()
+        test_run_paths_agree()
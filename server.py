@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# CreateDate: 2025-10-30
+"""
+排盘常驻进程：python bazi.py serve [--socket PATH]
+
+在 Unix socket 上接受请求，数据表、规则、缓存都留在内存里，每次排盘不必重新启动解释器、导入数据。
+每行一个 JSON 请求，每行一个 JSON 回应，按请求的先后返回；一个连接可连续发多个请求，
+多个连接由各自的线程并发处理。
+
+    请求  {"id": 1, "args": ["1990", "6", "7", "12", "-g"]}     args 与 bazi.py 的命令行参数相同，
+                                                                也可以是一个字符串，按 shell 规则拆分
+    回应  {"id": 1, "output": "..."}                            与 bazi.run(args) 相同的文本；-h、--version
+                                                                为帮助、版本文字
+          {"id": 1, "error": "..."}                             参数有误或排盘出错
+
+--batch、--profile、--stats、--cache-db、--timing 读写服务端的文件或 stderr，在常驻进程中不可用；
+批量时逐行发送即可（见 client）。持久缓存由服务端的环境变量 BAZI_CACHE_DB 设定。
+PATH 默认为环境变量 BAZI_SOCKET 或临时目录下的 bazi.sock。
+"""
+
+import json
+import os
+import shlex
+import signal
+import socket
+import socketserver
+import sys
+
+import bazi
+from client import socket_path
+
+
+def handle_request(line):
+    """一行请求 -> 回应 dict。"""
+    request_id = None
+    try:
+        request = json.loads(line)
+        if not isinstance(request, dict):
+            raise ValueError("request must be a JSON object")
+        request_id = request.get("id")
+        args = request.get("args", [])
+        args = shlex.split(args) if isinstance(args, str) else [str(item) for item in args]
+        options = bazi.parse_options(args, exit=False)
+        # 这些选项读写服务端的文件或 stderr，客户端拿不到结果
+        if options.batch or options.profile or options.stats or options.cache_db or options.timing:
+            raise bazi.UsageError("--batch, --profile, --stats, --cache-db and --timing are not available "
+                                  "from the server")
+        return {"id": request_id, "output": bazi.run_options(options)}
+    except bazi.HelpRequested as e:
+        return {"id": request_id, "output": e.text}
+    except bazi.UsageError as e:
+        return {"id": request_id, "error": str(e)}
+    except Exception as e:
+        return {"id": request_id, "error": "{}: {}".format(type(e).__name__, e)}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            reply = json.dumps(handle_request(line), ensure_ascii=False, separators=(',', ':'))
+            self.wfile.write(reply.encode('utf-8') + b'\n')
+
+
+class Server(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+def _remove_stale(path):
+    """path 上已有 socket 文件时：有进程在监听则报错，否则删除。"""
+    if not os.path.exists(path):
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError:
+        os.unlink(path)
+    else:
+        raise SystemExit("bazi server already listening on {}".format(path))
+    finally:
+        probe.close()
+
+
+def serve(path=None, warm=True):
+    """在 path 上监听，直到收到 SIGTERM 或 Ctrl-C；退出时删除 socket 文件。"""
+    path = socket_path() if path is None else path
+    if warm:
+        # 先排一张盘，导入数据、建好解析器与缓存
+        bazi.run(['1990', '6', '7', '12', '-g'])
+    _remove_stale(path)
+    server = Server(path, _Handler)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        sys.stderr.write("bazi server listening on {}\n".format(path))
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(prog='bazi.py serve', description=u'排盘常驻进程，在 Unix socket 上接受 ndjson 请求')
+    parser.add_argument('--socket', metavar='PATH', default=None,
+                        help=u'socket 文件，默认环境变量 BAZI_SOCKET 或临时目录下的 bazi.sock')
+    parser.add_argument('--no-warm', action='store_true', default=False, help=u'启动时不预先排盘')
+    options = parser.parse_args(argv)
+    serve(options.socket, not options.no_warm)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+核对排盘常驻进程：在临时 socket 上启动 python bazi.py serve，client.request 的输出与
+bazi.run 相同；-h、--version 的文字作为输出返回，参数有误或用了读写服务端文件、stderr 的选项
+（--stats、--cache-db、--timing 等）时返回错误。
+
+大运等部分的先后与集合的遍历顺序有关，常驻进程与对照的 bazi.run 都在 PYTHONHASHSEED=0 的子进程中运行。
+
+python server_test.py 或 python -m pytest -q server_test.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+sys.path.append('.')
+
+import client
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ENV = dict(os.environ, PYTHONHASHSEED='0')
+
+CASES = [
+    ['1990', '6', '7', '12', '-g'],
+    ['1990', '6', '7', '13', '-g', '-n'],
+    ['1990', '6', '7', '13', '-g', '--format', 'ndjson'],
+    ['1985', '3', '2', '5'],
+    ['1990', '2', '4', '10', '-g', '--rectify', '2'],
+    ['2001', '10', '1', '3', '-g', '--hours'],
+    ['戊午', '戊午', '丁亥', '庚戌', '-b', '--start', '1950', '--end', '2000'],
+]
+
+# 在子进程中运行，输出各个 bazi.run(args) 的 JSON 列表
+_REFERENCE = 'import json, sys; import bazi; print(json.dumps([bazi.run(args) for args in json.load(sys.stdin)]))'
+
+
+def _reference(cases):
+    done = subprocess.run([sys.executable, '-c', _REFERENCE], input=json.dumps(cases), cwd=HERE, env=ENV,
+                          stdout=subprocess.PIPE, check=True, universal_newlines=True)
+    return json.loads(done.stdout)
+
+
+def _command(args):
+    done = subprocess.run([sys.executable, 'bazi.py'] + args, cwd=HERE, env=ENV,
+                          stdout=subprocess.PIPE, check=True, universal_newlines=True)
+    return done.stdout
+
+
+def _start(path):
+    proc = subprocess.Popen([sys.executable, 'bazi.py', 'serve', '--socket', path, '--no-warm'],
+                            cwd=HERE, env=ENV, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 60
+    while not os.path.exists(path):
+        assert proc.poll() is None and time.time() < deadline, "server did not start"
+        time.sleep(0.05)
+    return proc
+
+
+def test_server_matches_run():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bazi.sock')
+        proc = _start(path)
+        try:
+            for args, expected in zip(CASES, _reference(CASES)):
+                assert client.request(args, path, timeout=60) == expected, args
+            # 同一个连接上连续请求，换时辰的命盘由 Chart.replace 得到
+            with client.Connection(path, timeout=60) as conn:
+                for args, expected in zip(CASES[:2], _reference(CASES[:2])):
+                    assert conn.request(args) == expected, args
+
+            assert client.request(['--version'], path, timeout=60) == _command(['--version'])
+            assert client.request(['1990', '6', '7', '12', '-h'], path, timeout=60) == _command(['-h'])
+            chart = ['1990', '6', '7', '12', '-g']
+            written = [os.path.join(tmp, 'stats.json'), os.path.join(tmp, 'cache.db')]
+            for args in (['1990', '6'], chart + ['--format', 'xml'], chart + ['--batch', 'x'],
+                         chart + ['--profile', os.path.join(tmp, 'profile')], chart + ['--stats', written[0]],
+                         chart + ['--cache-db', written[1]], chart + ['--timing']):
+                try:
+                    client.request(args, path, timeout=60)
+                except client.ServerError as e:
+                    assert str(e), args
+                else:
+                    raise AssertionError(args)
+            # 客户端给的路径不会在服务端被写入
+            assert not any(os.path.exists(item) for item in written)
+            assert proc.poll() is None
+        finally:
+            proc.terminate()
+            proc.wait()
+        assert not os.path.exists(path)
+    print("OK: server")
+
+
+if __name__ == '__main__':
+    test_server_matches_run()
@@ -3,16 +3,8 @@
 
 # CreateDate: 2019-2-21
 
-# 全局清理：移除內容中形如 1-158 的數字範圍標註
-try:
-    import re as _re
-    _range_re = _re.compile(r"\b\d{1,3}-\d{1,3}\b")
-    if isinstance(globals().get('summarys'), dict):
-        for _k, _v in list(summarys.items()):
-            if isinstance(_v, str):
-                summarys[_k] = _range_re.sub('', _v)
-except Exception:
-    pass
+# 按键懒加载的文本库，见 corpus.LazyCorpus；排盘时不 import 本文件。
+# 形如 1-158 的数字範圍標註由报告输出时的 _clean_text 统一去掉。
 
 summarys = {
     '甲日甲子': '''
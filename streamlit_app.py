@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import contextlib
 import os
 import sys
 import subprocess
@@ -78,8 +79,119 @@ zodiac_12_traits = {
 }
 
 
+def run_script_inprocess(args):
+    """Render a bazi.py report inside the current (warm) interpreter.
+
+    ``bazi.run`` keeps all per-chart state on a ``Chart`` and writes to its own
+    sink, so concurrent sessions need no lock and never touch ``sys.stdout``.
+    Only ``bazi.py`` is supported; other scripts raise ``ValueError``.
+    """
+    if Path(args[0]).name != "bazi.py":
+        raise ValueError(args[0])
+    import bazi
+    return bazi.run(list(args[1:]))
+
+
 def run_script(args):
-    """Run a CLI python script and return combined stdout/stderr as text."""
+    """Run a CLI python script and return combined stdout/stderr as text.
+
+    The script runs in-process by default; set ``BAZI_INPROCESS=0`` to always
+    spawn a subprocess.  Any unexpected in-process failure also falls back to
+    the subprocess path, which reports the traceback or usage as text.  When
+    ``BAZI_SOCKET`` points at a running ``bazi.py serve`` daemon, bazi.py
+    requests go there instead of a fresh interpreter.
+    """
+    if os.environ.get("BAZI_INPROCESS", "1") != "0":
+        try:
+            return run_script_inprocess(args)
+        except (Exception, SystemExit):
+            pass
+    return run_script_external(args)
+
+
+def run_script_external(args):
+    """Run a CLI script outside this interpreter: through the ``bazi.py serve``
+    daemon at ``BAZI_SOCKET`` when one is listening, else in a subprocess."""
+    if os.environ.get("BAZI_SOCKET") and Path(args[0]).name == "bazi.py":
+        try:
+            import client
+            return client.request(list(args[1:]))
+        except Exception:
+            pass
+    return run_script_subprocess(args)
+
+
+def run_bazi(args, spans=None):
+    """Run bazi.py and return ``(text, result)``.
+
+    ``result`` is the structured ``bazi.ChartResult`` (pillars, ten gods,
+    scores, dayun list, shensha) when the chart is computed in-process, and
+    ``None`` when falling back to the subprocess, in which case callers parse
+    the text as before.  In-process text is already sanitized for display
+    (see ``format_output(..., sanitized=True)``).  Pipeline stage timings are
+    recorded into ``spans`` (see ``new_spans``).
+    """
+    if os.environ.get("BAZI_INPROCESS", "1") != "0":
+        try:
+            import bazi
+            return bazi.run_with_result(list(args[1:]), display=True, spans=spans)
+        except (Exception, SystemExit):
+            pass
+    with timing_span(spans, "subprocess"):
+        return run_script_external(args), None
+
+
+def hour_table_markdown(rows):
+    """Markdown comparison table for the rows of ``bazi.py --hours --format json``.
+
+    One row per 時辰 (早子 and 晚子 listed separately): pillars, five-element
+    scores, strength and 格局, so users without a birth time can compare them.
+    """
+    elements = list(rows[0]["scores"]) if rows else []
+    head = [T("时辰"), T("时段"), T("四柱"), *elements, T("强弱"), T("格局")]
+    lines = ["| " + " | ".join(head) + " |", "|" + "---|" * len(head)]
+    for row in rows:
+        strength = "{} {}".format(row["strong"], T("身強") if row["strong"] > 29 else T("身弱"))
+        cells = [T(row["name"]), row["hours"], " ".join(row["pillars"]),
+                 *(str(row["scores"][item]) for item in elements), strength, row["ge"] or "-"]
+        lines.append("| " + " | ".join(cells) + " |")
+    return "\n".join(lines)
+
+
+def rectify_table_markdown(groups):
+    """Markdown table for ``bazi.py --rectify HOURS --format json``.
+
+    One row per time interval: the pillars in force, the interval, the dayun
+    direction and the dayun start date, so a birth near a 节 boundary can be
+    checked against each candidate chart.
+    """
+    head = [T("四柱"), T("出生时间"), T("大运"), T("上运")]
+    lines = ["| " + " | ".join(head) + " |", "|" + "---|" * len(head)]
+    for group in groups:
+        for item in group["intervals"]:
+            first, last = (value[:10] for value in item["yun_start"])
+            cells = [" ".join(group["pillars"]), "{} ~ {}".format(item["start"][:16], item["end"][:16]),
+                     T("顺排") if item["forward"] else T("逆排"), first if first == last else "{} ~ {}".format(first, last)]
+            lines.append("| " + " | ".join(cells) + " |")
+    return "\n".join(lines)
+
+
+def new_spans():
+    """Per-request ``bazi.Spans``; timing is off unless ``BAZI_TIMING`` is set."""
+    try:
+        import bazi
+    except Exception:
+        return None
+    return bazi.Spans()
+
+
+def timing_span(spans, name):
+    """``spans.span(name)``, or a no-op when bazi could not be imported."""
+    return spans.span(name) if spans is not None else contextlib.nullcontext()
+
+
+def run_script_subprocess(args):
+    """Run a CLI python script in a fresh interpreter and return its output."""
     try:
         env = os.environ.copy()
         env["PYTHONIOENCODING"] = "utf-8"
@@ -138,22 +250,27 @@ def collapse_duplicates(text: str) -> str:
     return "\n".join(result)
 
 
-def format_output(text: str) -> str:
+def format_output(text: str, sanitized: bool = False, spans=None) -> str:
     """Centralize output sanitization and normalization for display.
 
     Steps:
-    - strip ANSI sequences
-    - remove known citation tokens
+    - strip ANSI sequences (skipped when ``sanitized``)
+    - remove known citation tokens (skipped when ``sanitized``)
     - remove unwanted output lines (大運、流年 etc)
     - convert to traditional if requested 
     - collapse duplicate adjacent lines
     - normalize repeated blank lines to a single blank line
     - trim leading/trailing whitespace
+
+    The traditional-Chinese conversion is timed as the ``opencc`` stage of
+    ``spans`` when given.
     """
     if not text:
         return ""
-    t = strip_ansi(text)
-    t = sanitize_citations(t)
+    t = text
+    if not sanitized:
+        t = strip_ansi(t)
+        t = sanitize_citations(t)
 
     # Remove unwanted lines like 大運、流年
     # But keep the actual dayun list lines (they contain age numbers and ganzhi)
@@ -180,7 +297,8 @@ def format_output(text: str) -> str:
     t = '\n'.join(filtered_lines)
 
     if use_tr:
-        t = to_tr(t)
+        with timing_span(spans, "opencc"):
+            t = to_tr(t)
     t = collapse_duplicates(t)
     # normalize multiple blank lines to a single blank line
     t = re.sub(r"\n{3,}", "\n\n", t)
@@ -249,6 +367,22 @@ def parse_current_dayun(output: str, birth_year: int, birth_month: int, birth_da
         return ""
 
 
+def current_dayun_from_result(result, birth_year: int, birth_month: int, birth_day: int) -> str:
+    """Pick the current dayun from ``ChartResult.dayuns`` (same rule as parse_current_dayun)."""
+    dayuns = [item for item in result.dayuns if item.age is not None]
+    if not dayuns:
+        return ""
+    today = datetime.now()
+    current_age = today.year - birth_year - ((today.month, today.day) < (birth_month, birth_day))
+    current_dayun = dayuns[0].ganzhi
+    for item in dayuns:
+        if current_age >= item.age:
+            current_dayun = item.ganzhi
+        else:
+            break
+    return current_dayun
+
+
 def add_current_dayun_marker(output: str, current_dayun: str) -> str:
     """Add a marker line above the dayun list showing current dayun.
     
@@ -4288,6 +4422,13 @@ with st.container():
         use_gregorian = st.toggle(T("使用公历输入"), value=True, help=T("勾选表示使用公历日期，否则使用农历"))
         is_leap = st.checkbox(T("闰月 (农历专用)"), value=False, help=T("如果出生月份是闰月，请勾选此项"))
         advanced_bazi = st.checkbox(T("高级: 直接输入八字"), value=False, help=T("如果您已知八字干支，可直接输入"))
+        unknown_hour = st.checkbox(T("不知道出生时辰"), value=False,
+                                   help=T("逐个时辰（早子、晚子分开）排盘，列出四柱、五行分数、强弱、格局对照表"))
+        # 校正要从出生日期和时间算起，直接输入八字或不知道时辰时不可选
+        rectify_time = st.checkbox(T("出生时间校正（交节前后）"), value=False,
+                                   disabled=advanced_bazi or unknown_hour,
+                                   help=T("列出出生时刻前后两小时内可能的各个命盘及对应的时间区间，月柱、大运顺逆可能在交节时刻改变。"
+                                          "需要出生日期和时间，直接输入八字或不知道出生时辰时不可用"))
 
     with col2:
         st.markdown(f"""
@@ -4470,6 +4611,13 @@ with st.container():
                     error_msg += f"\n- 有效的地支：{', '.join(Zhi)}"
                 st.error(error_msg)
                 st.stop()
+
+            # 月干由年干按五虎遁、时干由日干按五鼠遁定出，不合的四柱没有对应的出生时间
+            import pillarindex
+            pillars = [gan + zhi for gan, zhi in zip(gan_inputs, zhi_inputs)]
+            if not pillarindex.valid(*pillars[:3], None if unknown_hour else pillars[3]):
+                st.error(T("四柱不合五虎遁、五鼠遁，没有对应的出生时间：月干应由年干推出，时干应由日干推出。"))
+                st.stop()
             
             # python bazi.py -b year month day time  (each is pair of gan/zhi)
             args = [
@@ -4499,9 +4647,40 @@ with st.container():
             if st.session_state.gender == 'female':
                 args.append("-n")
 
+        if unknown_hour:
+            # 不知道出生时辰：同一天逐个时辰排盘，只列对照表
+            args += ["--hours", "--format", "json"]
+            with st.spinner(T("正在逐个时辰排盘，请稍候...")):
+                raw_output = run_script(args)
+            try:
+                hour_rows = json.loads(raw_output)
+            except ValueError:
+                st.error(T("计算过程中出现错误。"))
+                st.code(raw_output, language="python")
+                st.stop()
+            st.markdown(f'<h4 style="color: #333; margin: 10px 0;">{T("逐个时辰对照")}</h4>', unsafe_allow_html=True)
+            st.markdown(hour_table_markdown(hour_rows))
+            st.stop()
+
+        if rectify_time and not (advanced_bazi or unknown_hour):
+            # 出生时间校正：出生时刻前后两小时内的各个命盘，只列区间表
+            args += ["--rectify", "2", "--format", "json"]
+            with st.spinner(T("正在查找四柱变化的时刻，请稍候...")):
+                raw_output = run_script(args)
+            try:
+                rectify_groups = json.loads(raw_output)
+            except ValueError:
+                st.error(T("计算过程中出现错误。"))
+                st.code(raw_output, language="python")
+                st.stop()
+            st.markdown(f'<h4 style="color: #333; margin: 10px 0;">{T("出生时间校正")}</h4>', unsafe_allow_html=True)
+            st.markdown(rectify_table_markdown(rectify_groups))
+            st.stop()
+
         # 显示加载状态
+        spans = new_spans()
         with st.spinner(T("正在计算八字命盘，请稍候...")):
-            raw_output = run_script(args)
+            raw_output, chart_result = run_bazi(args, spans)
             
             # 检查是否有错误
             if "Traceback" in raw_output or "Error" in raw_output or "TypeError" in raw_output:
@@ -4518,7 +4697,8 @@ with st.container():
                     st.code(raw_output, language="python")
                     st.stop()
             
-            output = format_output(raw_output)
+            with timing_span(spans, "format_output"):
+                output = format_output(raw_output, sanitized=chart_result is not None, spans=spans)
         
         # 高级模式下，如果输出中没有性别信息，手动添加
         if advanced_bazi:
@@ -4531,9 +4711,12 @@ with st.container():
             # 检查并确保高级模式下大运信息正确显示
             # bazi.py 在高级模式下输出格式为："大运： 甲子 乙丑 丙寅 ..."
             # 查找大运信息并格式化显示
-            dayun_match = re.search(r'大[運运][：:]\s*([^\n]+)', raw_output)
-            if dayun_match:
-                dayun_info = dayun_match.group(1).strip()  # 提取大运干支列表
+            if chart_result is not None:
+                dayun_info = ' '.join(item.ganzhi for item in chart_result.dayuns)
+            else:
+                dayun_match = re.search(r'大[運运][：:]\s*([^\n]+)', raw_output)
+                dayun_info = dayun_match.group(1).strip() if dayun_match else ""  # 提取大运干支列表
+            if dayun_info:
                 # 格式化大运信息，使其更明显
                 formatted_dayun = f"\n{'='*120}\n大運：\n{dayun_info}\n{'='*120}\n"
                 
@@ -4569,7 +4752,10 @@ with st.container():
         current_dayun = ""
         if not advanced_bazi:
             try:
-                current_dayun = parse_current_dayun(output, int(year), int(month), int(day))
+                if chart_result is not None:
+                    current_dayun = current_dayun_from_result(chart_result, int(year), int(month), int(day))
+                else:
+                    current_dayun = parse_current_dayun(output, int(year), int(month), int(day))
             except:
                 pass
         
@@ -4578,11 +4764,20 @@ with st.container():
             output = add_current_dayun_marker(output, current_dayun)
         
         # 解析月令和时辰，添加性格分析
-        month_zhi, hour_zhi = parse_month_hour(output)
+        if chart_result is not None:
+            month_zhi, hour_zhi = chart_result.pillars[1][1], chart_result.pillars[3][1]
+        else:
+            month_zhi, hour_zhi = parse_month_hour(output)
         # Debug: 打印解析结果（临时调试用，可以取消注释查看）
         # st.write(f"Debug: 解析结果 - 月令={month_zhi}, 時辰={hour_zhi}")
         if month_zhi and hour_zhi:
             output = add_personality_analysis(output, month_zhi, hour_zhi)
+
+        # 各阶段耗时：每次排盘向 stderr 写一行 JSON，页面上同时显示
+        if spans is not None and spans.enabled:
+            spans.emit(source="streamlit",
+                       pillars=" ".join(chart_result.pillars) if chart_result is not None else "")
+            st.caption("⏱ " + ", ".join(f"{name} {ms:.1f}ms" for name, ms in spans.stages.items()))
         
         # 顯示八字排盤結果
         if output:
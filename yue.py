@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 # CreateDate: 2023-10-28
+# 按键懒加载的文本库，见 corpus.LazyCorpus；排盘时不 import 本文件。
 
 jia_1 = '''
     春月之木，渐有生长之象。初春犹有余寒，当以火温暖，则有舒畅之美，水多变克，有损精神。重见生旺，必用庚金斲凿，可成楝梁。